@@ -26,7 +26,7 @@ from telar.images import (
 )
 from telar.iiif_metadata import (
     detect_iiif_version, extract_language_map_value, strip_html_tags,
-    clean_metadata_value, find_metadata_field, is_legal_boilerplate,
+    clean_metadata_value, build_label_index, find_metadata_field, is_legal_boilerplate,
     extract_credit, extract_manifest_metadata, apply_metadata_fallback
 )
 from telar.glossary import load_glossary_terms, process_glossary_links
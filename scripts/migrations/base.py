@@ -5,8 +5,64 @@ All version-specific migrations should inherit from BaseMigration.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date
+from typing import Callable, Iterable, List, Dict, Optional, Set, Tuple, Union
+import gzip
+import hashlib
+import json
 import os
+import shutil
+import tarfile
+import urllib.error
+import urllib.parse
+import urllib.request
+import yaml
+
+
+# Framework files with these extensions are fetched as raw bytes
+BINARY_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.ico')
+
+# Chunk size for streaming file reads, downloads, and hashing
+CHUNK_SIZE = 64 * 1024
+
+# Maximum concurrent GitHub requests in _fetch_many
+FETCH_WORKERS = 8
+
+# Raw file URL of a path at a branch of the telar repository
+RAW_URL = "https://raw.githubusercontent.com/UCSB-AMPLab/telar/{branch}/{path}"
+
+# On-disk cache of raw fetches, revalidated against GitHub with ETags
+FETCH_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'telar-migrations')
+
+# Git tree listing (path -> blob SHA) for a ref, one request for the whole repo
+TREES_API_URL = "https://api.github.com/repos/UCSB-AMPLab/telar/git/trees/{ref}?recursive=1"
+
+# Whole-repository tarball, used instead of per-file fetches for long file lists
+ARCHIVE_URL = "https://codeload.github.com/UCSB-AMPLab/telar/tar.gz/{ref}"
+ARCHIVE_MIN_FILES = 20
+
+
+def _raw_request(path: str, branch: str, headers: Optional[Dict[str, str]] = None) -> urllib.request.Request:
+    """Build the urlopen request for a file in the telar repository."""
+    url = RAW_URL.format(branch=branch, path=urllib.parse.quote(path))
+    return urllib.request.Request(url, headers=headers or {})
+
+
+class FetchCache:
+    """
+    GitHub fetches shared by the migrations of one upgrade run.
+
+    upgrade.py hands one instance to every migration it runs, so files
+    listed by several versions (e.g. v0.7.0 and v0.8.0) download once.
+    """
+
+    def __init__(self):
+        # (branch, path) -> fetched bytes
+        self.files: Dict[Tuple[str, str], bytes] = {}
+        # ref -> {path: blob SHA}, filled by _remote_blob_shas()
+        self.blob_shas: Dict[str, Dict[str, str]] = {}
 
 
 class BaseMigration(ABC):
@@ -17,15 +73,22 @@ class BaseMigration(ABC):
     to_version: str = ""
     description: str = ""
 
-    def __init__(self, repo_root: str):
+    def __init__(self, repo_root: str, fetch_cache: Optional['FetchCache'] = None):
         """
         Initialize migration with repository root path.
 
         Args:
             repo_root: Absolute path to the Telar repository root
+            fetch_cache: GitHub fetches shared by the migrations of one
+                upgrade run; a private one is created if omitted
         """
         self.repo_root = repo_root
+        self._fetch_cache = fetch_cache if fetch_cache is not None else FetchCache()
         self.changes_made = []
+        # Release date stamped into _config.yml, fixed for the whole run
+        self._today = date.today().strftime("%Y-%m-%d")
+        self._language = None  # Cached by _detect_language()
+        self._created_dirs = set()  # Directories already ensured by _ensure_dir()
 
     @abstractmethod
     def check_applicable(self) -> bool:
@@ -69,13 +132,131 @@ class BaseMigration(ABC):
         except FileNotFoundError:
             return None
 
-    def _write_file(self, rel_path: str, content: str) -> None:
-        """Write file contents relative to repo root."""
+    def _ensure_dir(self, full_path: str) -> None:
+        """Create a directory (and parents) once per migration instance."""
+        if full_path not in self._created_dirs:
+            os.makedirs(full_path, exist_ok=True)
+            # makedirs also made (or found) every ancestor; remember those too
+            path = full_path
+            while path not in self._created_dirs:
+                self._created_dirs.add(path)
+                parent = os.path.dirname(path)
+                if parent == path:
+                    break
+                path = parent
+
+    def _existing_paths(self, rel_paths: Iterable[str]) -> Set[str]:
+        """
+        Return which of several paths (files or directories) exist.
+
+        Each distinct parent directory is listed once with os.scandir, so
+        checking many siblings costs one directory read instead of a stat
+        per path.
+
+        Args:
+            rel_paths: Paths relative to repo root
+
+        Returns:
+            Set of the given relative paths that exist
+        """
+        by_parent = {}
+        for rel_path in rel_paths:
+            parent, name = os.path.split(rel_path)
+            by_parent.setdefault(parent, set()).add(name)
+
+        existing = set()
+        for parent, names in by_parent.items():
+            try:
+                with os.scandir(os.path.join(self.repo_root, parent)) as entries:
+                    existing.update(
+                        os.path.join(parent, entry.name) if parent else entry.name
+                        for entry in entries if entry.name in names
+                    )
+            except (FileNotFoundError, NotADirectoryError):
+                pass
+        return existing
+
+    def _ensure_dirs(self, rel_dirs: Iterable[str]) -> None:
+        """
+        Create several directories relative to repo root in one pass, each once.
+
+        Deepest paths go first, so their ancestors are already recorded by
+        _ensure_dir() and need no makedirs call of their own.
+        """
+        for rel_dir in sorted({d for d in rel_dirs if d}, key=len, reverse=True):
+            self._ensure_dir(os.path.join(self.repo_root, rel_dir))
+
+    def _ensure_parent_dirs(self, rel_paths: Iterable[str]) -> None:
+        """Create the parent directories of several files up front, each once."""
+        self._ensure_dirs(os.path.dirname(p) for p in rel_paths)
+
+    @contextmanager
+    def _atomic_open(self, full_path: str, binary: bool = False):
+        """
+        Open a temporary sibling of full_path for writing, then swap it in.
+
+        The temporary file replaces the destination with os.replace() only
+        once writing completes, so an interrupted migration leaves either
+        the old or the new file, never a truncated one.
+
+        Args:
+            full_path: Absolute destination path
+            binary: Open in 'wb' mode instead of UTF-8 text mode
+        """
+        self._ensure_dir(os.path.dirname(full_path))
+        tmp_path = f"{full_path}.tmp.{os.getpid()}"
+        try:
+            if binary:
+                f = open(tmp_path, 'wb')
+            else:
+                f = open(tmp_path, 'w', encoding='utf-8')
+            with f:
+                yield f
+            # Keep the destination's permissions (e.g. executable scripts)
+            if os.path.exists(full_path):
+                shutil.copymode(full_path, tmp_path)
+            os.replace(tmp_path, full_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _write_file(self, rel_path: str, content: Union[str, bytes]) -> None:
+        """Atomically write file contents (text or raw bytes) relative to repo root."""
         full_path = os.path.join(self.repo_root, rel_path)
-        os.makedirs(os.path.dirname(full_path), exist_ok=True)
-        with open(full_path, 'w', encoding='utf-8') as f:
+        with self._atomic_open(full_path, binary=isinstance(content, bytes)) as f:
             f.write(content)
 
+    def _write_if_changed(self, rel_path: str, content: Union[str, bytes]) -> bool:
+        """
+        Write file contents unless the file already holds exactly these bytes.
+
+        Re-running a migration then leaves unchanged framework files (and
+        their mtimes and git status) alone.
+
+        Returns:
+            True if the file was written, False if it was already up to date
+        """
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        full_path = os.path.join(self.repo_root, rel_path)
+
+        try:
+            # Size check first so differing files are rejected without a read
+            if os.path.getsize(full_path) == len(data):
+                # Compare chunk by chunk, without a second full copy in memory
+                view = memoryview(data)
+                with open(full_path, 'rb') as f:
+                    for offset in range(0, len(data), CHUNK_SIZE):
+                        if f.read(CHUNK_SIZE) != view[offset:offset + CHUNK_SIZE]:
+                            break
+                    else:
+                        return False
+        except OSError:
+            pass  # Missing or unreadable - write it
+
+        self._write_file(rel_path, data)
+        return True
+
     def _move_file(self, src_rel_path: str, dest_rel_path: str) -> bool:
         """
         Move file from src to dest (relative to repo root).
@@ -89,7 +270,7 @@ class BaseMigration(ABC):
         if not os.path.exists(src_full):
             return False
 
-        os.makedirs(os.path.dirname(dest_full), exist_ok=True)
+        self._ensure_dir(os.path.dirname(dest_full))
         os.rename(src_full, dest_full)
         return True
 
@@ -152,14 +333,49 @@ class BaseMigration(ABC):
         Returns:
             True if any entries were added, False if all already present or .gitignore doesn't exist
         """
+        return self._batch_gitignore_updates([(section_comment, entries)])[0]
+
+    def _batch_gitignore_updates(self, sections: List[Tuple[Optional[str], List[str]]]) -> List[bool]:
+        """
+        Ensure several sections of entries exist in .gitignore, in one read and write.
+
+        Sections are applied in order to the same in-memory lines, exactly as
+        successive _ensure_gitignore_entries calls would, but .gitignore is
+        read once and written at most once.
+
+        Args:
+            sections: (section_comment, entries) pairs; section_comment may be None
+
+        Returns:
+            One flag per section: True if that section added any entries
+        """
         gitignore_path = '.gitignore'
         content = self._read_file(gitignore_path)
 
         if not content:
-            return False
+            return [False] * len(sections)
 
         lines = content.split('\n')
-        added_any = False
+        added = [self._add_gitignore_section(lines, entries, section_comment)
+                 for section_comment, entries in sections]
+
+        if any(added):
+            # Ensure file ends with newline
+            new_content = '\n'.join(lines)
+            if not new_content.endswith('\n'):
+                new_content += '\n'
+            self._write_file(gitignore_path, new_content)
+
+        return added
+
+    @staticmethod
+    def _add_gitignore_section(lines: List[str], entries: List[str], section_comment: Optional[str]) -> bool:
+        """
+        Add missing entries (under their section comment) to .gitignore lines in place.
+
+        Returns:
+            True if any entries were added
+        """
         entries_to_add = []
 
         # Check which entries are missing
@@ -191,19 +407,36 @@ class BaseMigration(ABC):
             insert_index = len(lines)
 
         # Add missing entries
-        for entry in entries_to_add:
-            lines.insert(insert_index, entry)
-            insert_index += 1
-            added_any = True
+        lines[insert_index:insert_index] = entries_to_add
+        return True
 
-        if added_any:
-            # Ensure file ends with newline
-            new_content = '\n'.join(lines)
-            if not new_content.endswith('\n'):
-                new_content += '\n'
-            self._write_file(gitignore_path, new_content)
+    def _mutate_config(self, transform: Callable[[str], Optional[str]]) -> bool:
+        """
+        Read _config.yml once, transform it in memory, and write it once.
+
+        Lets a migration chain several text edits (section renames, new
+        blocks, version bump) into a single read/write of the file.
+
+        Args:
+            transform: Called with the current content; returns the new
+                content, or None to leave the file untouched
+
+        Returns:
+            True if the file was written, False if it doesn't exist or
+            transform returned None
+        """
+        config_path = '_config.yml'
+        content = self._read_file(config_path)
 
-        return added_any
+        if not content:
+            return False
+
+        new_content = transform(content)
+        if new_content is None:
+            return False
+
+        self._write_file(config_path, new_content)
+        return True
 
     def _update_config_version(self, new_version: str, new_date: str) -> bool:
         """
@@ -218,12 +451,20 @@ class BaseMigration(ABC):
         Returns:
             True if config was updated, False if file doesn't exist or telar section not found
         """
-        config_path = '_config.yml'
-        content = self._read_file(config_path)
+        return self._mutate_config(
+            lambda content: self._set_config_version(content, new_version, new_date)
+        )
 
-        if not content:
-            return False
+    def _set_config_version(self, content: str, new_version: str, new_date: str) -> Optional[str]:
+        """
+        Set telar.version and telar.release_date in _config.yml content.
 
+        Text-only counterpart of _update_config_version, for use inside
+        _mutate_config transforms.
+
+        Returns:
+            Updated content, or None if the telar section has no version fields
+        """
         lines = content.split('\n')
         modified = False
         in_telar_section = False
@@ -258,10 +499,9 @@ class BaseMigration(ABC):
                     modified = True
 
         if modified:
-            self._write_file(config_path, '\n'.join(lines))
-            return True
+            return '\n'.join(lines)
 
-        return False
+        return None
 
     def _fetch_from_github(self, path: str, branch: str = 'main') -> Optional[str]:
         """
@@ -274,21 +514,295 @@ class BaseMigration(ABC):
         Returns:
             File content as string, or None if fetch fails
         """
-        import urllib.request
-        import urllib.error
+        data = self._fetch_bytes(path, branch)
+        if data is None:
+            return None
+
+        try:
+            return data.decode('utf-8')
+        except UnicodeDecodeError as e:
+            print(f"  ⚠️  Warning: Error fetching {path}: {e}")
+            return None
+
+    def _fetch_bytes(self, path: str, branch: str = 'main') -> Optional[bytes]:
+        """
+        Fetch raw file bytes from GitHub telar repository.
 
-        url = f"https://raw.githubusercontent.com/UCSB-AMPLab/telar/{branch}/{path}"
+        Used directly when the content is only written back to disk, so it
+        is never decoded and re-encoded. Responses are kept on disk under
+        FETCH_CACHE_DIR with their ETag, so a repeated run only revalidates
+        them (a 304 with no body). Within a run, each file is requested at
+        most once.
+
+        Args:
+            path: Path to file relative to repo root (e.g., "_layouts/story.html")
+            branch: Branch to fetch from (default: 'main')
+
+        Returns:
+            File content as bytes, or None if fetch fails
+        """
+        key = (branch, path)
+        if key in self._fetch_cache.files:
+            return self._fetch_cache.files[key]
+
+        body_path, etag_path = self._fetch_cache_paths(path, branch)
+        headers = {'Accept-Encoding': 'gzip'}
+        etag = self._read_cached_etag(body_path, etag_path)
+        if etag:
+            headers['If-None-Match'] = etag
 
         try:
-            with urllib.request.urlopen(url, timeout=10) as response:
-                return response.read().decode('utf-8')
-        except urllib.error.URLError as e:
+            try:
+                with urllib.request.urlopen(_raw_request(path, branch, headers), timeout=10) as response:
+                    data = response.read()
+                    if response.headers.get('Content-Encoding') == 'gzip':
+                        data = gzip.decompress(data)
+                    self._store_cached_fetch(body_path, etag_path, data, response.headers.get('ETag'))
+            except urllib.error.HTTPError as e:
+                # urlopen reports "304 Not Modified" as an error; the cached body is current
+                if e.code != 304:
+                    raise
+                e.close()
+                with open(body_path, 'rb') as f:
+                    data = f.read()
+        except OSError as e:
             print(f"  ⚠️  Warning: Could not fetch {path} from GitHub: {e}")
             return None
         except Exception as e:
             print(f"  ⚠️  Warning: Error fetching {path}: {e}")
             return None
 
+        self._fetch_cache.files[key] = data
+        return data
+
+    @staticmethod
+    def _fetch_cache_paths(path: str, branch: str) -> Tuple[str, str]:
+        """Return the (body, etag) cache file paths for a fetched file."""
+        name = hashlib.sha256(path.encode('utf-8')).hexdigest()
+        base = os.path.join(FETCH_CACHE_DIR, branch, name)
+        return base + '.bin', base + '.etag'
+
+    @staticmethod
+    def _read_cached_etag(body_path: str, etag_path: str) -> Optional[str]:
+        """Return the stored ETag, or None if there is no usable cache entry."""
+        try:
+            if os.path.exists(body_path):
+                with open(etag_path, 'r', encoding='utf-8') as f:
+                    return f.read().strip() or None
+        except OSError:
+            pass
+        return None
+
+    def _store_cached_fetch(self, body_path: str, etag_path: str, data: bytes, etag: Optional[str]) -> None:
+        """
+        Save a fetched body and its ETag to the on-disk cache.
+
+        The old ETag is removed before the body is replaced, so a partial
+        update can never pair a new body with a stale ETag. Failures only
+        cost the cache, never the fetch.
+        """
+        try:
+            if os.path.exists(etag_path):
+                os.remove(etag_path)
+            if not etag:
+                return
+            with self._atomic_open(body_path, binary=True) as f:
+                f.write(data)
+            with self._atomic_open(etag_path) as f:
+                f.write(etag)
+        except OSError:
+            pass
+
+    def _fetch_to_file(self, path: str, branch: str = 'main') -> bool:
+        """
+        Stream a file from GitHub telar repository straight to disk.
+
+        Unlike _fetch_from_github, the response is copied to the destination
+        in fixed-size chunks without decoding, so binary files (images) are
+        written byte-for-byte and never held in memory in full.
+
+        Args:
+            path: Path to file relative to repo root (e.g., "components/images/leviathan.jpg")
+            branch: Branch to fetch from (default: 'main')
+
+        Returns:
+            True if the file was written, False if fetch fails
+        """
+        full_path = os.path.join(self.repo_root, path)
+
+        try:
+            with urllib.request.urlopen(_raw_request(path, branch), timeout=10) as response:
+                with self._atomic_open(full_path, binary=True) as f:
+                    shutil.copyfileobj(response, f, length=CHUNK_SIZE)
+            return True
+        except OSError as e:
+            print(f"  ⚠️  Warning: Could not fetch {path} from GitHub: {e}")
+            return False
+        except Exception as e:
+            print(f"  ⚠️  Warning: Error fetching {path}: {e}")
+            return False
+
+    def _fetch_many(self, paths: Iterable[str], branch: str = 'main',
+                    raw: bool = False) -> Dict[str, Optional[Union[str, bytes]]]:
+        """
+        Fetch several files from GitHub telar repository concurrently.
+
+        Requests are network-bound, so running them on a small thread pool
+        overlaps the round trips instead of paying for each one in turn.
+
+        Args:
+            paths: Paths to files relative to repo root
+            branch: Branch to fetch from (default: 'main')
+            raw: Return bytes (_fetch_bytes) instead of text (_fetch_from_github)
+
+        Returns:
+            Dict mapping each path to its content, or None if its fetch failed
+        """
+        paths = list(paths)
+        if not paths:
+            return {}
+
+        fetch = self._fetch_bytes if raw else self._fetch_from_github
+        with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(paths))) as executor:
+            contents = executor.map(lambda path: fetch(path, branch=branch), paths)
+            return dict(zip(paths, contents))
+
+    def _fetch_repo_archive(self, paths: Iterable[str], ref: str = 'main') -> Dict[str, bytes]:
+        """
+        Fetch several files from a single tarball of the telar repository.
+
+        The archive is read as a stream and only the requested members are
+        kept, so one request replaces a round trip per file.
+
+        Args:
+            paths: Paths to files relative to repo root
+            ref: Branch or tag to fetch (default: 'main')
+
+        Returns:
+            Dict mapping each path found in the archive to its content
+            (empty if the archive could not be fetched)
+        """
+        wanted = set(paths)
+        found = {}
+
+        try:
+            with urllib.request.urlopen(ARCHIVE_URL.format(ref=ref), timeout=30) as response:
+                with tarfile.open(fileobj=response, mode='r|gz') as archive:
+                    for member in archive:
+                        if not member.isfile():
+                            continue
+                        # Members sit under a top-level "telar-<ref>/" directory
+                        rel_path = member.name.split('/', 1)[-1]
+                        if rel_path in wanted:
+                            found[rel_path] = archive.extractfile(member).read()
+                            if len(found) == len(wanted):
+                                break
+        except Exception as e:
+            print(f"  ⚠️  Warning: Could not fetch repository archive from GitHub: {e}")
+            return {}
+
+        return found
+
+    def _remote_blob_shas(self, ref: str = 'main') -> Dict[str, str]:
+        """
+        Git blob SHAs of every file in the telar repository at ref.
+
+        Fetched with one GitHub trees API request per ref and upgrade run.
+
+        Returns:
+            Dict mapping path to blob SHA (empty if the listing is unavailable)
+        """
+        if ref not in self._fetch_cache.blob_shas:
+            shas = {}
+            try:
+                request = urllib.request.Request(
+                    TREES_API_URL.format(ref=ref),
+                    headers={'Accept': 'application/vnd.github+json'},
+                )
+                with urllib.request.urlopen(request, timeout=10) as response:
+                    tree = json.load(response)
+                shas = {
+                    item['path']: item['sha']
+                    for item in tree.get('tree', [])
+                    if item.get('type') == 'blob'
+                }
+            except Exception as e:
+                print(f"  ⚠️  Warning: Could not list repository files from GitHub: {e}")
+            self._fetch_cache.blob_shas[ref] = shas
+        return self._fetch_cache.blob_shas[ref]
+
+    def _git_blob_sha(self, rel_path: str) -> Optional[str]:
+        """
+        Git blob SHA-1 of a local file, streamed in CHUNK_SIZE pieces.
+
+        Returns:
+            Hex SHA, or None if the file doesn't exist
+        """
+        full_path = os.path.join(self.repo_root, rel_path)
+        try:
+            digest = hashlib.sha1(f"blob {os.path.getsize(full_path)}\0".encode('ascii'))
+            with open(full_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                    digest.update(chunk)
+        except OSError:
+            return None
+        return digest.hexdigest()
+
+    def _up_to_date_paths(self, paths: Iterable[str], ref: str = 'main') -> Set[str]:
+        """
+        Paths whose local file already matches the repository at ref.
+
+        Compares the local git blob SHA against the trees listing, so files
+        that are already current need no download at all.
+
+        Returns:
+            Set of paths that can be skipped
+        """
+        remote = self._remote_blob_shas(ref)
+        if not remote:
+            return set()
+        return {
+            path for path in paths
+            if path in remote and self._git_blob_sha(path) == remote[path]
+        }
+
+    def _fetch_framework_files(self, paths: Iterable[str], branch: str = 'main') -> Dict[str, Optional[bytes]]:
+        """
+        Fetch framework files, from the repository archive when the list is long.
+
+        Files already fetched earlier in the run (by any migration) are
+        served from the shared cache and everything fetched here is added to
+        it. Files missing from the archive, or every file if the archive
+        fetch fails, fall back to concurrent per-file fetches.
+
+        Args:
+            paths: Paths to files relative to repo root
+            branch: Branch to fetch from (default: 'main')
+
+        Returns:
+            Dict mapping each path to its content, or None if its fetch failed
+        """
+        contents = {}
+        pending = []
+        for path in paths:
+            cached = self._fetch_cache.files.get((branch, path))
+            if cached is not None:
+                contents[path] = cached
+            else:
+                pending.append(path)
+
+        if len(pending) >= ARCHIVE_MIN_FILES:
+            archived = self._fetch_repo_archive(pending, ref=branch)
+            for path, data in archived.items():
+                self._fetch_cache.files[(branch, path)] = data
+            contents.update(archived)
+
+        missing = [path for path in pending if path not in contents]
+        if missing:
+            contents.update(self._fetch_many(missing, branch=branch, raw=True))
+
+        return contents
+
     def _detect_language(self) -> str:
         """
         Detect site language from _config.yml.
@@ -296,13 +810,21 @@ class BaseMigration(ABC):
         Reads telar.telar_language setting (added in v0.6.0).
         Useful for providing bilingual migration messages and summaries.
 
+        The result is cached, so repeated calls (apply phases, manual steps)
+        parse _config.yml only once per migration instance.
+
         Returns:
             'es' for Spanish, 'en' for English (default)
         """
+        if self._language is None:
+            self._language = self._read_language_setting()
+        return self._language
+
+    def _read_language_setting(self) -> str:
+        """Read and normalize telar.telar_language from _config.yml."""
         config_path = os.path.join(self.repo_root, '_config.yml')
 
         try:
-            import yaml
             with open(config_path, 'r', encoding='utf-8') as f:
                 config = yaml.safe_load(f)
 
@@ -11,6 +11,7 @@ Major changes:
 from typing import List, Dict
 import csv
 import io
+import os
 import yaml
 from .base import BaseMigration
 
@@ -36,7 +37,6 @@ class Migration020to030(BaseMigration):
         changes = []
 
         # 1. Delete old compiled CSS (replaced by SCSS in v0.3.0)
-        import os
         old_css_path = os.path.join(self.repo_root, 'assets/css/telar.css')
         if os.path.exists(old_css_path):
             os.remove(old_css_path)
@@ -274,8 +274,6 @@ google_sheets:
 
         Returns the number of theme files added.
         """
-        import os
-
         # Create themes directory if it doesn't exist
         themes_dir = os.path.join(self.repo_root, '_data/themes')
         if not os.path.exists(themes_dir):
@@ -310,8 +308,6 @@ google_sheets:
 
         Returns list of script names that were updated.
         """
-        import os
-
         # Create scripts directory if it doesn't exist
         scripts_dir = os.path.join(self.repo_root, 'scripts')
         if not os.path.exists(scripts_dir):
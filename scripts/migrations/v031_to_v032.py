@@ -8,6 +8,7 @@ Changes:
 """
 
 from typing import List, Dict
+import os
 from .base import BaseMigration
 
 
@@ -43,7 +44,6 @@ The homepage can now be customized by editing the `index.md` file in the root fo
 
         # 1. Replace index.html with new layout version
         # Delete old index.html if it exists (it's outdated)
-        import os
         old_index_path = os.path.join(self.repo_root, 'index.html')
         if os.path.exists(old_index_path):
             os.remove(old_index_path)
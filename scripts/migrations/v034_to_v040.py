@@ -9,6 +9,7 @@ Changes:
 """
 
 from typing import List, Dict
+import os
 import yaml
 from .base import BaseMigration
 
@@ -178,7 +179,6 @@ class Migration034to040(BaseMigration):
 
     def _ensure_data_directory(self) -> bool:
         """Ensure _data directory exists."""
-        import os
         data_dir = os.path.join(self.repo_root, '_data')
         if not os.path.exists(data_dir):
             os.makedirs(data_dir, exist_ok=True)
@@ -193,7 +193,6 @@ class Migration034to040(BaseMigration):
         changes = []
 
         # Ensure _data/languages directory exists
-        import os
         lang_dir = os.path.join(self.repo_root, '_data', 'languages')
         if not os.path.exists(lang_dir):
             os.makedirs(lang_dir, exist_ok=True)
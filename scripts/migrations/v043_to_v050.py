@@ -79,10 +79,8 @@ class Migration043to050(BaseMigration):
 
         # Phase 8: Update _config.yml version
         print("  Phase 8: Updating version...")
-        from datetime import date
-        today = date.today().strftime("%Y-%m-%d")
-        if self._update_config_version("0.5.0-beta", today):
-            changes.append(f"Updated _config.yml: version 0.5.0-beta ({today})")
+        if self._update_config_version("0.5.0-beta", self._today):
+            changes.append(f"Updated _config.yml: version 0.5.0-beta ({self._today})")
 
         return changes
 
@@ -391,8 +389,8 @@ class Migration043to050(BaseMigration):
                     # Warn but still update for consistency
                     warnings.append(f"⚠️  Path updated but file not found: {new_path}")
 
-                # Replace the path in the match
-                new_match = full_match.replace(old_path, new_path)
+                # Splice the new path in after the prefix (group 1)
+                new_match = match.group(1) + new_path
                 paths_changed += 1
 
                 file_changes.append(f"{old_path} → {new_path}")
@@ -12,11 +12,103 @@ Changes:
 Version: v0.6.0-beta
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
+import csv
 import os
+import re
 import subprocess
 import glob
-from .base import BaseMigration
+from concurrent.futures import ThreadPoolExecutor
+from .base import BaseMigration, BINARY_EXTENSIONS
+
+
+# Core framework files updated from GitHub, with change descriptions
+_FRAMEWORK_FILES: Tuple[Tuple[str, str], ...] = (
+    # Python scripts
+    ('scripts/csv_to_json.py', 'Demo content processing, bilingual CSV support, story_id'),
+    ('scripts/fetch_demo_content.py', 'Demo content bundle fetcher (NEW)'),
+    ('scripts/generate_collections.py', 'Custom pages support, demo glossary'),
+    ('scripts/fetch_google_sheets.py', 'Bilingual tab support, story_id support'),
+    ('scripts/discover_sheet_gids.py', 'Story_id support'),
+    ('scripts/generate_iiif.py', 'Version header update'),
+
+    # Language files - multilingual UI
+    ('_data/languages/en.yml', 'Credit prefix, updated strings'),
+    ('_data/languages/es.yml', 'Spanish translations, credit prefix'),
+
+    # Data files
+    ('_data/navigation.yml', 'Bilingual navigation menu configuration (NEW)'),
+
+    # Layouts
+    ('_layouts/story.html', 'Credit prefix exposure, byline markdown support'),
+    ('_layouts/default.html', 'Multilingual support'),
+    ('_layouts/user-page.html', 'Custom pages layout (NEW)'),
+    ('_layouts/objects-index.html', 'Object ordering bug fix'),
+    ('_layouts/index.html', 'Logo display removed'),
+    ('_layouts/glossary.html', 'Demo badge text fix'),
+
+    # Includes
+    ('_includes/header.html', 'Data-driven navigation, logo CSS'),
+    ('_includes/viewer.html', 'Object credits badge HTML/CSS'),
+
+    # Stylesheets
+    ('assets/css/telar.scss', 'Logo, panel freeze, tab widget, glossary, credits badge'),
+
+    # JavaScript
+    ('assets/js/story.js', 'Panel freeze system, credits badge, viewer scroll isolation'),
+    ('assets/js/telar.js', 'Glossary link handling, click-outside-to-close'),
+
+    # Documentation
+    ('README.md', 'v0.6.0 documentation'),
+    ('CHANGELOG.md', 'v0.6.0 changelog'),
+
+    # Gitignore
+    ('.gitignore', 'Generated files gitignored'),
+
+    # Note: components/texts/pages/about.md is handled by _move_about_page()
+    # Note: .github/workflows/*.yml files CANNOT be auto-updated (security restriction)
+    #       They are included in manual steps instead
+)
+
+# Template content - only added for new sites (no custom stories)
+_TEMPLATE_FILES: Tuple[Tuple[str, str], ...] = (
+    # Glossary entries - English
+    ('components/texts/glossary/story.md', 'Story glossary entry'),
+    ('components/texts/glossary/step.md', 'Step glossary entry'),
+    ('components/texts/glossary/viewer.md', 'Viewer glossary entry'),
+    ('components/texts/glossary/panel.md', 'Panel glossary entry'),
+
+    # Glossary entries - Spanish
+    ('components/texts/glossary/historia.md', 'Historia glossary entry'),
+    ('components/texts/glossary/paso.md', 'Paso glossary entry'),
+    ('components/texts/glossary/visor.md', 'Visor glossary entry'),
+    ('components/texts/glossary/panel-es.md', 'Panel-es glossary entry'),
+
+    # Template tutorial stories - English
+    ('components/texts/stories/your-story/about-coordinates.md', 'Coordinate system explanation'),
+    ('components/texts/stories/your-story/guiding-attention.md', 'Question/Answer/Invitation pattern'),
+    ('components/texts/stories/your-story/building-argument.md', 'Coordinate sequences as argument'),
+    ('components/texts/stories/your-story/visual-rhetoric.md', 'Visual contrast analysis'),
+    ('components/texts/stories/your-story/the-reveal.md', 'Full view synthesis'),
+    ('components/texts/stories/your-story/progressive-disclosure.md', 'Layer 2 panel explanation'),
+    ('components/texts/stories/your-story/ruler-place.md', 'Charles III marginalized position'),
+    ('components/texts/stories/your-story/multiple-images.md', 'IIIF vs self-hosted comparison'),
+    ('components/texts/stories/your-story/whats-next.md', 'Template overview'),
+
+    # Template tutorial stories - Spanish
+    ('components/texts/stories/tu-historia/acerca-de-coordenadas.md', 'Sistema de coordenadas'),
+    ('components/texts/stories/tu-historia/guiar-atencion.md', 'Patrón Pregunta/Respuesta/Invitación'),
+    ('components/texts/stories/tu-historia/construir-argumento.md', 'Secuencias como argumento'),
+    ('components/texts/stories/tu-historia/retorica-visual.md', 'Análisis de contraste visual'),
+    ('components/texts/stories/tu-historia/la-revelacion.md', 'Síntesis de vista completa'),
+    ('components/texts/stories/tu-historia/divulgacion-progresiva.md', 'Explicación de panel capa 2'),
+    ('components/texts/stories/tu-historia/lugar-gobernante.md', 'Posición marginalizada'),
+    ('components/texts/stories/tu-historia/multiples-imagenes.md', 'Comparación IIIF vs autoalojadas'),
+    ('components/texts/stories/tu-historia/que-sigue.md', 'Resumen de plantilla'),
+
+    # Template tutorial image (used in your-story/tu-historia)
+    ('components/images/leviathan.jpg', 'Hobbes Leviathan frontispiece (self-hosted demo)'),
+)
 
 
 class Migration050to060(BaseMigration):
@@ -26,6 +118,8 @@ class Migration050to060(BaseMigration):
     to_version = "0.6.0-beta"
     description = "Gitignore generated files, multilingual UI support, custom pages system"
 
+    _custom_stories: Optional[bool] = None  # Cached by _has_custom_stories()
+
     def check_applicable(self) -> bool:
         """
         Check if migration should run.
@@ -68,10 +162,8 @@ class Migration050to060(BaseMigration):
 
         # Phase 8: Update _config.yml version
         print("  Phase 8: Updating version...")
-        from datetime import date
-        today = date.today().strftime("%Y-%m-%d")
-        if self._update_config_version("0.6.0-beta", today):
-            changes.append(f"Updated _config.yml: version 0.6.0-beta ({today})")
+        if self._update_config_version("0.6.0-beta", self._today):
+            changes.append(f"Updated _config.yml: version 0.6.0-beta ({self._today})")
 
         return changes
 
@@ -258,12 +350,11 @@ class Migration050to060(BaseMigration):
             changes.append("  ℹ️  Demo content disabled (user has only demos or customized them)")
 
         # Step 7: Update Google Sheets comment URL
+        old_docs_url = 'ampl.clair.ucsb.edu/telar-docs/docs/workflows/google-sheets/'
         for i, line in enumerate(lines):
-            if 'ampl.clair.ucsb.edu/telar-docs/docs/workflows/google-sheets/' in line:
-                lines[i] = line.replace(
-                    'ampl.clair.ucsb.edu/telar-docs/docs/workflows/google-sheets/',
-                    'telar.org/docs/workflows/google-sheets/'
-                )
+            pos = line.find(old_docs_url)
+            if pos >= 0:
+                lines[i] = line[:pos] + 'telar.org/docs/workflows/google-sheets/' + line[pos + len(old_docs_url):]
                 changes.append("Updated Google Sheets docs URL to telar.org")
                 break
 
@@ -301,9 +392,18 @@ class Migration050to060(BaseMigration):
         """
         Check if user has any custom (non-demo) stories.
 
+        Cached after the first call; story CSVs are not added or removed
+        by this migration, so the answer holds for the whole run.
+
         Returns:
             bool: True if user has custom story CSVs beyond system/demo files
         """
+        if self._custom_stories is None:
+            self._custom_stories = self._scan_for_custom_stories()
+        return self._custom_stories
+
+    def _scan_for_custom_stories(self) -> bool:
+        """Scan components/structures/ for non-system, non-demo story CSVs."""
         structures_dir = os.path.join(self.repo_root, 'components/structures')
         if not os.path.exists(structures_dir):
             return False
@@ -369,9 +469,6 @@ class Migration050to060(BaseMigration):
         Returns:
             Set of relative file paths that are actively referenced
         """
-        import csv
-        import re
-
         referenced = set()
 
         # System CSV files to exclude from story scanning
@@ -499,8 +596,6 @@ class Migration050to060(BaseMigration):
         Returns:
             List of change descriptions
         """
-        import shutil
-
         changes = []
 
         # Get what's currently in use from CSVs (source of truth)
@@ -659,32 +754,29 @@ class Migration050to060(BaseMigration):
             '!_data/languages/',
         ]
 
-        if self._ensure_gitignore_entries(
-            json_entries,
-            '# Generated JSON files (from components/structures/*.csv by csv_to_json.py)'
-        ):
-            changes.append("Added generated JSON patterns to .gitignore")
-
         # Generated Jekyll collection files
         jekyll_entries = [
             '_jekyll-files/',
         ]
 
-        if self._ensure_gitignore_entries(
-            jekyll_entries,
-            '# Generated Jekyll collection files (from components/texts/ by generate_collections.py)'
-        ):
-            changes.append("Added _jekyll-files/ to .gitignore")
-
         # Demo glossary files
         demo_entries = [
             'components/texts/glossary/_demo_*',
         ]
 
-        if self._ensure_gitignore_entries(
-            demo_entries,
-            '# Demo glossary files (created by csv_to_json.py from demo bundle)'
-        ):
+        # Read and write .gitignore once for all three sections
+        added_json, added_jekyll, added_demo = self._batch_gitignore_updates([
+            ('# Generated JSON files (from components/structures/*.csv by csv_to_json.py)', json_entries),
+            ('# Generated Jekyll collection files (from components/texts/ by generate_collections.py)',
+             jekyll_entries),
+            ('# Demo glossary files (created by csv_to_json.py from demo bundle)', demo_entries),
+        ])
+
+        if added_json:
+            changes.append("Added generated JSON patterns to .gitignore")
+        if added_jekyll:
+            changes.append("Added _jekyll-files/ to .gitignore")
+        if added_demo:
             changes.append("Added demo glossary pattern to .gitignore")
 
         if not changes:
@@ -720,17 +812,10 @@ class Migration050to060(BaseMigration):
             if rel_path not in ['_data/objects.json', '_data/project.json', '_data/demo-glossary.json']:
                 json_files.append(rel_path)
 
-        for file_path in json_files:
-            full_path = os.path.join(self.repo_root, file_path)
-            if os.path.exists(full_path):
-                result = subprocess.run(
-                    ['git', 'rm', '--cached', file_path],
-                    cwd=self.repo_root,
-                    capture_output=True,
-                    text=True
-                )
-                if result.returncode == 0:
-                    removed_count += 1
+        removed_count += self._git_rm_cached([
+            file_path for file_path in json_files
+            if os.path.exists(os.path.join(self.repo_root, file_path))
+        ])
 
         # Remove _jekyll-files/ directory from tracking
         jekyll_dir = os.path.join(self.repo_root, '_jekyll-files')
@@ -746,18 +831,16 @@ class Migration050to060(BaseMigration):
                 changes.append("Removed _jekyll-files/ from git tracking")
 
         # Remove demo glossary files from tracking
-        demo_pattern = os.path.join(self.repo_root, 'components/texts/glossary/_demo_*.md')
-        demo_files = glob.glob(demo_pattern)
-        for demo_file in demo_files:
-            rel_path = os.path.relpath(demo_file, self.repo_root)
-            result = subprocess.run(
-                ['git', 'rm', '--cached', rel_path],
-                cwd=self.repo_root,
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                removed_count += 1
+        glossary_dir = os.path.join(self.repo_root, 'components/texts/glossary')
+        try:
+            with os.scandir(glossary_dir) as entries:
+                demo_files = [
+                    f'components/texts/glossary/{entry.name}' for entry in entries
+                    if entry.name.startswith('_demo_') and entry.name.endswith('.md')
+                ]
+        except FileNotFoundError:
+            demo_files = []
+        removed_count += self._git_rm_cached(demo_files)
 
         if removed_count > 0:
             changes.append(f"Removed {removed_count} generated file(s) from git tracking")
@@ -766,6 +849,33 @@ class Migration050to060(BaseMigration):
 
         return changes
 
+    def _git_rm_cached(self, rel_paths: List[str]) -> int:
+        """
+        Untrack files from the git index with a single git invocation.
+
+        Uses --ignore-unmatch so untracked paths don't abort the batch.
+
+        Args:
+            rel_paths: Paths relative to repo root
+
+        Returns:
+            Number of files actually removed from the index
+        """
+        if not rel_paths:
+            return 0
+
+        result = subprocess.run(
+            ['git', 'rm', '--cached', '--ignore-unmatch', '--'] + rel_paths,
+            cwd=self.repo_root,
+            capture_output=True,
+            text=True
+        )
+        if result.returncode != 0:
+            return 0
+
+        # git prints one "rm '<path>'" line per file it untracked
+        return sum(1 for line in result.stdout.splitlines() if line.startswith("rm '"))
+
     def _update_framework_files(self) -> List[str]:
         """
         Update core framework files from GitHub.
@@ -778,102 +888,45 @@ class Migration050to060(BaseMigration):
         """
         changes = []
 
-        framework_files = {
-            # Python scripts
-            'scripts/csv_to_json.py': 'Demo content processing, bilingual CSV support, story_id',
-            'scripts/fetch_demo_content.py': 'Demo content bundle fetcher (NEW)',
-            'scripts/generate_collections.py': 'Custom pages support, demo glossary',
-            'scripts/fetch_google_sheets.py': 'Bilingual tab support, story_id support',
-            'scripts/discover_sheet_gids.py': 'Story_id support',
-            'scripts/generate_iiif.py': 'Version header update',
-
-            # Language files - multilingual UI
-            '_data/languages/en.yml': 'Credit prefix, updated strings',
-            '_data/languages/es.yml': 'Spanish translations, credit prefix',
-
-            # Data files
-            '_data/navigation.yml': 'Bilingual navigation menu configuration (NEW)',
-
-            # Layouts
-            '_layouts/story.html': 'Credit prefix exposure, byline markdown support',
-            '_layouts/default.html': 'Multilingual support',
-            '_layouts/user-page.html': 'Custom pages layout (NEW)',
-            '_layouts/objects-index.html': 'Object ordering bug fix',
-            '_layouts/index.html': 'Logo display removed',
-            '_layouts/glossary.html': 'Demo badge text fix',
-
-            # Includes
-            '_includes/header.html': 'Data-driven navigation, logo CSS',
-            '_includes/viewer.html': 'Object credits badge HTML/CSS',
-
-            # Stylesheets
-            'assets/css/telar.scss': 'Logo, panel freeze, tab widget, glossary, credits badge',
-
-            # JavaScript
-            'assets/js/story.js': 'Panel freeze system, credits badge, viewer scroll isolation',
-            'assets/js/telar.js': 'Glossary link handling, click-outside-to-close',
-
-            # Documentation
-            'README.md': 'v0.6.0 documentation',
-            'CHANGELOG.md': 'v0.6.0 changelog',
-
-            # Gitignore
-            '.gitignore': 'Generated files gitignored',
-
-            # Note: components/texts/pages/about.md is handled by _move_about_page()
-            # Note: .github/workflows/*.yml files CANNOT be auto-updated (security restriction)
-            #       They are included in manual steps instead
-        }
+        framework_files = list(_FRAMEWORK_FILES)
 
         # Template files - only add for new sites (no custom stories)
         if not self._has_custom_stories():
-            template_files = {
-                # Glossary entries - English
-                'components/texts/glossary/story.md': 'Story glossary entry',
-                'components/texts/glossary/step.md': 'Step glossary entry',
-                'components/texts/glossary/viewer.md': 'Viewer glossary entry',
-                'components/texts/glossary/panel.md': 'Panel glossary entry',
-
-                # Glossary entries - Spanish
-                'components/texts/glossary/historia.md': 'Historia glossary entry',
-                'components/texts/glossary/paso.md': 'Paso glossary entry',
-                'components/texts/glossary/visor.md': 'Visor glossary entry',
-                'components/texts/glossary/panel-es.md': 'Panel-es glossary entry',
-
-                # Template tutorial stories - English
-                'components/texts/stories/your-story/about-coordinates.md': 'Coordinate system explanation',
-                'components/texts/stories/your-story/guiding-attention.md': 'Question/Answer/Invitation pattern',
-                'components/texts/stories/your-story/building-argument.md': 'Coordinate sequences as argument',
-                'components/texts/stories/your-story/visual-rhetoric.md': 'Visual contrast analysis',
-                'components/texts/stories/your-story/the-reveal.md': 'Full view synthesis',
-                'components/texts/stories/your-story/progressive-disclosure.md': 'Layer 2 panel explanation',
-                'components/texts/stories/your-story/ruler-place.md': 'Charles III marginalized position',
-                'components/texts/stories/your-story/multiple-images.md': 'IIIF vs self-hosted comparison',
-                'components/texts/stories/your-story/whats-next.md': 'Template overview',
-
-                # Template tutorial stories - Spanish
-                'components/texts/stories/tu-historia/acerca-de-coordenadas.md': 'Sistema de coordenadas',
-                'components/texts/stories/tu-historia/guiar-atencion.md': 'Patrón Pregunta/Respuesta/Invitación',
-                'components/texts/stories/tu-historia/construir-argumento.md': 'Secuencias como argumento',
-                'components/texts/stories/tu-historia/retorica-visual.md': 'Análisis de contraste visual',
-                'components/texts/stories/tu-historia/la-revelacion.md': 'Síntesis de vista completa',
-                'components/texts/stories/tu-historia/divulgacion-progresiva.md': 'Explicación de panel capa 2',
-                'components/texts/stories/tu-historia/lugar-gobernante.md': 'Posición marginalizada',
-                'components/texts/stories/tu-historia/multiples-imagenes.md': 'Comparación IIIF vs autoalojadas',
-                'components/texts/stories/tu-historia/que-sigue.md': 'Resumen de plantilla',
-
-                # Template tutorial image (used in your-story/tu-historia)
-                'components/images/leviathan.jpg': 'Hobbes Leviathan frontispiece (self-hosted demo)',
+            framework_files.extend(_TEMPLATE_FILES)
+
+        # Binary assets are streamed to disk (decoding them as UTF-8 would fail).
+        # They are the largest downloads, so start them in the background and
+        # let the small text files go first rather than queue behind them.
+        binary_files = {
+            path: desc for path, desc in framework_files
+            if path.endswith(BINARY_EXTENSIONS)
+        }
+        text_files = {
+            path: desc for path, desc in framework_files
+            if path not in binary_files
+        }
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            binary_fetches = {
+                path: executor.submit(self._fetch_to_file, path)
+                for path in binary_files
             }
-            framework_files.update(template_files)
 
-        for file_path, description in framework_files.items():
-            content = self._fetch_from_github(file_path)
-            if content:
-                self._write_file(file_path, content)
-                changes.append(f"Updated {file_path}: {description}")
-            else:
-                changes.append(f"⚠️  Warning: Could not fetch {file_path} from GitHub")
+            for file_path, description in text_files.items():
+                content = self._fetch_from_github(file_path)
+                if content:
+                    if self._write_if_changed(file_path, content):
+                        changes.append(f"Updated {file_path}: {description}")
+                    else:
+                        changes.append(f"Unchanged: {file_path}")
+                else:
+                    changes.append(f"⚠️  Warning: Could not fetch {file_path} from GitHub")
+
+            for file_path, future in binary_fetches.items():
+                if future.result():
+                    changes.append(f"Updated {file_path}: {binary_files[file_path]}")
+                else:
+                    changes.append(f"⚠️  Warning: Could not fetch {file_path} from GitHub")
 
         return changes
 
@@ -888,49 +941,55 @@ class Migration050to060(BaseMigration):
         """
         lang = self._detect_language()
 
-        if lang == 'es':
-            return self._get_manual_steps_es()
-        else:
-            return self._get_manual_steps_en()
+        return _MANUAL_STEPS.get(lang, _manual_steps_en)()
+
 
-    def _get_manual_steps_en(self) -> List[Dict[str, str]]:
-        """English manual steps for v0.6.0 migration."""
-        return [
-            {
-                'description': '''**If you use GitHub Pages:**
+def _manual_steps_en() -> List[Dict[str, str]]:
+    """English manual steps for v0.6.0 migration."""
+    return [
+        {
+            'description': '''**If you use GitHub Pages:**
 
 No further actions needed. GitHub Actions will automatically rebuild your site with the upgraded framework.''',
-            },
-            {
-                'description': '''**If you work with your site locally:**
+        },
+        {
+            'description': '''**If you work with your site locally:**
 
 1. Regenerate data files: `python3 scripts/csv_to_json.py && python3 scripts/generate_collections.py`
 2. Test your site build: `bundle exec jekyll build`''',
-            },
-            {
-                'description': '''**Optional (all users):**
+        },
+        {
+            'description': '''**Optional (all users):**
 
 Enable demo content by setting `include_demo_content: true` in `_config.yml` under `story_interface`. Demo content will be automatically fetched during the build process.''',
-            },
-        ]
+        },
+    ]
+
 
-    def _get_manual_steps_es(self) -> List[Dict[str, str]]:
-        """Spanish manual steps for v0.6.0 migration."""
-        return [
-            {
-                'description': '''**Si usas GitHub Pages:**
+def _manual_steps_es() -> List[Dict[str, str]]:
+    """Spanish manual steps for v0.6.0 migration."""
+    return [
+        {
+            'description': '''**Si usas GitHub Pages:**
 
 No se requieren más acciones. GitHub Actions reconstruirá automáticamente tu sitio con el framework actualizado.''',
-            },
-            {
-                'description': '''**Si trabajas con tu sitio localmente:**
+        },
+        {
+            'description': '''**Si trabajas con tu sitio localmente:**
 
 1. Regenera los archivos de datos: `python3 scripts/csv_to_json.py && python3 scripts/generate_collections.py`
 2. Prueba la compilación de tu sitio: `bundle exec jekyll build`''',
-            },
-            {
-                'description': '''**Opcional (todos los usuarios):**
+        },
+        {
+            'description': '''**Opcional (todos los usuarios):**
 
 Habilita el contenido demo configurando `include_demo_content: true` en `_config.yml` bajo `story_interface`. El contenido demo se descargará automáticamente durante el proceso de compilación.''',
-            },
-        ]
+        },
+    ]
+
+
+# Manual steps by site language (see BaseMigration._detect_language)
+_MANUAL_STEPS = {
+    'en': _manual_steps_en,
+    'es': _manual_steps_es,
+}
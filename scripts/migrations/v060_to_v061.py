@@ -8,11 +8,27 @@ Changes:
 Version: v0.6.1-beta
 """
 
-from typing import List, Dict
+from typing import List, Dict, Tuple
 import os
 from .base import BaseMigration
 
 
+# Framework files updated from GitHub, with change descriptions
+_FRAMEWORK_FILES: Tuple[Tuple[str, str], ...] = (
+    # IIIF generation script - Fix EXIF orientation in thumbnails
+    ('scripts/generate_iiif.py', 'IIIF generation script (EXIF orientation fix)'),
+
+    # Migration script - Fix template pollution for existing sites
+    ('scripts/migrations/v050_to_v060.py', 'v0.5.0→v0.6.0 migration script (template pollution fix)'),
+
+    # README - Bilingual version with streamlined content
+    ('README.md', 'README (bilingual version)'),
+
+    # CHANGELOG - v0.6.1 release notes
+    ('CHANGELOG.md', 'CHANGELOG (v0.6.1 release notes)'),
+)
+
+
 class Migration060to061(BaseMigration):
     """Migration from v0.6.0 to v0.6.1 - fix EXIF thumbnails and migration script template pollution."""
 
@@ -39,10 +55,8 @@ class Migration060to061(BaseMigration):
 
         # Phase 2: Update _config.yml version
         print("  Phase 2: Updating version...")
-        from datetime import date
-        today = date.today().strftime("%Y-%m-%d")
-        if self._update_config_version("0.6.1-beta", today):
-            changes.append(f"Updated _config.yml: version 0.6.1-beta ({today})")
+        if self._update_config_version("0.6.1-beta", self._today):
+            changes.append(f"Updated _config.yml: version 0.6.1-beta ({self._today})")
 
         return changes
 
@@ -55,26 +69,13 @@ class Migration060to061(BaseMigration):
         """
         changes = []
 
-        # Files to update from GitHub
-        framework_files = {
-            # IIIF generation script - Fix EXIF orientation in thumbnails
-            'scripts/generate_iiif.py': 'IIIF generation script (EXIF orientation fix)',
-
-            # Migration script - Fix template pollution for existing sites
-            'scripts/migrations/v050_to_v060.py': 'v0.5.0→v0.6.0 migration script (template pollution fix)',
-
-            # README - Bilingual version with streamlined content
-            'README.md': 'README (bilingual version)',
-
-            # CHANGELOG - v0.6.1 release notes
-            'CHANGELOG.md': 'CHANGELOG (v0.6.1 release notes)',
-        }
-
-        for file_path, description in framework_files.items():
+        for file_path, description in _FRAMEWORK_FILES:
             content = self._fetch_from_github(file_path)
             if content:
-                self._write_file(file_path, content)
-                changes.append(f"Updated {file_path} - {description}")
+                if self._write_if_changed(file_path, content):
+                    changes.append(f"Updated {file_path} - {description}")
+                else:
+                    changes.append(f"Unchanged: {file_path}")
             else:
                 changes.append(f"Warning: Failed to update {file_path}")
 
@@ -91,21 +92,19 @@ class Migration060to061(BaseMigration):
         """
         lang = self._detect_language()
 
-        if lang == 'es':
-            return self._get_manual_steps_es()
-        else:
-            return self._get_manual_steps_en()
+        return _MANUAL_STEPS.get(lang, _manual_steps_en)()
+
 
-    def _get_manual_steps_en(self) -> List[Dict[str, str]]:
-        """English manual steps for v0.6.1 migration."""
-        return [
-            {
-                'description': '''**If you use GitHub Pages:**
+def _manual_steps_en() -> List[Dict[str, str]]:
+    """English manual steps for v0.6.1 migration."""
+    return [
+        {
+            'description': '''**If you use GitHub Pages:**
 
 No further actions needed. GitHub Actions will automatically regenerate IIIF tiles with the EXIF orientation fix when your site rebuilds.''',
-            },
-            {
-                'description': '''**If you work with your site locally:**
+        },
+        {
+            'description': '''**If you work with your site locally:**
 
 If you have self-hosted images with EXIF orientation metadata (most smartphone photos taken in portrait mode), regenerate IIIF tiles to fix thumbnail orientation:
 
@@ -114,19 +113,20 @@ If you have self-hosted images with EXIF orientation metadata (most smartphone p
 (Replace YOUR_SITE_URL with your site's URL)
 
 You will see "Saving rotated image for IIIF processing" in the console output for affected images.''',
-            },
-        ]
+        },
+    ]
 
-    def _get_manual_steps_es(self) -> List[Dict[str, str]]:
-        """Spanish manual steps for v0.6.1 migration."""
-        return [
-            {
-                'description': '''**Si usas GitHub Pages:**
+
+def _manual_steps_es() -> List[Dict[str, str]]:
+    """Spanish manual steps for v0.6.1 migration."""
+    return [
+        {
+            'description': '''**Si usas GitHub Pages:**
 
 No se requieren acciones adicionales. GitHub Actions regenerará automáticamente las teselas IIIF con la corrección de orientación EXIF cuando se reconstruya tu sitio.''',
-            },
-            {
-                'description': '''**Si trabajas con tu sitio localmente:**
+        },
+        {
+            'description': '''**Si trabajas con tu sitio localmente:**
 
 Si tienes imágenes auto-alojadas con metadatos de orientación EXIF (la mayoría de fotos de smartphone tomadas en modo retrato), regenera las teselas IIIF para corregir la orientación de las miniaturas:
 
@@ -135,5 +135,12 @@ Si tienes imágenes auto-alojadas con metadatos de orientación EXIF (la mayorí
 (Reemplaza URL_DE_TU_SITIO con la URL de tu sitio)
 
 Verás "Saving rotated image for IIIF processing" en la salida de consola para las imágenes afectadas.''',
-            },
-        ]
+        },
+    ]
+
+
+# Manual steps by site language (see BaseMigration._detect_language)
+_MANUAL_STEPS = {
+    'en': _manual_steps_en,
+    'es': _manual_steps_es,
+}
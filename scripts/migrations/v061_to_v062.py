@@ -13,11 +13,58 @@ Changes:
 Version: v0.6.2-beta
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 import os
 import re
 from .base import BaseMigration
 
+# A top-level feature-flags section: its header line, then every line up to
+# the next top-level key (indented lines, blank lines and comments)
+_FEATURES_SECTION_RE = re.compile(
+    r'^(?P<header>(?P<name>development-features|testing-features):[^\n]*\n?)'
+    r'(?P<body>.*?)(?=^[^\s#]|\Z)',
+    re.MULTILINE | re.DOTALL,
+)
+
+# Section header keys, located with str.find before the regex is anchored
+_SECTION_KEYS = ('development-features:', 'testing-features:')
+
+# Flags inside the section that decide which blocks still need adding
+_FEATURE_KEY_RE = re.compile(
+    r'^\s*(viewer_preloading|hide_stories|hide_collections):',
+    re.MULTILINE,
+)
+
+
+# Framework files updated from GitHub, with change descriptions
+_FRAMEWORK_FILES: Tuple[Tuple[str, str], ...] = (
+    # Layouts
+    ('_layouts/story.html', 'Story layout (viewer preloading config)'),
+    ('_layouts/index.html', 'Index layout (hover prefetch, hide flags)'),
+    ('_layouts/objects-index.html', 'Objects index (hide_collections flag)'),
+
+    # Includes
+    ('_includes/viewer.html', 'Viewer include (removed inline transition styles)'),
+    ('_includes/header.html', 'Header (hide_collections nav flag)'),
+    ('_includes/panels.html', 'Panels (h5→h1 semantic fix)'),
+
+    # JavaScript
+    ('assets/js/story.js', 'Story JS (viewer preloading overhaul)'),
+    ('assets/js/telar.js', 'Telar JS (glossary-to-glossary linking)'),
+
+    # CSS
+    ('assets/css/telar.scss', 'Stylesheet (image overflow, h1 spacing, fade transitions)'),
+
+    # Python scripts
+    ('scripts/csv_to_json.py', 'CSV converter (case-insensitive matching)'),
+    ('scripts/generate_collections.py', 'Collections generator (glossary links, hide flags)'),
+    ('scripts/build_local_site.py', 'NEW: All-in-one local build script'),
+
+    # Documentation
+    ('README.md', 'README (version update)'),
+    ('CHANGELOG.md', 'CHANGELOG (v0.6.2 release notes)'),
+)
+
 
 class Migration061to062(BaseMigration):
     """Migration from v0.6.1 to v0.6.2 - viewer preloading, case sensitivity, dev features."""
@@ -39,8 +86,9 @@ class Migration061to062(BaseMigration):
         changes = []
 
         # Phase 1: Rename config section (testing-features → development-features)
-        print("  Phase 1: Updating configuration...")
-        config_changes = self._update_config_section()
+        # and bump the version in the same read/write of _config.yml
+        print("  Phase 1: Updating configuration and version...")
+        config_changes = self._update_config()
         changes.extend(config_changes)
 
         # Phase 2: Update framework files from GitHub
@@ -53,45 +101,61 @@ class Migration061to062(BaseMigration):
         glossary_changes = self._cleanup_deprecated_glossary()
         changes.extend(glossary_changes)
 
-        # Phase 4: Update _config.yml version
-        print("  Phase 4: Updating version...")
-        from datetime import date
-        today = date.today().strftime("%Y-%m-%d")
-        if self._update_config_version("0.6.2-beta", today):
-            changes.append(f"Updated _config.yml: version 0.6.2-beta ({today})")
+        return changes
+
+    def _update_config(self) -> List[str]:
+        """
+        Update development-features and version in a single pass over _config.yml.
+
+        Returns:
+            List of change descriptions
+        """
+        changes = []
+
+        def transform(content: str) -> Optional[str]:
+            content = self._update_config_section(content, changes)
+            versioned = self._set_config_version(content, "0.6.2-beta", self._today)
+            if versioned is not None:
+                changes.append(f"Updated _config.yml: version 0.6.2-beta ({self._today})")
+                return versioned
+            return content if changes else None
 
+        self._mutate_config(transform)
         return changes
 
-    def _update_config_section(self) -> List[str]:
+    def _update_config_section(self, content: str, changes: List[str]) -> str:
         """
-        Update development-features section in _config.yml.
+        Update development-features section in _config.yml content.
 
         - Rename testing-features to development-features
         - Add viewer_preloading section if missing
         - Add hide_stories and hide_collections flags if missing
 
+        Args:
+            content: Current _config.yml text
+            changes: List that change descriptions are appended to
+
         Returns:
-            List of change descriptions
+            Updated content (unchanged if nothing was needed)
         """
-        changes = []
-        config_path = os.path.join(self.repo_root, '_config.yml')
-
-        if not os.path.exists(config_path):
-            return changes
-
-        with open(config_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Locate the feature-flags section (prefer development-features if both exist)
+        for key in _SECTION_KEYS:
+            match = self._match_section(content, key)
+            if match:
+                break
+        else:
+            return content
 
-        modified = False
+        header, body = match.group('header'), match.group('body')
+        present = set(_FEATURE_KEY_RE.findall(body))
 
-        # Check if rename is needed
-        if 'testing-features:' in content and 'development-features:' not in content:
-            content = content.replace('testing-features:', 'development-features:')
-            modified = True
+        if match.group('name') == 'testing-features':
+            # The header match starts with the section key
+            header = 'development-features:' + header[len('testing-features:'):]
             changes.append("Renamed config section: testing-features → development-features")
 
         # Add viewer_preloading section if missing
-        if 'viewer_preloading:' not in content and 'development-features:' in content:
+        if 'viewer_preloading' not in present:
             viewer_preloading_block = '''
   # Viewer preloading configuration
   # Controls how story viewers are preloaded for smoother navigation.
@@ -105,62 +169,54 @@ class Migration061to062(BaseMigration):
     min_ready_viewers: 3    # Hide shimmer when N viewers ready. (default: 3)
 '''
             # Insert after development-features: line
-            content = content.replace('development-features:', 'development-features:' + viewer_preloading_block)
-            modified = True
+            newline = '\n' if header.endswith('\n') else ''
+            header = header.rstrip('\n') + viewer_preloading_block + newline
             changes.append("Added viewer_preloading configuration section")
 
-        # Add hide_stories if missing
-        if 'hide_stories:' not in content and 'development-features:' in content:
-            hide_stories_block = '''
+        # Flags go at the end of the section, before the next top-level key
+        if match.end() < len(content):
+            if 'hide_stories' not in present:
+                body += '''
   # Hide stories - skips story generation and hides stories section from index
   # Objects remain visible and accessible
   hide_stories: false
 '''
-            # Find the end of development-features section and insert before next top-level key
-            lines = content.split('\n')
-            in_dev_features = False
-            insert_index = -1
-            for i, line in enumerate(lines):
-                if line.startswith('development-features:'):
-                    in_dev_features = True
-                elif in_dev_features and line and not line.startswith(' ') and not line.startswith('\t') and not line.startswith('#'):
-                    insert_index = i
-                    break
-            if insert_index > 0:
-                lines.insert(insert_index, hide_stories_block.rstrip())
-                content = '\n'.join(lines)
-                modified = True
                 changes.append("Added hide_stories flag")
 
-        # Add hide_collections if missing
-        if 'hide_collections:' not in content and 'development-features:' in content:
-            hide_collections_block = '''
+            if 'hide_collections' not in present:
+                body += '''
   # Hide collections - skips both object AND story generation
   # Hides stories section, objects teaser, and /objects/ nav link
   # Use this when building a site with only custom pages (no stories or objects)
   hide_collections: false
 '''
-            # Find the end of development-features section and insert before next top-level key
-            lines = content.split('\n')
-            in_dev_features = False
-            insert_index = -1
-            for i, line in enumerate(lines):
-                if line.startswith('development-features:'):
-                    in_dev_features = True
-                elif in_dev_features and line and not line.startswith(' ') and not line.startswith('\t') and not line.startswith('#'):
-                    insert_index = i
-                    break
-            if insert_index > 0:
-                lines.insert(insert_index, hide_collections_block.rstrip())
-                content = '\n'.join(lines)
-                modified = True
                 changes.append("Added hide_collections flag")
 
-        if modified:
-            with open(config_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+        start, end = match.span()
+        return content[:start] + header + body + content[end:]
 
-        return changes
+    @staticmethod
+    def _match_section(content: str, key: str) -> Optional[re.Match]:
+        """
+        Match a top-level feature-flags section starting with key.
+
+        Candidate positions are found with str.find, and the section regex
+        is only anchored at those, instead of scanning every line of the
+        config with a MULTILINE pattern.
+
+        Args:
+            content: Current _config.yml text
+            key: Section header including colon (e.g. "testing-features:")
+
+        Returns:
+            Section match, or None if the key is not a top-level key
+        """
+        pos = content.find(key)
+        while pos != -1:
+            if pos == 0 or content[pos - 1] == '\n':
+                return _FEATURES_SECTION_RE.match(content, pos)
+            pos = content.find(key, pos + 1)
+        return None
 
     def _update_framework_files(self) -> List[str]:
         """
@@ -171,43 +227,13 @@ class Migration061to062(BaseMigration):
         """
         changes = []
 
-        # Files to update from GitHub
-        framework_files = {
-            # Layouts
-            '_layouts/story.html': 'Story layout (viewer preloading config)',
-            '_layouts/index.html': 'Index layout (hover prefetch, hide flags)',
-            '_layouts/objects-index.html': 'Objects index (hide_collections flag)',
-
-            # Includes
-            '_includes/viewer.html': 'Viewer include (removed inline transition styles)',
-            '_includes/header.html': 'Header (hide_collections nav flag)',
-            '_includes/panels.html': 'Panels (h5→h1 semantic fix)',
-
-            # JavaScript
-            'assets/js/story.js': 'Story JS (viewer preloading overhaul)',
-            'assets/js/telar.js': 'Telar JS (glossary-to-glossary linking)',
-
-            # CSS
-            'assets/css/telar.scss': 'Stylesheet (image overflow, h1 spacing, fade transitions)',
-
-            # Python scripts
-            'scripts/csv_to_json.py': 'CSV converter (case-insensitive matching)',
-            'scripts/generate_collections.py': 'Collections generator (glossary links, hide flags)',
-            'scripts/build_local_site.py': 'NEW: All-in-one local build script',
-
-            # Documentation
-            'README.md': 'README (version update)',
-            'CHANGELOG.md': 'CHANGELOG (v0.6.2 release notes)',
-        }
-
-        for file_path, description in framework_files.items():
+        for file_path, description in _FRAMEWORK_FILES:
             content = self._fetch_from_github(file_path)
             if content:
-                # Ensure parent directory exists for new files
-                full_path = os.path.join(self.repo_root, file_path)
-                os.makedirs(os.path.dirname(full_path), exist_ok=True)
-                self._write_file(file_path, content)
-                changes.append(f"Updated {file_path} - {description}")
+                if self._write_if_changed(file_path, content):
+                    changes.append(f"Updated {file_path} - {description}")
+                else:
+                    changes.append(f"Unchanged: {file_path}")
             else:
                 changes.append(f"Warning: Failed to update {file_path}")
 
@@ -235,27 +261,39 @@ class Migration061to062(BaseMigration):
             'components/texts/glossary/markdown.md',
         ]
 
-        for rel_path in deprecated_files:
+        # List the glossary directory once instead of stat-ing each file
+        glossary_dir = os.path.join(self.repo_root, 'components/texts/glossary')
+        try:
+            with os.scandir(glossary_dir) as entries:
+                existing = {entry.name for entry in entries}
+        except FileNotFoundError:
+            return changes
+
+        present = [path for path in deprecated_files if os.path.basename(path) in existing]
+
+        # Fetch all originals from GitHub v0.6.1 up front to compare
+        originals = self._fetch_many(present, branch='v0.6.1-beta')
+
+        for rel_path in present:
             full_path = os.path.join(self.repo_root, rel_path)
-            if os.path.exists(full_path):
-                # Fetch original from GitHub v0.6.1 to compare
-                original = self._fetch_from_github(rel_path, branch='v0.6.1-beta')
-
-                if original:
-                    current = self._read_file(rel_path)
-                    if current and current.strip() == original.strip():
-                        # Unmodified - safe to delete
-                        try:
-                            os.remove(full_path)
-                            changes.append(f"Removed deprecated: {rel_path}")
-                        except Exception as e:
-                            changes.append(f"Warning: Could not remove {rel_path}: {e}")
-                    else:
-                        # Modified by user - keep it
-                        changes.append(f"Kept (user modified): {rel_path}")
+            original = originals[rel_path]
+
+            if original:
+                # Text mode reads CRLF checkouts as LF, like the fetched original
+                current = self._read_file(rel_path)
+                if current and current.strip() == original.strip():
+                    # Unmodified - safe to delete
+                    try:
+                        os.remove(full_path)
+                        changes.append(f"Removed deprecated: {rel_path}")
+                    except Exception as e:
+                        changes.append(f"Warning: Could not remove {rel_path}: {e}")
                 else:
-                    # Couldn't fetch original - keep to be safe
-                    changes.append(f"Kept (could not verify): {rel_path}")
+                    # Modified by user - keep it
+                    changes.append(f"Kept (user modified): {rel_path}")
+            else:
+                # Couldn't fetch original - keep to be safe
+                changes.append(f"Kept (could not verify): {rel_path}")
 
         return changes
 
@@ -270,45 +308,51 @@ class Migration061to062(BaseMigration):
         """
         lang = self._detect_language()
 
-        if lang == 'es':
-            return self._get_manual_steps_es()
-        else:
-            return self._get_manual_steps_en()
+        return _MANUAL_STEPS.get(lang, _manual_steps_en)()
 
-    def _get_manual_steps_en(self) -> List[Dict[str, str]]:
-        """English manual steps for v0.6.2 migration."""
-        return [
-            {
-                'description': '''**If you use GitHub Pages:**
+
+def _manual_steps_en() -> List[Dict[str, str]]:
+    """English manual steps for v0.6.2 migration."""
+    return [
+        {
+            'description': '''**If you use GitHub Pages:**
 
 No further actions needed. Your site will automatically use the improved viewer preloading when it rebuilds.''',
-            },
-            {
-                'description': '''**If you work with your site locally:**
+        },
+        {
+            'description': '''**If you work with your site locally:**
 
 A new all-in-one build script is now available:
 
 `python3 scripts/build_local_site.py`
 
 This runs all build steps (CSV conversion, collections, IIIF, Jekyll) with a single command. Use `--skip-iiif` for faster rebuilds when images haven't changed.''',
-            },
-        ]
+        },
+    ]
+
 
-    def _get_manual_steps_es(self) -> List[Dict[str, str]]:
-        """Spanish manual steps for v0.6.2 migration."""
-        return [
-            {
-                'description': '''**Si usas GitHub Pages:**
+def _manual_steps_es() -> List[Dict[str, str]]:
+    """Spanish manual steps for v0.6.2 migration."""
+    return [
+        {
+            'description': '''**Si usas GitHub Pages:**
 
 No se requieren acciones adicionales. Tu sitio usará automáticamente la precarga mejorada del visor cuando se reconstruya.''',
-            },
-            {
-                'description': '''**Si trabajas con tu sitio localmente:**
+        },
+        {
+            'description': '''**Si trabajas con tu sitio localmente:**
 
 Un nuevo script de construcción todo-en-uno está disponible:
 
 `python3 scripts/build_local_site.py`
 
 Esto ejecuta todos los pasos de construcción (conversión CSV, colecciones, IIIF, Jekyll) con un solo comando. Usa `--skip-iiif` para reconstrucciones más rápidas cuando las imágenes no han cambiado.''',
-            },
-        ]
+        },
+    ]
+
+
+# Manual steps by site language (see BaseMigration._detect_language)
+_MANUAL_STEPS = {
+    'en': _manual_steps_en,
+    'es': _manual_steps_es,
+}
@@ -11,10 +11,17 @@ No structural changes required — framework files are updated automatically.
 Version: v0.6.3-beta
 """
 
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from .base import BaseMigration
 
 
+# Framework files updated from GitHub, with change descriptions
+_FRAMEWORK_FILES: Tuple[Tuple[str, str], ...] = (
+    ('scripts/csv_to_json.py', 'Inline content support, CSV parsing fix'),
+    ('assets/js/story.js', 'Panel title fallback to button text'),
+)
+
+
 class Migration062to063(BaseMigration):
     """Migration from v0.6.2 to v0.6.3 - inline panel content support."""
 
@@ -36,10 +43,8 @@ class Migration062to063(BaseMigration):
 
         # Phase 2: Update version
         print("  Phase 2: Updating version...")
-        from datetime import date
-        today = date.today().strftime("%Y-%m-%d")
-        if self._update_config_version("0.6.3-beta", today):
-            changes.append(f"Updated _config.yml: version 0.6.3-beta ({today})")
+        if self._update_config_version("0.6.3-beta", self._today):
+            changes.append(f"Updated _config.yml: version 0.6.3-beta ({self._today})")
 
         return changes
 
@@ -47,16 +52,13 @@ class Migration062to063(BaseMigration):
         """Update framework files from GitHub repository."""
         changes = []
 
-        framework_files = {
-            'scripts/csv_to_json.py': 'Inline content support, CSV parsing fix',
-            'assets/js/story.js': 'Panel title fallback to button text',
-        }
-
-        for file_path, description in framework_files.items():
+        for file_path, description in _FRAMEWORK_FILES:
             content = self._fetch_from_github(file_path)
             if content:
-                self._write_file(file_path, content)
-                changes.append(f"Updated {file_path} - {description}")
+                if self._write_if_changed(file_path, content):
+                    changes.append(f"Updated {file_path} - {description}")
+                else:
+                    changes.append(f"Unchanged: {file_path}")
             else:
                 changes.append(f"Warning: Could not fetch {file_path}")
 
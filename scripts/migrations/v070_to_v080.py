@@ -13,12 +13,73 @@ Changes:
 Version: v0.8.0-beta
 """
 
-from typing import List, Dict
-import os
+from typing import List, Dict, Tuple
 import re
 from .base import BaseMigration
 
 
+# Framework files updated from GitHub, in write order (what changed noted per file).
+# Note: .github/workflows/ files are NOT included here
+# (GitHub Actions security restriction - must be done manually)
+_FRAMEWORK_PATHS: Tuple[str, ...] = (
+    # Glossary CSV
+    'scripts/telar/glossary.py',  # Glossary CSV support
+    'scripts/generate_collections.py',  # Glossary CSV generation + frontmatter fields
+    # Protected Stories
+    'scripts/telar/encryption.py',  # Protected stories encryption
+    'scripts/telar/processors/project.py',  # Protected column support
+    'scripts/telar/core.py',  # Encryption post-processing
+    '_includes/share-panel.html',  # Share panel redesign
+    '_sass/_share.scss',  # Share panel styles
+    'assets/js/share-panel.js',  # Share panel functionality
+    'assets/js/story-unlock.js',  # Story unlock decryption
+    '_layouts/story.html',  # Unlock overlay integration
+    '_sass/_story.scss',  # Unlock overlay styles
+    '_layouts/index.html',  # Protected story indicator + featured objects
+    # Gallery/Collection System
+    'scripts/telar/csv_utils.py',  # Column mapping for materias
+    'scripts/telar/search.py',  # Search data generator
+    'scripts/telar/iiif_metadata.py',  # Updated metadata fallback fields
+    'scripts/telar/processors/objects.py',  # Featured objects selection
+    '_layouts/objects-index.html',  # Browse/search UI layout
+    '_includes/header.html',  # skip_collections rename
+    '_sass/_layout.scss',  # Browse/search, featured objects, protected card styles
+    'assets/js/objects-filter.js',  # Filter/search/sort functionality
+    'assets/js/lunr.min.js',  # Lunr.js search library
+    'assets/js/telar-story/main.js',  # Event-driven init for encrypted stories
+    '_data/languages/en.yml',  # All new strings
+    '_data/languages/es.yml',  # Spanish translations
+    # Dependencies
+    'requirements.txt',  # Added cryptography dependency
+    'pytest.ini',  # Updated markers
+    # Tests
+    'tests/unit/test_apply_metadata.py',  # Updated for new fields
+    # Documentation
+    'README.md',  # Updated README
+    'CHANGELOG.md',  # Updated changelog
+)
+
+
+# Development flags renamed in v0.8.0 (values are preserved). Adding a
+# rule here is enough: the config pattern below is built from this table.
+_FLAG_RENAMES = {
+    'hide_stories': 'skip_stories',
+    'hide_collections': 'skip_collections',
+}
+
+# Every _config.yml position _update_configuration needs, found in one pass:
+# existing keys, the story_interface header, flags to rename, and any
+# top-level line (to find where story_interface ends). Compiled once at import.
+_CONFIG_RE = re.compile(
+    r'(?P<collection>collection_interface:)'
+    r'|(?P<show>show_on_homepage)'
+    r'|^(?P<story>story_interface:)'
+    r'|^(?P<indent>[ \t]*)(?P<flag>' + '|'.join(map(re.escape, _FLAG_RENAMES)) + r'):\s*(?P<value>true|false)'
+    r'|^(?P<top>\S)',
+    re.MULTILINE,
+)
+
+
 class Migration070to080(BaseMigration):
     """Migration from v0.7.0 to v0.8.0 - Content & Access release."""
 
@@ -48,10 +109,8 @@ class Migration070to080(BaseMigration):
 
         # Phase 4: Update version
         print("  Phase 4: Updating version...")
-        from datetime import date
-        today = date.today().strftime("%Y-%m-%d")
-        if self._update_config_version("0.8.0-beta", today):
-            changes.append(f"Updated _config.yml: version 0.8.0-beta ({today})")
+        if self._update_config_version("0.8.0-beta", self._today):
+            changes.append(f"Updated _config.yml: version 0.8.0-beta ({self._today})")
 
         return changes
 
@@ -63,9 +122,37 @@ class Migration070to080(BaseMigration):
         if not content:
             return changes
 
+        has_collection_interface = False
+        has_show_on_homepage = False
+        story_header_end = None  # End of the story_interface: key
+        story_section_end = None  # Start of the first top-level line after it
+        renames = {}  # flag -> its first match
+
+        # One pass over the config finds every position the steps below need
+        for match in _CONFIG_RE.finditer(content):
+            start = match.start()
+            if (story_header_end is not None and story_section_end is None
+                    and (start == 0 or content[start - 1] == '\n')
+                    and not content[start].isspace()):
+                story_section_end = start
+
+            kind = match.lastgroup
+            if kind == 'collection':
+                has_collection_interface = True
+            elif kind == 'show':
+                has_show_on_homepage = True
+            elif kind == 'story' and story_header_end is None:
+                story_header_end = match.end()
+            elif kind == 'value':
+                renames.setdefault(match.group('flag'), match)
+
+        # (start, order, end, replacement), spliced in position order; order
+        # breaks ties between inserts at one offset the way the steps ran in turn
+        edits = []
+
         # 1. Add collection_interface section if missing
-        if 'collection_interface:' not in content:
-            # Insert after story_interface section
+        if not has_collection_interface and story_section_end is not None:
+            # Insert before the first top-level line after story_interface
             collection_block = """
 # Collection Interface Settings
 collection_interface:
@@ -74,58 +161,39 @@ collection_interface:
   show_sample_on_homepage: false # Set to true to show a sample of objects on homepage
   featured_count: 4 # Number of objects to show on homepage (default 4)
 """
-            # Find the end of story_interface section
-            lines = content.split('\n')
-            insert_after = None
-            in_story_interface = False
-            for i, line in enumerate(lines):
-                if line.startswith('story_interface:'):
-                    in_story_interface = True
-                    continue
-                if in_story_interface:
-                    if line and not line.startswith(' ') and not line.startswith('\t') and line.strip():
-                        insert_after = i
-                        break
-            if insert_after is not None:
-                lines.insert(insert_after, collection_block)
-                content = '\n'.join(lines)
-                changes.append("Added collection_interface section to _config.yml")
+            edits.append((story_section_end, 1, story_section_end, collection_block + '\n'))
+            changes.append("Added collection_interface section to _config.yml")
 
         # 2. Add show_on_homepage to story_interface if missing
-        if 'show_on_homepage' not in content:
-            content = content.replace(
-                'story_interface:\n',
-                'story_interface:\n  show_on_homepage: true # Set to false to hide stories section from homepage\n'
-            )
+        if (not has_show_on_homepage and story_header_end is not None
+                and content.startswith('\n', story_header_end)):
+            # Splice in right after the story_interface: header line
+            eol = story_header_end + 1
+            edits.append((eol, 0, eol, '  show_on_homepage: true # Set to false to hide stories section from homepage\n'))
             changes.append("Added show_on_homepage to story_interface in _config.yml")
 
-        # 3. Rename hide_stories to skip_stories (preserve value)
-        hide_stories_match = re.search(
-            r'^(\s*)hide_stories:\s*(true|false)',
-            content, re.MULTILINE
-        )
-        if hide_stories_match:
-            indent = hide_stories_match.group(1)
-            value = hide_stories_match.group(2)
-            content = content.replace(
-                hide_stories_match.group(0),
-                f'{indent}skip_stories: {value} # (Renamed from hide_stories)'
-            )
-            changes.append("Renamed hide_stories to skip_stories in _config.yml")
-
-        # 4. Rename hide_collections to skip_collections (preserve value)
-        hide_collections_match = re.search(
-            r'^(\s*)hide_collections:\s*(true|false)',
-            content, re.MULTILINE
-        )
-        if hide_collections_match:
-            indent = hide_collections_match.group(1)
-            value = hide_collections_match.group(2)
-            content = content.replace(
-                hide_collections_match.group(0),
-                f'{indent}skip_collections: {value} # (Renamed from hide_collections)'
-            )
-            changes.append("Renamed hide_collections to skip_collections in _config.yml")
+        # 3/4. Rename flags per _FLAG_RENAMES (hide_* -> skip_*, preserve value)
+        for flag, new_flag in _FLAG_RENAMES.items():
+            match = renames.get(flag)
+            if not match:
+                continue
+            edits.append((
+                match.start(), 2, match.end(),
+                f"{match.group('indent')}{new_flag}: {match.group('value')} # (Renamed from {flag})"
+            ))
+            changes.append(f"Renamed {flag} to {new_flag} in _config.yml")
+
+        if not edits:
+            return changes
+
+        parts = []
+        pos = 0
+        for start, _, end, replacement in sorted(edits, key=lambda edit: edit[:2]):
+            parts.append(content[pos:start])
+            parts.append(replacement)
+            pos = end
+        parts.append(content[pos:])
+        content = ''.join(parts)
 
         self._write_file('_config.yml', content)
         return changes
@@ -148,53 +216,22 @@ collection_interface:
         """Update framework files from GitHub repository."""
         changes = []
 
-        # Note: .github/workflows/ files are NOT included here
-        # (GitHub Actions security restriction - must be done manually)
-        framework_files = {
-            # Glossary CSV
-            'scripts/telar/glossary.py': 'Glossary CSV support',
-            'scripts/generate_collections.py': 'Glossary CSV generation + frontmatter fields',
-            # Protected Stories
-            'scripts/telar/encryption.py': 'Protected stories encryption',
-            'scripts/telar/processors/project.py': 'Protected column support',
-            'scripts/telar/core.py': 'Encryption post-processing',
-            '_includes/share-panel.html': 'Share panel redesign',
-            '_sass/_share.scss': 'Share panel styles',
-            'assets/js/share-panel.js': 'Share panel functionality',
-            'assets/js/story-unlock.js': 'Story unlock decryption',
-            '_layouts/story.html': 'Unlock overlay integration',
-            '_sass/_story.scss': 'Unlock overlay styles',
-            '_layouts/index.html': 'Protected story indicator + featured objects',
-            # Gallery/Collection System
-            'scripts/telar/csv_utils.py': 'Column mapping for materias',
-            'scripts/telar/search.py': 'Search data generator',
-            'scripts/telar/iiif_metadata.py': 'Updated metadata fallback fields',
-            'scripts/telar/processors/objects.py': 'Featured objects selection',
-            '_layouts/objects-index.html': 'Browse/search UI layout',
-            '_includes/header.html': 'skip_collections rename',
-            '_sass/_layout.scss': 'Browse/search, featured objects, protected card styles',
-            'assets/js/objects-filter.js': 'Filter/search/sort functionality',
-            'assets/js/lunr.min.js': 'Lunr.js search library',
-            'assets/js/telar-story/main.js': 'Event-driven init for encrypted stories',
-            '_data/languages/en.yml': 'All new strings',
-            '_data/languages/es.yml': 'Spanish translations',
-            # Dependencies
-            'requirements.txt': 'Added cryptography dependency',
-            'pytest.ini': 'Updated markers',
-            # Tests
-            'tests/unit/test_apply_metadata.py': 'Updated for new fields',
-            # Documentation
-            'README.md': 'Updated README',
-            'CHANGELOG.md': 'Updated changelog',
-        }
-
-        for file_path, description in framework_files.items():
-            content = self._fetch_from_github(file_path)
+        # Skip files already identical to the repository, fetch the rest in
+        # one batch, then write on this thread in listing order
+        current = self._up_to_date_paths(_FRAMEWORK_PATHS)
+        contents = self._fetch_framework_files(p for p in _FRAMEWORK_PATHS if p not in current)
+        self._ensure_parent_dirs(path for path, content in contents.items() if content)
+
+        for file_path in _FRAMEWORK_PATHS:
+            if file_path in current:
+                changes.append(f"Unchanged: {file_path}")
+                continue
+            content = contents.pop(file_path)
             if content:
-                full_path = os.path.join(self.repo_root, file_path)
-                os.makedirs(os.path.dirname(full_path), exist_ok=True)
-                self._write_file(file_path, content)
-                changes.append(f"Updated {file_path}")
+                if self._write_if_changed(file_path, content):
+                    changes.append(f"Updated {file_path}")
+                else:
+                    changes.append(f"Unchanged: {file_path}")
             else:
                 changes.append(f"Warning: Could not fetch {file_path}")
 
@@ -204,16 +241,14 @@ collection_interface:
         """Return manual steps in user's language."""
         lang = self._detect_language()
 
-        if lang == 'es':
-            return self._get_manual_steps_es()
-        else:
-            return self._get_manual_steps_en()
+        return _MANUAL_STEPS.get(lang, _manual_steps_en)()
+
 
-    def _get_manual_steps_en(self) -> List[Dict[str, str]]:
-        """English manual steps for v0.8.0 migration."""
-        return [
-            {
-                'description': '''**Update GitHub Actions workflows:**
+def _manual_steps_en() -> List[Dict[str, str]]:
+    """English manual steps for v0.8.0 migration."""
+    return [
+        {
+            'description': '''**Update GitHub Actions workflows:**
 
 Due to GitHub security restrictions, workflow files cannot be updated automatically.
 Please manually copy these files from the Telar repository:
@@ -221,15 +256,15 @@ Please manually copy these files from the Telar repository:
 1. `.github/workflows/build.yml` - Updated with search data generation step
 
 Download from: https://github.com/UCSB-AMPLab/telar/tree/main/.github/workflows''',
-                'doc_url': 'https://github.com/UCSB-AMPLab/telar/tree/main/.github/workflows'
-            },
-            {
-                'description': '''**If you use GitHub Pages:**
+            'doc_url': 'https://github.com/UCSB-AMPLab/telar/tree/main/.github/workflows'
+        },
+        {
+            'description': '''**If you use GitHub Pages:**
 
 No further actions needed beyond updating the workflow files above. Your site will automatically use the new features when it rebuilds.''',
-            },
-            {
-                'description': '''**If you work with your site locally:**
+        },
+        {
+            'description': '''**If you work with your site locally:**
 
 A new Python dependency is required for protected stories:
 
@@ -242,9 +277,9 @@ Or install all dependencies:
 ```
 pip install -r requirements.txt
 ```''',
-            },
-            {
-                'description': '''**New features available (optional):**
+        },
+        {
+            'description': '''**New features available (optional):**
 
 1. **Protected stories**: Add `protected` column to project.csv (yes/no) and set `story_key` in _config.yml
 2. **Glossary CSV**: Create `components/structures/glossary.csv` as an alternative to individual markdown files
@@ -252,14 +287,15 @@ pip install -r requirements.txt
 4. **Featured objects**: Set `show_sample_on_homepage: true` in _config.yml to show objects on the homepage
 
 See the documentation for details on each feature.''',
-            },
-        ]
+        },
+    ]
+
 
-    def _get_manual_steps_es(self) -> List[Dict[str, str]]:
-        """Spanish manual steps for v0.8.0 migration."""
-        return [
-            {
-                'description': '''**Actualiza los workflows de GitHub Actions:**
+def _manual_steps_es() -> List[Dict[str, str]]:
+    """Spanish manual steps for v0.8.0 migration."""
+    return [
+        {
+            'description': '''**Actualiza los workflows de GitHub Actions:**
 
 Debido a restricciones de seguridad de GitHub, los archivos de workflow no pueden actualizarse automaticamente.
 Por favor copia manualmente estos archivos del repositorio de Telar:
@@ -267,15 +303,15 @@ Por favor copia manualmente estos archivos del repositorio de Telar:
 1. `.github/workflows/build.yml` - Actualizado con paso de generacion de datos de busqueda
 
 Descarga de: https://github.com/UCSB-AMPLab/telar/tree/main/.github/workflows''',
-                'doc_url': 'https://github.com/UCSB-AMPLab/telar/tree/main/.github/workflows'
-            },
-            {
-                'description': '''**Si usas GitHub Pages:**
+            'doc_url': 'https://github.com/UCSB-AMPLab/telar/tree/main/.github/workflows'
+        },
+        {
+            'description': '''**Si usas GitHub Pages:**
 
 No se requieren acciones adicionales aparte de actualizar los archivos de workflow. Tu sitio usara automaticamente las nuevas funciones cuando se reconstruya.''',
-            },
-            {
-                'description': '''**Si trabajas con tu sitio localmente:**
+        },
+        {
+            'description': '''**Si trabajas con tu sitio localmente:**
 
 Se requiere una nueva dependencia de Python para historias protegidas:
 
@@ -288,9 +324,9 @@ O instala todas las dependencias:
 ```
 pip install -r requirements.txt
 ```''',
-            },
-            {
-                'description': '''**Nuevas funciones disponibles (opcionales):**
+        },
+        {
+            'description': '''**Nuevas funciones disponibles (opcionales):**
 
 1. **Historias protegidas**: Agrega la columna `protected` a project.csv (yes/no) y configura `story_key` en _config.yml
 2. **Glosario CSV**: Crea `components/structures/glossary.csv` como alternativa a archivos markdown individuales
@@ -298,5 +334,12 @@ pip install -r requirements.txt
 4. **Objetos destacados**: Configura `show_sample_on_homepage: true` en _config.yml para mostrar objetos en la pagina principal
 
 Consulta la documentacion para detalles sobre cada funcion.''',
-            },
-        ]
+        },
+    ]
+
+
+# Manual steps by site language (see BaseMigration._detect_language)
+_MANUAL_STEPS = {
+    'en': _manual_steps_en,
+    'es': _manual_steps_es,
+}
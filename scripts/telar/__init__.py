@@ -4,37 +4,93 @@ Telar Data Processing Package
 Modular package for processing Telar story data from CSV/Google Sheets
 into JSON format for the Jekyll-based storytelling framework.
 
+The public API below is re-exported lazily: each submodule is imported
+the first time one of its names is accessed, so importing a single
+submodule (e.g. telar.iiif_metadata) no longer imports every other
+submodule and their dependencies (pandas, Pillow, cryptography) with it.
+
 Version: v0.7.0-beta
 """
 
-# Public API re-exports
-from telar.config import load_language_data, get_lang_string, load_site_language
-from telar.csv_utils import (
-    COLUMN_NAME_MAPPING, sanitize_dataframe, get_source_url,
-    normalize_column_names, is_header_row
-)
-from telar.images import (
-    process_images, resolve_path_case_insensitive,
-    validate_image_path, get_image_dimensions
-)
-from telar.iiif_metadata import (
-    detect_iiif_version, extract_language_map_value, strip_html_tags,
-    clean_metadata_value, find_metadata_field, is_legal_boilerplate,
-    extract_credit, extract_manifest_metadata, apply_metadata_fallback
-)
-from telar.glossary import load_glossary_terms, process_glossary_links
-from telar.widgets import (
-    get_widget_id, parse_key_value_block, parse_carousel_widget,
-    parse_markdown_sections, parse_tabs_widget, parse_accordion_widget,
-    render_widget_html, process_widgets
-)
-from telar.markdown import read_markdown_file, process_inline_content
-from telar.processors.project import process_project_setup
-from telar.processors.objects import (
-    process_objects, inject_christmas_tree_errors
-)
-from telar.processors.stories import process_story
-from telar.demo import (
-    load_demo_bundle, merge_demo_content, fetch_demo_content_if_enabled
-)
-from telar.core import csv_to_json, find_csv_with_fallback, main
+import importlib
+
+# Public API re-exports: name -> defining module
+_LAZY = {
+    # telar.config
+    'load_language_data': 'telar.config',
+    'get_lang_string': 'telar.config',
+    'load_site_language': 'telar.config',
+    'load_yaml_cached': 'telar.config',
+    # telar.csv_utils
+    'COLUMN_NAME_MAPPING': 'telar.csv_utils',
+    'sanitize_dataframe': 'telar.csv_utils',
+    'get_source_url': 'telar.csv_utils',
+    'normalize_column_names': 'telar.csv_utils',
+    'is_header_row': 'telar.csv_utils',
+    # telar.images
+    'process_images': 'telar.images',
+    'resolve_path_case_insensitive': 'telar.images',
+    'validate_image_path': 'telar.images',
+    'get_image_dimensions': 'telar.images',
+    # telar.iiif_metadata
+    'detect_iiif_version': 'telar.iiif_metadata',
+    'extract_language_map_value': 'telar.iiif_metadata',
+    'strip_html_tags': 'telar.iiif_metadata',
+    'clean_metadata_value': 'telar.iiif_metadata',
+    'build_label_index': 'telar.iiif_metadata',
+    'find_metadata_field': 'telar.iiif_metadata',
+    'is_legal_boilerplate': 'telar.iiif_metadata',
+    'extract_credit': 'telar.iiif_metadata',
+    'extract_manifest_metadata': 'telar.iiif_metadata',
+    'apply_metadata_fallback': 'telar.iiif_metadata',
+    # telar.glossary
+    'load_glossary_terms': 'telar.glossary',
+    'process_glossary_links': 'telar.glossary',
+    # telar.widgets
+    'get_widget_id': 'telar.widgets',
+    'reset_widget_counter': 'telar.widgets',
+    'parse_key_value_block': 'telar.widgets',
+    'parse_carousel_widget': 'telar.widgets',
+    'parse_markdown_sections': 'telar.widgets',
+    'parse_tabs_widget': 'telar.widgets',
+    'parse_accordion_widget': 'telar.widgets',
+    'render_widget_html': 'telar.widgets',
+    'process_widgets': 'telar.widgets',
+    # telar.markdown
+    'read_markdown_file': 'telar.markdown',
+    'process_inline_content': 'telar.markdown',
+    # telar.processors
+    'process_project_setup': 'telar.processors.project',
+    'process_objects': 'telar.processors.objects',
+    'inject_christmas_tree_errors': 'telar.processors.objects',
+    'process_story': 'telar.processors.stories',
+    # telar.demo
+    'load_demo_bundle': 'telar.demo',
+    'merge_demo_content': 'telar.demo',
+    'fetch_demo_content_if_enabled': 'telar.demo',
+    # telar.json_io
+    'parse_json': 'telar.json_io',
+    'read_json': 'telar.json_io',
+    'write_json': 'telar.json_io',
+    # telar.core
+    'csv_to_json': 'telar.core',
+    'find_csv_with_fallback': 'telar.core',
+    'main': 'telar.core',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    """Import the submodule defining name on first access (PEP 562)."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
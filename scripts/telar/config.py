@@ -20,15 +20,71 @@ code ('en', 'es', etc.) without loading the full string dictionary. This is
 used by IIIF metadata extraction to choose the preferred language when
 reading multilingual manifests.
 
+`load_yaml_cached()` parses a YAML file once per build and hands the same
+dictionary back to every later caller while the file's mtime and size are
+unchanged. `_config.yml` is read by several stages of the build (language
+setup, Christmas Tree Mode, featured objects, search, story encryption),
+and PyYAML's parser is slow enough that re-parsing it each time shows up.
+The libyaml-backed `CSafeLoader` is used when PyYAML was built with it.
+
 Version: v0.7.0-beta
 """
 
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
 import yaml
 
+# Prefer the libyaml C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 # Global language data cache
 _lang_data = None
 
+# The same strings keyed by dotted path, e.g. 'errors.object_warnings.iiif_503'
+_lang_flat = {}
+
+# Liquid-style {{ var }} placeholder used in the language files
+_PLACEHOLDER_RE = re.compile(r'\{\{ ([A-Za-z_]\w*) \}\}')
+
+# Parsed YAML cache: path -> ((mtime_ns, size), data)
+_yaml_cache = {}
+
+
+def load_yaml_cached(path):
+    """
+    Parse a YAML file, reusing the previous result if the file is unchanged.
+
+    The returned object is shared between callers and must not be mutated.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed YAML data (None for an empty file)
+
+    Raises:
+        OSError: If the file cannot be read
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    key = os.fspath(path)
+    st = os.stat(key)
+    stamp = (st.st_mtime_ns, st.st_size)
+
+    cached = _yaml_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    with open(key, 'r', encoding='utf-8') as f:
+        data = yaml.load(f, Loader=_SafeLoader)
+
+    _yaml_cache[key] = (stamp, data)
+    return data
+
 
 def load_language_data():
     """
@@ -49,8 +105,7 @@ def load_language_data():
         if not config_path.exists():
             return None
 
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        config = load_yaml_cached(config_path)
 
         # Get language setting, default to English
         language = config.get('telar_language', 'en')
@@ -65,8 +120,10 @@ def load_language_data():
         if not lang_file.exists():
             return None
 
-        with open(lang_file, 'r', encoding='utf-8') as f:
-            _lang_data = yaml.safe_load(f)
+        _lang_data = load_yaml_cached(lang_file)
+        _lang_flat.clear()
+        if isinstance(_lang_data, dict):
+            _flatten(_lang_data, '', _lang_flat)
 
         return _lang_data
 
@@ -86,32 +143,58 @@ def get_lang_string(key_path, **kwargs):
     Returns:
         str: Localized string with variables interpolated, or key_path if not found
     """
-    lang = load_language_data()
-
-    if lang is None:
+    if load_language_data() is None:
         return key_path
 
-    # Navigate through nested dict using key path
-    keys = key_path.split('.')
-    value = lang
+    value = _lang_flat.get(key_path)
+    if value is None:
+        # Key not found - return the key path itself as fallback
+        return key_path
 
     try:
-        for key in keys:
-            value = value[key]
-
-        # Interpolate variables if provided
-        if kwargs:
-            # Replace {{ var }} syntax with Python format strings
-            for var_name, var_value in kwargs.items():
-                value = value.replace(f'{{{{ {var_name} }}}}', str(var_value))
+        # Interpolate variables if provided and the string has placeholders
+        if kwargs and '{{' in value:
+            value = _format_template(value).format_map(_Placeholders(kwargs))
 
         return value
 
-    except (KeyError, TypeError):
-        # Key not found - return the key path itself as fallback
+    except TypeError:
         return key_path
 
 
+def _flatten(data, prefix, out):
+    """Store every non-dict value of a nested dict in out under its dotted path."""
+    for key, value in data.items():
+        path = f'{prefix}{key}'
+        if isinstance(value, dict):
+            _flatten(value, path + '.', out)
+        else:
+            out[path] = value
+
+
+class _Placeholders(dict):
+    """Interpolation mapping that leaves unknown placeholders as written."""
+
+    def __missing__(self, key):
+        return f'{{{{ {key} }}}}'
+
+
+@lru_cache(maxsize=None)
+def _format_template(value):
+    """
+    Convert a language string's {{ var }} placeholders to a str.format template.
+
+    Done once per distinct string; the language data itself is left as
+    loaded, since Jekyll reads the same files with Liquid syntax.
+    """
+    parts = _PLACEHOLDER_RE.split(value)
+    # Even indices are literal text (braces escaped), odd are variable names
+    return ''.join(
+        '{' + part + '}' if i % 2 else part.replace('{', '{{').replace('}', '}}')
+        for i, part in enumerate(parts)
+    )
+
+
 def load_site_language():
     """
     Load telar_language setting from _config.yml.
@@ -124,8 +207,7 @@ def load_site_language():
         if not config_path.exists():
             return 'en'
 
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        config = load_yaml_cached(config_path)
 
         return config.get('telar_language', 'en')
     except Exception:
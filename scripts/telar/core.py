@@ -10,9 +10,9 @@ dispatching to the appropriate processor, and writing the resulting JSON.
 reads the file with pandas, filters out comment rows (lines starting with
 `#`) and instruction columns (headers starting with `#`), detects and
 skips duplicate header rows in bilingual spreadsheets, normalises column
-names from Spanish to English, sanitises user data, then hands the
-DataFrame to a processor function (`process_project_setup`,
-`process_objects`, or `process_story`). After processing, it serialises
+names from Spanish to English, sanitises user data when Christmas Tree
+Mode is on, then hands the DataFrame to a processor function
+(`process_project_setup`, `process_objects`, or `process_story`). After processing, it serialises
 the result to JSON, prepending a `_metadata` block with viewer warnings
 if the processor attached any.
 
@@ -25,7 +25,8 @@ checks for Christmas Tree Mode in `_config.yml`, then converts the three
 CSV types in order: project setup, objects, and story files. Story files
 are discovered dynamically — every CSV in `components/structures/` that
 is not a system file (`project.csv`, `objects.csv`, or their Spanish
-equivalents) is treated as a story. After all CSVs are converted, demo
+equivalents) is treated as a story. Stories have no dependencies on each
+other, so they are converted in parallel worker processes. After all CSVs are converted, demo
 content is loaded and merged if available. Protected stories (v0.8.0+)
 are then encrypted using the story_key from _config.yml.
 
@@ -34,21 +35,38 @@ Version: v0.8.0-beta
 
 import os
 import json
+import textwrap
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import pandas as pd
-import yaml
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+from telar.config import load_yaml_cached
 from telar.csv_utils import sanitize_dataframe, normalize_column_names, is_header_row
 from telar.processors.project import process_project_setup
 from telar.processors.objects import process_objects
 from telar.processors.stories import process_story
 from telar.demo import load_demo_bundle, merge_demo_content, fetch_demo_content_if_enabled
-from telar.encryption import encrypt_story, get_protected_stories, get_story_key_from_config
+from telar.json_io import parse_json, read_json, write_json
+from telar.encryption import (
+    encrypt_story, new_story_cipher_key, get_protected_stories, get_story_key_from_config
+)
 from telar.search import generate_search_data
+from telar.widgets import reset_widget_counter
+
+# CSVs in components/structures that are not stories
+_SYSTEM_CSVS = frozenset({'project.csv', 'proyecto.csv', 'objects.csv', 'objetos.csv'})
 
+# Story count from which main() converts stories in a process pool
+_PARALLEL_STORIES = 4
 
-def csv_to_json(csv_path, json_path, process_func=None):
+def csv_to_json(csv_path, json_path, process_func=None, sanitize=True):
     """
     Convert CSV file to JSON.
 
@@ -56,24 +74,40 @@ def csv_to_json(csv_path, json_path, process_func=None):
         csv_path: Path to input CSV file
         json_path: Path to output JSON file
         process_func: Optional function to process the dataframe before conversion
+        sanitize: Strip the Christmas tree emoji from user data (only needed
+            when Christmas Tree Mode is enabled)
+
+    Returns:
+        str: The JSON text written, or None if the CSV was missing or failed
     """
     if not os.path.exists(csv_path):
         print(f"Warning: {csv_path} not found. Skipping.")
-        return
+        return None
 
     try:
         # Read CSV file with pandas
         # Note: We can't use pandas' comment parameter because it treats # anywhere as a comment,
         # which breaks hex color codes like #2c3e50 and markdown headers (## Title) in multi-line cells
-        df = pd.read_csv(csv_path, on_bad_lines='warn')
+        # The C engine is chosen explicitly: pandas' pyarrow engine does not enable
+        # newlines_in_values, so it cannot read those multi-line quoted cells
+        # Columns starting with # (instruction columns) are never parsed; the
+        # first column is always kept because it marks comment rows
+        first_name = pd.read_csv(csv_path, engine='c', nrows=0).columns[0]
+        df = pd.read_csv(csv_path, engine='c', on_bad_lines='warn',
+                         usecols=lambda col: col == first_name or not col.startswith('#'))
 
         # Filter out comment rows (first column value starts with #)
         # This handles both # and "# patterns while preserving markdown headers in multi-line cells
-        first_col = df.columns[0]
-        df = df[~df[first_col].astype(str).str.strip().str.startswith('#')]
+        first_col = df[first_name]
+        if not pd.api.types.is_string_dtype(first_col):
+            first_col = first_col.astype(str)
+        comment_rows = first_col.str.match(r'\s*#', na=False)
+        if comment_rows.any():
+            df = df[~comment_rows]
 
-        # Filter out columns starting with # (instruction columns)
-        df = df[[col for col in df.columns if not col.startswith('#')]]
+        # Drop the first column too if it is an instruction column
+        if first_name.startswith('#'):
+            df = df.drop(columns=first_name)
 
         # Check if first data row is actually a duplicate header row (bilingual CSVs)
         if len(df) > 0:
@@ -86,14 +120,15 @@ def csv_to_json(csv_path, json_path, process_func=None):
         df = normalize_column_names(df)
 
         # Sanitize user data - remove Christmas tree emoji to prevent accidental triggering
-        df = sanitize_dataframe(df)
+        if sanitize:
+            df = sanitize_dataframe(df)
 
         # Apply processing function if provided
         if process_func:
             df = process_func(df)
 
-        # Convert to JSON
-        data = df.to_dict('records')
+        # Convert to JSON (encoded by pandas, without building a list of dicts)
+        records = df.to_json(orient='records', indent=2, force_ascii=False, double_precision=15)
 
         # If dataframe has metadata (e.g., viewer warnings), prepend as first element
         if hasattr(df, 'attrs') and 'viewer_warnings' in df.attrs:
@@ -103,19 +138,26 @@ def csv_to_json(csv_path, json_path, process_func=None):
                     '_metadata': True,
                     'viewer_warnings': viewer_warnings
                 }
-                data.insert(0, metadata)
+                metadata_json = json.dumps(metadata, indent=2, ensure_ascii=False)
+                body = records.strip()[1:-1].strip()
+                records = '[\n' + textwrap.indent(metadata_json, '  ')
+                if body:
+                    records += ',\n  ' + body
+                records += '\n]'
 
         # Write JSON file
         with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.write(records)
 
         print(f"\u2713 Converted {csv_path} to {json_path}")
+        return records
 
     except Exception as e:
         print(f"❌ Error converting {csv_path}: {e}")
+        return None
 
 
-def find_csv_with_fallback(base_path, spanish_name):
+def find_csv_with_fallback(base_path, spanish_name, available=None):
     """
     Find CSV file with bilingual fallback support.
     Checks for English name first, then Spanish equivalent.
@@ -123,6 +165,8 @@ def find_csv_with_fallback(base_path, spanish_name):
     Args:
         base_path: Base path like 'components/structures/project'
         spanish_name: Spanish filename like 'proyecto'
+        available: Optional set of filenames already listed from the base
+            path's directory, checked instead of stat-ing each candidate
 
     Returns:
         str: Path to found CSV file, or original English path if neither exists
@@ -130,9 +174,14 @@ def find_csv_with_fallback(base_path, spanish_name):
     english_path = f'{base_path}.csv'
     spanish_path = f'{base_path.rsplit("/", 1)[0]}/{spanish_name}.csv'
 
-    if Path(english_path).exists():
+    def exists(path):
+        if available is None:
+            return Path(path).exists()
+        return os.path.basename(path) in available
+
+    if exists(english_path):
         return english_path
-    elif Path(spanish_path).exists():
+    elif exists(spanish_path):
         print(f"  [INFO] Using Spanish file: {spanish_name}.csv")
         return spanish_path
     else:
@@ -140,7 +189,69 @@ def find_csv_with_fallback(base_path, spanish_name):
         return english_path
 
 
-def _encrypt_protected_stories(data_dir):
+def _read_protected_stories(project_path):
+    """
+    Collect the protected story IDs listed in project.json.
+
+    With ijson installed, only the story entries are streamed out of the
+    file and only protected ones are kept; otherwise the whole file is
+    parsed.
+
+    Args:
+        project_path: Path to project.json
+
+    Returns:
+        set: Protected story IDs
+    """
+    if ijson is None:
+        return get_protected_stories(read_json(project_path))
+
+    with open(project_path, 'rb') as f:
+        stories = [story for story in ijson.items(f, 'item.stories.item')
+                   if story.get('protected')]
+    return get_protected_stories([{'stories': stories}])
+
+
+def _convert_story(csv_path, json_path, process_func, sanitize):
+    """
+    Convert one story CSV to JSON (run in a worker process by main()).
+
+    Args:
+        csv_path: Path to the story CSV file
+        json_path: Path to the output JSON file
+        process_func: Story processor (process_story, or a partial of it)
+        sanitize: Whether to strip the Christmas tree emoji from user data
+
+    Returns:
+        str: The JSON text written, or None if conversion failed
+    """
+    # Number widgets per story, independent of which worker converts it
+    reset_widget_counter()
+    return csv_to_json(csv_path, json_path, process_func, sanitize=sanitize)
+
+
+def _convert_stories(story_jobs):
+    """
+    Convert story CSVs to JSON, in parallel processes for larger sites.
+
+    Starting a process pool costs more than converting a few stories, so
+    sites with fewer than _PARALLEL_STORIES stories convert them in turn.
+
+    Args:
+        story_jobs: List of _convert_story argument tuples
+
+    Returns:
+        list: The JSON text written for each job (None where conversion failed)
+    """
+    if len(story_jobs) < _PARALLEL_STORIES:
+        return [_convert_story(*job) for job in story_jobs]
+
+    # Stories are independent; convert them in parallel processes
+    with ProcessPoolExecutor(max_workers=min(len(story_jobs), os.cpu_count() or 1)) as executor:
+        return list(executor.map(_convert_story, *zip(*story_jobs)))
+
+
+def _encrypt_protected_stories(data_dir, converted=None):
     """
     Encrypt story JSON files that are marked as protected.
 
@@ -149,15 +260,18 @@ def _encrypt_protected_stories(data_dir):
 
     Args:
         data_dir: Path to _data directory containing JSON files
+        converted: Optional dict of story_id -> JSON text written earlier in
+            this build; those stories are not read back from disk
     """
+    converted = converted or {}
+
     # Read _config.yml for story_key
     config_path = Path('_config.yml')
     if not config_path.exists():
         return
 
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        config = load_yaml_cached(config_path)
     except Exception as e:
         print(f"  [WARN] Could not read _config.yml: {e}")
         return
@@ -170,14 +284,11 @@ def _encrypt_protected_stories(data_dir):
         return
 
     try:
-        with open(project_path, 'r', encoding='utf-8') as f:
-            project_data = json.load(f)
+        protected_stories = _read_protected_stories(project_path)
     except Exception as e:
         print(f"  [WARN] Could not read project.json: {e}")
         return
 
-    protected_stories = get_protected_stories(project_data)
-
     if not protected_stories:
         print("No protected stories found.")
         return
@@ -189,25 +300,27 @@ def _encrypt_protected_stories(data_dir):
 
     print(f"Encrypting {len(protected_stories)} protected story/stories...")
 
+    # Run PBKDF2 once for the build; every story gets its own IV
+    cipher_key = new_story_cipher_key(story_key)
+
     for story_id in protected_stories:
         # Story JSON filename matches story_id or CSV filename
         story_json = data_dir / f"{story_id}.json"
 
-        if not story_json.exists():
+        text = converted.get(story_id)
+        if text is None and not story_json.exists():
             print(f"  ⚠️ Story JSON not found: {story_json}")
             continue
 
         try:
-            # Read story data
-            with open(story_json, 'r', encoding='utf-8') as f:
-                story_data = json.load(f)
+            # Read story data (from this build's output if we have it)
+            story_data = parse_json(text) if text is not None else read_json(story_json)
 
             # Encrypt story
-            encrypted = encrypt_story(story_data, story_key)
+            encrypted = encrypt_story(story_data, story_key, cipher_key)
 
             # Write encrypted data back
-            with open(story_json, 'w', encoding='utf-8') as f:
-                json.dump(encrypted, f, indent=2, ensure_ascii=False)
+            write_json(story_json, encrypted)
 
             print(f"  🔒 Encrypted {story_json.name}")
 
@@ -225,85 +338,85 @@ def main():
     try:
         config_path = Path('_config.yml')
         if config_path.exists():
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-                # Check development-features (v0.6.2+) or testing-features (legacy)
-                dev_features = config.get('development-features', config.get('testing-features', {}))
-                christmas_tree_mode = dev_features.get('christmas_tree_mode', False)
-
-                if christmas_tree_mode:
-                    print("\U0001f384 Christmas Tree Mode enabled - injecting test objects with errors")
-                else:
-                    # Clean up test object files when Christmas Tree Mode is disabled
-                    objects_dir = Path('_jekyll-files/_objects')
-                    if objects_dir.exists():
-                        test_files = list(objects_dir.glob('test-*.md'))
-                        if test_files:
-                            print("  [INFO] Cleaning up test object files from previous Christmas Tree Mode session")
-                            for test_file in test_files:
-                                test_file.unlink()
-                                print(f"  [INFO] Removed {test_file.name}")
+            config = load_yaml_cached(config_path)
+            # Check development-features (v0.6.2+) or testing-features (legacy)
+            dev_features = config.get('development-features', config.get('testing-features', {}))
+            christmas_tree_mode = dev_features.get('christmas_tree_mode', False)
+
+            if christmas_tree_mode:
+                print("\U0001f384 Christmas Tree Mode enabled - injecting test objects with errors")
+            else:
+                # Clean up test object files when Christmas Tree Mode is disabled
+                objects_dir = Path('_jekyll-files/_objects')
+                if objects_dir.exists():
+                    test_files = list(objects_dir.glob('test-*.md'))
+                    if test_files:
+                        print("  [INFO] Cleaning up test object files from previous Christmas Tree Mode session")
+                        for test_file in test_files:
+                            test_file.unlink()
+                            print(f"  [INFO] Removed {test_file.name}")
     except Exception as e:
         print(f"  [WARN] Could not read Christmas Tree Mode setting: {e}")
 
+    # Bind the processors once for this build's mode
+    if christmas_tree_mode:
+        objects_func = partial(process_objects, christmas_tree=True)
+        story_func = partial(process_story, christmas_tree=True)
+    else:
+        objects_func = process_objects
+        story_func = process_story
+
     data_dir = Path('_data')
     data_dir.mkdir(exist_ok=True)
 
     structures_dir = Path('components/structures')
 
+    # List the structures directory once for every CSV lookup below
+    try:
+        with os.scandir(structures_dir) as entries:
+            structure_files = {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        structure_files = set()
+
     print("Converting CSV files to JSON...")
     print("-" * 50)
 
     # Convert project setup (with bilingual fallback: project.csv or proyecto.csv)
-    project_path = find_csv_with_fallback('components/structures/project', 'proyecto')
+    project_path = find_csv_with_fallback('components/structures/project', 'proyecto', structure_files)
     csv_to_json(
         project_path,
         '_data/project.json',
-        process_project_setup
+        process_project_setup,
+        sanitize=christmas_tree_mode
     )
 
     # Convert objects (with bilingual fallback: objects.csv or objetos.csv)
-    objects_path = find_csv_with_fallback('components/structures/objects', 'objetos')
-    if christmas_tree_mode:
-        csv_to_json(
-            objects_path,
-            '_data/objects.json',
-            lambda df: process_objects(df, christmas_tree=True)
-        )
-    else:
-        csv_to_json(
-            objects_path,
-            '_data/objects.json',
-            process_objects
-        )
+    objects_path = find_csv_with_fallback('components/structures/objects', 'objetos', structure_files)
+    csv_to_json(
+        objects_path,
+        '_data/objects.json',
+        objects_func,
+        sanitize=christmas_tree_mode
+    )
 
     # Generate search data for gallery filtering (if enabled in config)
     generate_search_data()
 
     # Convert story files (with optional Christmas Tree mode)
     # v0.6.0+: Process ALL CSVs except system files
-    system_csvs = {'project.csv', 'proyecto.csv', 'objects.csv', 'objetos.csv'}
-
-    if christmas_tree_mode:
-        for csv_file in structures_dir.glob('*.csv'):
-            if csv_file.name not in system_csvs:
-                json_filename = csv_file.stem + '.json'
-                json_file = data_dir / json_filename
-                csv_to_json(
-                    str(csv_file),
-                    str(json_file),
-                    lambda df: process_story(df, christmas_tree=True)
-                )
-    else:
-        for csv_file in structures_dir.glob('*.csv'):
-            if csv_file.name not in system_csvs:
-                json_filename = csv_file.stem + '.json'
-                json_file = data_dir / json_filename
-                csv_to_json(
-                    str(csv_file),
-                    str(json_file),
-                    process_story
-                )
+    story_jobs = [
+        (str(structures_dir / name), str(data_dir / (name[:-4] + '.json')), story_func, christmas_tree_mode)
+        for name in sorted(structure_files)
+        if name.endswith('.csv') and not name.startswith('.') and name not in _SYSTEM_CSVS
+    ]
+    story_texts = _convert_stories(story_jobs)
+
+    # Keep the JSON just written so encryption doesn't read it back
+    converted_stories = {
+        Path(json_path).stem: text
+        for (_, json_path, _, _), text in zip(story_jobs, story_texts)
+        if text is not None
+    }
 
     # Merge demo content if available
     print("-" * 50)
@@ -311,10 +424,13 @@ def main():
     if demo_bundle:
         print("Merging demo content...")
         merge_demo_content(demo_bundle)
+        # Demo stories are written over any same-named story file
+        for story_id in demo_bundle.get('stories') or {}:
+            converted_stories.pop(story_id, None)
 
     # Encrypt protected stories (v0.8.0+)
     print("-" * 50)
-    _encrypt_protected_stories(data_dir)
+    _encrypt_protected_stories(data_dir, converted_stories)
 
     print("-" * 50)
     print("Conversion complete!")
@@ -100,6 +100,16 @@ COLUMN_NAME_MAPPING = {
     'terminos_relacionados': 'related_terms',
 }
 
+# All valid column names (English and Spanish), plus common column names
+# not in the mapping; used by is_header_row()
+_VALID_COLUMN_NAMES = frozenset(COLUMN_NAME_MAPPING) | frozenset(COLUMN_NAME_MAPPING.values()) | frozenset([
+    'x', 'y', 'zoom', 'order', 'story_id', 'title', 'subtitle',
+    'byline', 'object_id', 'description', 'source_url', 'creator',
+    'period', 'medium', 'dimensions', 'location', 'source', 'credit',
+    'thumbnail', 'year', 'object_type', 'subjects', 'featured',
+    'protected',
+])
+
 
 def sanitize_dataframe(df):
     """
@@ -112,14 +122,15 @@ def sanitize_dataframe(df):
     Returns:
         DataFrame: Sanitized dataframe (copy of input)
     """
-    import re
     # Christmas tree emoji: U+1F384
     tree_emoji = chr(0x1F384)
-    tree_pattern = re.compile(re.escape(tree_emoji))
     df = df.copy()
     for col in df.columns:
         if pd.api.types.is_string_dtype(df[col]):  # String columns (works with pandas 2.x and 3.x)
-            df[col] = df[col].apply(lambda x: tree_pattern.sub('', str(x)) if pd.notna(x) else x)
+            # Most columns never contain the emoji; skip them without rewriting
+            if not df[col].str.contains(tree_emoji, regex=False, na=False).any():
+                continue
+            df[col] = df[col].str.replace(tree_emoji, '', regex=False)
 
     return df
 
@@ -166,10 +177,14 @@ def normalize_column_names(df):
     # Create a mapping for this dataframe's columns
     rename_map = {}
     for col in df.columns:
-        col_lower = col.lower().strip()
-        if col_lower in COLUMN_NAME_MAPPING:
-            rename_map[col] = COLUMN_NAME_MAPPING[col_lower]
-            print(f"  [INFO] Normalized column '{col}' -> '{COLUMN_NAME_MAPPING[col_lower]}'")
+        # Mapping keys are already lowercase and stripped, so try the header
+        # as written before normalising it
+        english = COLUMN_NAME_MAPPING.get(col)
+        if english is None:
+            english = COLUMN_NAME_MAPPING.get(col.lower().strip())
+        if english is not None:
+            rename_map[col] = english
+            print(f"  [INFO] Normalized column '{col}' -> '{english}'")
 
     # Rename columns if any mappings found
     if rename_map:
@@ -188,25 +203,12 @@ def is_header_row(row_values):
     Returns:
         bool: True if row appears to be a header row
     """
-    # Get all valid column names (English and Spanish)
-    valid_names = set(COLUMN_NAME_MAPPING.keys()) | set(COLUMN_NAME_MAPPING.values())
-
-    # Also include common column names not in the mapping
-    valid_names.update(['x', 'y', 'zoom', 'order', 'story_id', 'title', 'subtitle',
-                        'byline', 'object_id', 'description', 'source_url', 'creator',
-                        'period', 'medium', 'dimensions', 'location', 'source', 'credit',
-                        'thumbnail', 'year', 'object_type', 'subjects', 'featured',
-                        'protected'])
-
-    # Count how many cells match known column names
-    matches = 0
-    total = 0
-    for val in row_values:
-        if pd.notna(val):
-            val_lower = str(val).lower().strip()
-            total += 1
-            if val_lower in valid_names:
-                matches += 1
+    # Normalise the non-empty cells (one vectorized NA check for the row)
+    cells = [str(val).lower().strip()
+             for val, present in zip(row_values, pd.notna(row_values)) if present]
+    if not cells:
+        return False
 
     # If 80%+ of non-empty cells are column names, it's a header row
-    return total > 0 and (matches / total) >= 0.8
+    matches = sum(1 for cell in cells if cell in _VALID_COLUMN_NAMES)
+    return matches / len(cells) >= 0.8
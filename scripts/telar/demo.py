@@ -34,35 +34,81 @@ regular stories use.
 Version: v0.7.0-beta
 """
 
-import json
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 import markdown as md_lib
 import pandas as pd
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 from telar.images import process_images
-from telar.widgets import process_widgets
+from telar.widgets import process_widgets, reset_widget_counter
 from telar.glossary import process_glossary_links
+from telar.json_io import read_json, write_json
+
+# Where fetch_demo_content.py saves the bundle
+_DEMO_BUNDLE_PATH = Path('_demo_content/telar-demo-bundle.json')
+
+# Seconds to wait for fetch_demo_content.py (network fetch)
+_FETCH_TIMEOUT = 60
+
+# Bundles at least this large are streamed with ijson (when installed)
+# instead of being read into memory before parsing
+_STREAM_BUNDLE_BYTES = 10 * 1024 * 1024
+
+# Bundles with at least this many stories are built in worker processes
+_PARALLEL_DEMO_STORIES = 4
+
+# One converter per process, reset between layers, instead of building a
+# new Markdown instance (and re-registering extensions) for every layer
+_MARKDOWN = md_lib.Markdown(extensions=['extra', 'nl2br'])
+
+
+@lru_cache(maxsize=2048)
+def _render_layer_markdown(content):
+    """
+    Process images and convert layer markdown to HTML.
+
+    Both steps are pure string transforms, so results are cached: demo
+    stories often repeat the same intro/outro layers. Widgets (which number
+    their IDs) and glossary links stay outside the cache.
+    """
+    return _MARKDOWN.reset().convert(process_images(content))
 
 
 def load_demo_bundle():
     """
     Load demo content bundle if it exists.
 
+    Large bundles are decoded straight from the file one top-level section
+    at a time when ijson is installed, so the raw file contents are never
+    held in memory next to the parsed data.
+
     Returns:
         dict: Demo bundle data, or None if not present
     """
-    bundle_path = Path('_demo_content/telar-demo-bundle.json')
+    bundle_path = _DEMO_BUNDLE_PATH
 
     if not bundle_path.exists():
         return None
 
     try:
-        with open(bundle_path, 'r', encoding='utf-8') as f:
-            bundle = json.load(f)
-
-        meta = bundle.get('_meta', {})
-        print(f"[INFO] Loaded demo bundle v{meta.get('telar_version', 'unknown')} ({meta.get('language', 'unknown')})")
+        if ijson is not None and bundle_path.stat().st_size >= _STREAM_BUNDLE_BYTES:
+            with open(bundle_path, 'rb') as f:
+                bundle = dict(ijson.kvitems(f, '', use_float=True))
+        else:
+            bundle = read_json(bundle_path)
+
+        meta = bundle.get('_meta') or {}
+        get = meta.get
+        print(f"[INFO] Loaded demo bundle v{get('telar_version', 'unknown')} ({get('language', 'unknown')})")
         return bundle
 
     except Exception as e:
@@ -70,6 +116,75 @@ def load_demo_bundle():
         return None
 
 
+def _build_demo_story(task):
+    """
+    Convert one demo bundle story to the user story format and write it.
+
+    Module-level so merge_demo_content() can run it in worker processes.
+
+    Args:
+        task: Tuple of (story_id, story_data, glossary_terms, data_dir)
+
+    Returns:
+        tuple: (story_id, step count, None) on success, or
+            (story_id, None, error message) on failure
+    """
+    story_id, story_data, glossary_terms, data_dir = task
+
+    try:
+        # Number widgets per story, independent of which worker builds it
+        reset_widget_counter()
+
+        # Convert demo story format to match user format
+        steps = []
+        for step in story_data.get('steps', []):
+            get = step.get
+            step_data = {
+                'step': get('step'),
+                'object': get('object', ''),
+                'x': str(get('x', '0.5')),
+                'y': str(get('y', '0.5')),
+                'zoom': str(get('zoom', '1')),
+                'question': get('question', ''),
+                'answer': get('answer', ''),
+                '_demo': True
+            }
+
+            # Process layers
+            layers = step.get('layers', {})
+            for layer_key in ['layer1', 'layer2']:
+                layer = layers.get(layer_key, {})
+                if layer:
+                    step_data[f'{layer_key}_button'] = layer.get('button', '')
+                    # Use explicit title if provided, fall back to button text
+                    step_data[f'{layer_key}_title'] = layer.get('title', layer.get('button', ''))
+
+                    content = layer.get('content', '')
+                    if content:
+                        # Initialize warnings list for widget processing
+                        widget_warnings = []
+
+                        # Process widgets BEFORE markdown conversion
+                        content = process_widgets(content, f'demo-{story_id}', widget_warnings)
+
+                        # Process images (sizes and captions), then convert markdown to HTML
+                        content = _render_layer_markdown(content)
+
+                        # Process glossary links AFTER markdown conversion
+                        content = process_glossary_links(content, glossary_terms)
+
+                    step_data[f'{layer_key}_text'] = content
+                    step_data[f'{layer_key}_demo'] = True  # All demo bundle layers are demo content
+
+            steps.append(step_data)
+
+        write_json(Path(data_dir) / f'{story_id}.json', steps)
+        return story_id, len(steps), None
+
+    except Exception as e:
+        return story_id, None, str(e)
+
+
 def merge_demo_content(bundle):
     """
     Merge demo bundle content with user content.
@@ -85,12 +200,25 @@ def merge_demo_content(bundle):
     """
     data_dir = Path('_data')
 
+    # One pass over the bundle glossary builds both the term_id -> title map
+    # used for link processing and the entries for demo-glossary.json
+    glossary_terms = {}
+    glossary_data = []
+    for term_id, term_data in (bundle.get('glossary') or {}).items():
+        title = term_data.get('term', term_id)
+        glossary_terms[term_id] = title
+        glossary_data.append({
+            'term_id': term_id,
+            'title': title,
+            'content': term_data.get('content', ''),
+            '_demo': True
+        })
+
     # Merge projects
     project_path = data_dir / 'project.json'
     if project_path.exists() and bundle.get('project'):
         try:
-            with open(project_path, 'r', encoding='utf-8') as f:
-                user_project = json.load(f)
+            user_project = read_json(project_path)
 
             # Convert demo project format to match user format
             # Use order for number field, story_id for identifier (v0.6.0+)
@@ -111,8 +239,7 @@ def merge_demo_content(bundle):
             else:
                 user_project[0]['stories'] = demo_stories
 
-            with open(project_path, 'w', encoding='utf-8') as f:
-                json.dump(user_project, f, indent=2, ensure_ascii=False)
+            write_json(project_path, user_project)
 
             print(f"  Merged {len(demo_stories)} demo project(s) into project.json")
 
@@ -123,122 +250,68 @@ def merge_demo_content(bundle):
     objects_path = data_dir / 'objects.json'
     if objects_path.exists() and bundle.get('objects'):
         try:
-            with open(objects_path, 'r', encoding='utf-8') as f:
-                user_objects = json.load(f)
+            user_objects = read_json(objects_path)
 
-            # Get existing object IDs to avoid duplicates
-            existing_ids = {obj.get('object_id') for obj in user_objects if not obj.get('_metadata')}
+            # Get existing object IDs to avoid duplicates (user objects keep
+            # their order; demo objects are appended after them)
+            existing_ids = {
+                obj['object_id'] for obj in user_objects
+                if obj.get('object_id') and not obj.get('_metadata')
+            }
 
             # Convert demo objects format and add new ones
-            demo_count = 0
-            for obj_id, obj_data in bundle['objects'].items():
-                if obj_id not in existing_ids:
-                    demo_obj = {
-                        'object_id': obj_id,
-                        'title': obj_data.get('title', ''),
-                        'description': obj_data.get('description', ''),
-                        'source_url': obj_data.get('source_url', ''),
-                        'iiif_manifest': obj_data.get('source_url', ''),  # Backward compat
-                        'creator': obj_data.get('creator', ''),
-                        'period': obj_data.get('period', ''),
-                        'medium': obj_data.get('medium', ''),
-                        'dimensions': obj_data.get('dimensions', ''),
-                        'location': obj_data.get('location', ''),
-                        'credit': obj_data.get('credit', ''),
-                        'thumbnail': obj_data.get('thumbnail', ''),
-                        '_demo': True
-                    }
-                    user_objects.append(demo_obj)
-                    demo_count += 1
-
-            with open(objects_path, 'w', encoding='utf-8') as f:
-                json.dump(user_objects, f, indent=2, ensure_ascii=False)
-
-            print(f"  Merged {demo_count} demo object(s) into objects.json")
+            demo_objects = [
+                {
+                    'object_id': obj_id,
+                    'title': obj_data.get('title', ''),
+                    'description': obj_data.get('description', ''),
+                    'source_url': obj_data.get('source_url', ''),
+                    'iiif_manifest': obj_data.get('source_url', ''),  # Backward compat
+                    'creator': obj_data.get('creator', ''),
+                    'period': obj_data.get('period', ''),
+                    'medium': obj_data.get('medium', ''),
+                    'dimensions': obj_data.get('dimensions', ''),
+                    'location': obj_data.get('location', ''),
+                    'credit': obj_data.get('credit', ''),
+                    'thumbnail': obj_data.get('thumbnail', ''),
+                    '_demo': True
+                }
+                for obj_id, obj_data in bundle['objects'].items()
+                if obj_id not in existing_ids
+            ]
+            user_objects.extend(demo_objects)
+
+            write_json(objects_path, user_objects)
+
+            print(f"  Merged {len(demo_objects)} demo object(s) into objects.json")
 
         except Exception as e:
             print(f"  [WARN] Could not merge demo objects: {e}")
 
     # Create demo story files
     if bundle.get('stories'):
-        for story_id, story_data in bundle['stories'].items():
-            try:
-                story_path = data_dir / f'{story_id}.json'
-
-                # Convert demo story format to match user format
-                steps = []
-                for step in story_data.get('steps', []):
-                    step_data = {
-                        'step': step.get('step'),
-                        'object': step.get('object', ''),
-                        'x': str(step.get('x', '0.5')),
-                        'y': str(step.get('y', '0.5')),
-                        'zoom': str(step.get('zoom', '1')),
-                        'question': step.get('question', ''),
-                        'answer': step.get('answer', ''),
-                        '_demo': True
-                    }
-
-                    # Build glossary terms dict from bundle for link processing
-                    glossary_terms = {}
-                    if bundle.get('glossary'):
-                        for term_id, term_data in bundle['glossary'].items():
-                            glossary_terms[term_id] = term_data.get('term', term_id)
-
-                    # Process layers
-                    layers = step.get('layers', {})
-                    for layer_key in ['layer1', 'layer2']:
-                        layer = layers.get(layer_key, {})
-                        if layer:
-                            step_data[f'{layer_key}_button'] = layer.get('button', '')
-                            # Use explicit title if provided, fall back to button text
-                            step_data[f'{layer_key}_title'] = layer.get('title', layer.get('button', ''))
-
-                            content = layer.get('content', '')
-                            if content:
-                                # Initialize warnings list for widget processing
-                                widget_warnings = []
-
-                                # Process widgets BEFORE markdown conversion
-                                content = process_widgets(content, f'demo-{story_id}', widget_warnings)
-
-                                # Process images (sizes and captions) BEFORE markdown conversion
-                                content = process_images(content)
-
-                                # Convert markdown to HTML
-                                content = md_lib.markdown(content, extensions=['extra', 'nl2br'])
-
-                                # Process glossary links AFTER markdown conversion
-                                content = process_glossary_links(content, glossary_terms)
-
-                            step_data[f'{layer_key}_text'] = content
-                            step_data[f'{layer_key}_demo'] = True  # All demo bundle layers are demo content
-
-                    steps.append(step_data)
-
-                with open(story_path, 'w', encoding='utf-8') as f:
-                    json.dump(steps, f, indent=2, ensure_ascii=False)
-
-                print(f"  Created demo story: {story_id}.json ({len(steps)} steps)")
-
-            except Exception as e:
-                print(f"  [WARN] Could not create demo story {story_id}: {e}")
+        tasks = [
+            (story_id, story_data, glossary_terms, data_dir)
+            for story_id, story_data in bundle['stories'].items()
+        ]
+        if len(tasks) < _PARALLEL_DEMO_STORIES:
+            outcomes = [_build_demo_story(task) for task in tasks]
+        else:
+            # Stories are independent; build them in parallel processes
+            with ProcessPoolExecutor() as executor:
+                outcomes = list(executor.map(_build_demo_story, tasks, chunksize=4))
+
+        for story_id, step_count, error in outcomes:
+            if error is None:
+                print(f"  Created demo story: {story_id}.json ({step_count} steps)")
+            else:
+                print(f"  [WARN] Could not create demo story {story_id}: {error}")
 
     # Write demo glossary to _data/demo-glossary.json
     # (generate_collections.py will read this and create Jekyll collection files)
-    if bundle.get('glossary'):
-        glossary_data = []
-        for term_id, term_data in bundle['glossary'].items():
-            glossary_data.append({
-                'term_id': term_id,
-                'title': term_data.get('term', term_id),
-                'content': term_data.get('content', ''),
-                '_demo': True
-            })
-
+    if glossary_data:
         glossary_json_path = Path('_data/demo-glossary.json')
-        with open(glossary_json_path, 'w', encoding='utf-8') as f:
-            json.dump(glossary_data, f, indent=2, ensure_ascii=False)
+        write_json(glossary_json_path, glossary_data)
 
         print(f"  Created _data/demo-glossary.json ({len(glossary_data)} demo terms)")
 
@@ -248,21 +321,22 @@ def fetch_demo_content_if_enabled():
     Automatically fetch demo content bundle before processing CSVs.
 
     Runs fetch_demo_content.py as a subprocess to ensure the demo bundle
-    is available before csv_to_json.py attempts to load and merge it.
+    is available before csv_to_json.py attempts to load and merge it. A
+    subprocess (rather than an in-process call) means a fetch that exceeds
+    the timeout is actually killed instead of running on alongside the
+    build.
 
     Returns:
         None
     """
-    import subprocess
-
     try:
         # Run fetch_demo_content.py to ensure bundle exists
         # This checks config and either fetches, cleans up, or no-ops accordingly
         result = subprocess.run(
-            ['python3', 'scripts/fetch_demo_content.py'],
+            [sys.executable, 'scripts/fetch_demo_content.py'],
             capture_output=True,
             text=True,
-            timeout=60  # 60 second timeout for network fetch
+            timeout=_FETCH_TIMEOUT  # network fetch
         )
 
         # Print output so users see what happened
@@ -270,7 +344,10 @@ def fetch_demo_content_if_enabled():
             print(result.stdout)
 
     except subprocess.TimeoutExpired:
-        # Network fetch took too long - continue without demo content
+        # Network fetch took too long - continue without demo content.
+        # The fetcher clears old content before downloading, so anything
+        # left behind is a partial write from the killed process
+        _DEMO_BUNDLE_PATH.unlink(missing_ok=True)
         print("[WARN] Demo content fetch timed out (skipping)")
         print("[WARN] Your site will build without demo content")
 
@@ -8,21 +8,23 @@ decrypts them at runtime using the Web Crypto API.
 The encryption uses:
 - PBKDF2 with 100,000 iterations for key derivation
 - AES-256-GCM for authenticated encryption
-- Random salt (16 bytes) and IV (12 bytes) per story
+- Random salt (16 bytes) per build and random IV (12 bytes) per story
 
 The encrypted format stores salt and IV alongside the ciphertext so the
-browser can derive the same key and decrypt the content.
+browser can derive the same key and decrypt the content. PBKDF2 is by far
+the most expensive step, so a build derives the key once with
+`new_story_cipher_key()` and passes it to `encrypt_story()` for every
+protected story; each story still gets its own IV.
 
 Version: v0.8.0-beta
 """
 
-import base64
+import hashlib
 import json
 import os
+from binascii import b2a_base64
 
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.primitives import hashes
 
 
 # PBKDF2 iterations — must match the JavaScript decryption code
@@ -40,22 +42,35 @@ def derive_key(password: str, salt: bytes) -> bytes:
     Returns:
         32-byte derived key for AES-256
     """
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=32,
-        salt=salt,
-        iterations=PBKDF2_ITERATIONS,
+    # hashlib runs the whole loop inside OpenSSL; same output as PBKDF2HMAC
+    return hashlib.pbkdf2_hmac(
+        'sha256', password.encode('utf-8'), salt, PBKDF2_ITERATIONS, dklen=32
     )
-    return kdf.derive(password.encode('utf-8'))
 
 
-def encrypt_story(story_data: list, story_key: str) -> dict:
+def new_story_cipher_key(story_key: str) -> tuple:
+    """
+    Generate a random salt and derive the AES key for it.
+
+    Args:
+        story_key: User-provided encryption key from _config.yml
+
+    Returns:
+        Tuple of (salt, derived key), for encrypt_story()
+    """
+    salt = os.urandom(16)
+    return salt, derive_key(story_key, salt)
+
+
+def encrypt_story(story_data: list, story_key: str, cipher_key: tuple = None) -> dict:
     """
     Encrypt story JSON data using AES-GCM.
 
     Args:
         story_data: List of story steps (the full story JSON)
         story_key: User-provided encryption key from _config.yml
+        cipher_key: Optional (salt, key) from new_story_cipher_key(), reused
+            across stories to skip PBKDF2; a fresh one is derived if omitted
 
     Returns:
         dict with encrypted format:
@@ -66,24 +81,28 @@ def encrypt_story(story_data: list, story_key: str) -> dict:
             "ciphertext": base64-encoded encrypted data
         }
     """
-    # Generate random salt and IV
-    salt = os.urandom(16)
-    iv = os.urandom(12)  # 96 bits for AES-GCM
-
-    # Derive encryption key from user's key
-    key = derive_key(story_key, salt)
+    if cipher_key:
+        # Shared key for the build; random IV for every story
+        salt, key = cipher_key
+        iv = os.urandom(12)  # 96 bits for AES-GCM
+    else:
+        # Draw salt (16 bytes) and IV (12 bytes) in one call, then derive
+        # the encryption key from user's key
+        random_bytes = os.urandom(28)
+        salt, iv = random_bytes[:16], random_bytes[16:]
+        key = derive_key(story_key, salt)
 
     # Encrypt story data
     aesgcm = AESGCM(key)
     plaintext = json.dumps(story_data, ensure_ascii=False).encode('utf-8')
     ciphertext = aesgcm.encrypt(iv, plaintext, None)
 
-    # Return encrypted format
+    # Return encrypted format (standard base64, no trailing newline)
     return {
         'encrypted': True,
-        'salt': base64.b64encode(salt).decode('ascii'),
-        'iv': base64.b64encode(iv).decode('ascii'),
-        'ciphertext': base64.b64encode(ciphertext).decode('ascii')
+        'salt': b2a_base64(salt, newline=False).decode('ascii'),
+        'iv': b2a_base64(iv, newline=False).decode('ascii'),
+        'ciphertext': b2a_base64(ciphertext, newline=False).decode('ascii')
     }
 
 
@@ -97,18 +116,13 @@ def get_protected_stories(project_data: list) -> set:
     Returns:
         Set of story identifiers (story_id or story number) that are protected
     """
-    protected = set()
-
-    for item in project_data:
-        if 'stories' in item:
-            for story in item['stories']:
-                if story.get('protected'):
-                    # Use story_id if available, otherwise use number
-                    story_id = story.get('story_id') or story.get('number')
-                    if story_id:
-                        protected.add(str(story_id))
-
-    return protected
+    # Use story_id if available, otherwise use number
+    return {
+        str(story_id)
+        for item in project_data if 'stories' in item
+        for story in item['stories']
+        if story.get('protected') and (story_id := story.get('story_id') or story.get('number'))
+    }
 
 
 def get_story_key_from_config(config: dict) -> str:
@@ -36,10 +36,24 @@ story's intro panel.
 Version: v0.8.0-beta
 """
 
+import csv
 import re
 from pathlib import Path
-import pandas as pd
 from telar.config import get_lang_string
+from telar.csv_utils import COLUMN_NAME_MAPPING
+
+# Pattern: [[display|term]] or [[term]] with flexible spacing
+# Captures: (optional_display) | (term_id)
+_GLOSSARY_LINK_RE = re.compile(r'\[\[\s*([^|\]]+?)(?:\s*\|\s*([^|\]]+?))?\s*\]\]')
+
+# Glossary link markup; demo terms (prefixed with demo-) get data-demo
+_LINK_TEMPLATE = '<a href="#" class="glossary-inline-link" data-term-id="%s">%s</a>'
+_DEMO_LINK_TEMPLATE = '<a href="#" class="glossary-inline-link" data-term-id="%s" data-demo="true">%s</a>'
+
+# Frontmatter fields of legacy glossary markdown files
+_FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+_TERM_ID_RE = re.compile(r'term_id:\s*(\S+)')
+_TITLE_RE = re.compile(r'title:\s*["\']?(.*?)["\']?\s*$', re.MULTILINE)
 
 
 def load_glossary_from_csv(csv_path):
@@ -55,23 +69,36 @@ def load_glossary_from_csv(csv_path):
     glossary_terms = {}
 
     try:
-        df = pd.read_csv(csv_path)
-
-        # Normalize column names (lowercase + bilingual mapping)
-        df.columns = df.columns.str.lower().str.strip()
-        from telar.csv_utils import normalize_column_names
-        df = normalize_column_names(df)
-
-        if 'term_id' not in df.columns or 'title' not in df.columns:
-            print(f"  ⚠️ glossary.csv missing required columns (term_id, title)")
-            return glossary_terms
-
-        for _, row in df.iterrows():
-            term_id = str(row.get('term_id', '')).strip()
-            title = str(row.get('title', '')).strip()
-
-            if term_id and title:
-                glossary_terms[term_id] = title
+        # Only two columns are needed, so read rows with the csv module
+        # rather than building a DataFrame and iterating it
+        with open(csv_path, 'r', newline='', encoding='utf-8-sig') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+
+            # Normalize column names (lowercase + bilingual mapping)
+            columns = {}
+            for index, col in enumerate(header):
+                col = col.lower().strip()
+                english = COLUMN_NAME_MAPPING.get(col)
+                if english is not None:
+                    print(f"  [INFO] Normalized column '{col}' -> '{english}'")
+                    col = english
+                columns[col] = index
+
+            if 'term_id' not in columns or 'title' not in columns:
+                print(f"  ⚠️ glossary.csv missing required columns (term_id, title)")
+                return glossary_terms
+
+            term_id_index = columns['term_id']
+            title_index = columns['title']
+            for row in reader:
+                if len(row) <= max(term_id_index, title_index):
+                    continue
+                term_id = row[term_id_index].strip()
+                title = row[title_index].strip()
+
+                if term_id and title:
+                    glossary_terms[term_id] = title
 
     except Exception as e:
         print(f"  ⚠️ Could not load glossary.csv: {e}")
@@ -97,15 +124,14 @@ def load_glossary_from_markdown(glossary_dir):
                 content = f.read()
 
             # Parse frontmatter
-            frontmatter_pattern = r'^---\s*\n(.*?)\n---\s*\n'
-            match = re.match(frontmatter_pattern, content, re.DOTALL)
+            match = _FRONTMATTER_RE.match(content)
 
             if match:
                 frontmatter_text = match.group(1)
 
                 # Extract term_id and title
-                term_id_match = re.search(r'term_id:\s*(\S+)', frontmatter_text)
-                title_match = re.search(r'title:\s*["\']?(.*?)["\']?\s*$', frontmatter_text, re.MULTILINE)
+                term_id_match = _TERM_ID_RE.search(frontmatter_text)
+                title_match = _TITLE_RE.search(frontmatter_text)
 
                 if term_id_match and title_match:
                     term_id = term_id_match.group(1)
@@ -160,9 +186,9 @@ def process_glossary_links(text, glossary_terms, warnings_list=None, step_num=No
     if not text or not glossary_terms:
         return text
 
-    # Pattern: [[display|term]] or [[term]] with flexible spacing
-    # Captures: (optional_display) | (term_id)
-    pattern = r'\[\[\s*([^|\]]+?)(?:\s*\|\s*([^|\]]+?))?\s*\]\]'
+    # Most layers contain no glossary markup; skip the regex for them
+    if '[[' not in text:
+        return text
 
     def replace_glossary_link(match):
         # If pipe is present: [[term|display]], else [[term]]
@@ -181,8 +207,8 @@ def process_glossary_links(text, glossary_terms, warnings_list=None, step_num=No
             # constructs the URL dynamically from the current page URL, which correctly
             # handles baseurl for all deployment scenarios (GitHub Pages, subpaths, etc.)
             # Add data-demo attribute for demo terms (prefixed with demo-)
-            demo_attr = ' data-demo="true"' if term_id.startswith('demo-') else ''
-            return f'<a href="#" class="glossary-inline-link" data-term-id="{term_id}"{demo_attr}>{display_text}</a>'
+            template = _DEMO_LINK_TEMPLATE if term_id.startswith('demo-') else _LINK_TEMPLATE
+            return template % (term_id, display_text)
         else:
             # Invalid term - create error indicator
             if warnings_list is not None:
@@ -198,4 +224,4 @@ def process_glossary_links(text, glossary_terms, warnings_list=None, step_num=No
                 })
             return f'<span class="glossary-link-error" data-term-id="{term_id}">\u26a0\ufe0f [[{match.group(1)}]]</span>'
 
-    return re.sub(pattern, replace_glossary_link, text)
+    return _GLOSSARY_LINK_RE.sub(replace_glossary_link, text)
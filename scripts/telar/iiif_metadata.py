@@ -20,7 +20,8 @@ it tries the site's configured language first, then English, then the
 
 Metadata fields are found by `find_metadata_field()`, which searches the
 manifest's `metadata` array for entries whose `label` matches any of a
-list of search terms (case-insensitive). For example, the creator field
+list of search terms (case-insensitive). Labels are normalised once per
+manifest by `build_label_index()` and shared by all the lookups. For example, the creator field
 is searched with terms like "Creator", "Artist", "Author", "Maker", etc.,
 because different institutions label the same concept differently.
 
@@ -39,13 +40,43 @@ Helper functions `strip_html_tags()` and `clean_metadata_value()` sanitize
 extracted text by removing HTML markup, decoding entities, and normalizing
 whitespace. Many IIIF manifests contain HTML-formatted metadata.
 
+Fetching manifests is by far the slowest part of a build, so manifests that
+were fetched and parsed are kept in `.telar_cache/iiif/` (one file per URL, named by its
+SHA-1) and reused for a day. `read_cached_manifest()` and
+`cache_manifest()` manage the cache; deleting the directory forces fresh
+fetches.
+
 Version: v0.8.0-beta
 """
 
 import re
 import html
-import json
+import time
+import hashlib
 import urllib.request
+from pathlib import Path
+
+from telar.json_io import parse_json
+
+# On-disk cache of validated manifests, keyed by URL
+MANIFEST_CACHE_DIR = Path('.telar_cache/iiif')
+MANIFEST_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# Used by strip_html_tags() for every metadata value
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Phrases that mark attribution text as legal boilerplate
+_BOILERPLATE_INDICATORS = (
+    'for information on use',
+    'rights and permissions',
+    'http://',
+    'https://',
+    'licensed under',
+    'license',
+    'see library',
+    'please see',
+    'for more information'
+)
 
 
 def detect_iiif_version(manifest):
@@ -93,27 +124,15 @@ def extract_language_map_value(language_map, site_language='en'):
     if not isinstance(language_map, dict):
         return ''
 
-    # Try site language
-    if site_language in language_map:
-        values = language_map[site_language]
-        if isinstance(values, list) and len(values) > 0:
-            return str(values[0])
-
-    # Try English
-    if 'en' in language_map:
-        values = language_map['en']
-        if isinstance(values, list) and len(values) > 0:
-            return str(values[0])
-
-    # Try unlabeled content
-    if 'none' in language_map:
-        values = language_map['none']
-        if isinstance(values, list) and len(values) > 0:
+    # Try site language, then English, then unlabeled content
+    for lang in (site_language, 'en', 'none'):
+        values = language_map.get(lang)
+        if isinstance(values, list) and values:
             return str(values[0])
 
     # Use first available language
-    for lang, values in language_map.items():
-        if isinstance(values, list) and len(values) > 0:
+    for values in language_map.values():
+        if isinstance(values, list) and values:
             return str(values[0])
 
     return ''
@@ -135,16 +154,16 @@ def strip_html_tags(text):
 
     text = str(text)
 
-    # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
+    # Remove HTML tags (most metadata values have none)
+    if '<' in text:
+        text = _HTML_TAG_RE.sub('', text)
 
     # Decode HTML entities
-    text = html.unescape(text)
+    if '&' in text:
+        text = html.unescape(text)
 
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-
-    return text
+    # Remove extra whitespace (split/join collapses runs and trims in one pass)
+    return ' '.join(text.split())
 
 
 def clean_metadata_value(value):
@@ -177,22 +196,25 @@ def clean_metadata_value(value):
     return value
 
 
-def find_metadata_field(metadata_array, search_terms, version='2.0', site_language='en'):
+def build_label_index(metadata_array, version='2.0', site_language='en'):
     """
-    Search metadata array for matching field using fuzzy label matching.
+    Normalise the labels of a metadata array once, for find_metadata_field().
+
+    Extraction looks up several fields in the same manifest; with an index,
+    each label's language map is resolved and lowercased only once.
 
     Args:
         metadata_array: List of {label, value} entries
-        search_terms: List of possible label names (case-insensitive)
         version: '2.0' or '3.0'
         site_language: Preferred language for v3.0 extraction
 
     Returns:
-        str: Extracted value or empty string
+        list: (lowercased label, entry) tuples in metadata order
     """
     if not metadata_array or not isinstance(metadata_array, list):
-        return ''
+        return []
 
+    label_index = []
     for entry in metadata_array:
         if not isinstance(entry, dict):
             continue
@@ -204,10 +226,38 @@ def find_metadata_field(metadata_array, search_terms, version='2.0', site_langua
             label = extract_language_map_value(label, site_language)
 
         # Case-insensitive search
-        label_lower = str(label).lower().strip()
+        label_index.append((str(label).lower().strip(), entry))
+
+    return label_index
+
+
+def find_metadata_field(metadata_array, search_terms, version='2.0', site_language='en',
+                        label_index=None):
+    """
+    Search metadata array for matching field using fuzzy label matching.
+
+    Args:
+        metadata_array: List of {label, value} entries
+        search_terms: List of possible label names (case-insensitive)
+        version: '2.0' or '3.0'
+        site_language: Preferred language for v3.0 extraction
+        label_index: Optional result of build_label_index() for this
+            metadata array, to reuse across several lookups
+
+    Returns:
+        str: Extracted value or empty string
+    """
+    if label_index is None:
+        label_index = build_label_index(metadata_array, version, site_language)
+    if not label_index:
+        return ''
+
+    # Lowercase the search terms once, not for every entry
+    terms_lower = [term.lower() for term in search_terms]
 
-        for term in search_terms:
-            if term.lower() in label_lower:
+    for label_lower, entry in label_index:
+        for term in terms_lower:
+            if term in label_lower:
                 value = entry.get('value', '')
 
                 # Handle v3.0 language maps
@@ -232,35 +282,25 @@ def is_legal_boilerplate(text):
     if not text:
         return False
 
-    boilerplate_indicators = [
-        'for information on use',
-        'rights and permissions',
-        'http://',
-        'https://',
-        'licensed under',
-        'license',
-        'see library',
-        'please see',
-        'for more information'
-    ]
-
     text_lower = str(text).lower()
 
-    # Check if text is mostly URL or starts with URL
-    if text_lower.startswith('http'):
+    # Check if text is mostly URL or starts with URL, or is very long
+    # (>200 chars); both are decided without scanning for indicators
+    if text_lower.startswith('http') or len(text) > 200:
         return True
 
-    # Check for multiple boilerplate indicators
-    indicator_count = sum(1 for indicator in boilerplate_indicators if indicator in text_lower)
-
-    # If text has 2+ indicators or is very long (>200 chars), likely boilerplate
-    if indicator_count >= 2 or len(text) > 200:
-        return True
+    # Check for multiple boilerplate indicators, stopping at the second
+    indicator_count = 0
+    for indicator in _BOILERPLATE_INDICATORS:
+        if indicator in text_lower:
+            indicator_count += 1
+            if indicator_count >= 2:
+                return True
 
     return False
 
 
-def extract_credit(manifest, version='2.0', site_language='en'):
+def extract_credit(manifest, version='2.0', site_language='en', label_index=None):
     """
     Extract credit/attribution with smart fallback logic.
 
@@ -273,6 +313,8 @@ def extract_credit(manifest, version='2.0', site_language='en'):
         manifest: Parsed JSON manifest dict
         version: '2.0' or '3.0'
         site_language: Preferred language
+        label_index: Optional build_label_index() result for the manifest's
+            metadata array
 
     Returns:
         str: Credit line
@@ -312,7 +354,8 @@ def extract_credit(manifest, version='2.0', site_language='en'):
             manifest.get('metadata', []),
             ['Repository', 'Holding Institution', 'Institution'],
             version,
-            site_language
+            site_language,
+            label_index
         )
         if fallback:
             credit = fallback
@@ -320,6 +363,52 @@ def extract_credit(manifest, version='2.0', site_language='en'):
     return credit
 
 
+def _manifest_cache_path(manifest_url):
+    key = hashlib.sha1(manifest_url.encode('utf-8')).hexdigest()
+    return MANIFEST_CACHE_DIR / f'{key}.json'
+
+
+def read_cached_manifest(manifest_url):
+    """
+    Return the cached manifest body for a URL, if it is fresh.
+
+    Args:
+        manifest_url: URL of IIIF manifest
+
+    Returns:
+        bytes: Raw manifest JSON, or None if not cached or older than
+            MANIFEST_CACHE_TTL
+    """
+    cache_path = _manifest_cache_path(manifest_url)
+    try:
+        if time.time() - cache_path.stat().st_mtime >= MANIFEST_CACHE_TTL:
+            return None
+        return cache_path.read_bytes()
+    except OSError:
+        return None
+
+
+def cache_manifest(manifest_url, raw):
+    """
+    Store a fetched manifest body for later builds.
+
+    Failures are ignored; the cache is only an optimisation.
+
+    Args:
+        manifest_url: URL of IIIF manifest
+        raw: Raw manifest JSON (bytes)
+    """
+    cache_path = _manifest_cache_path(manifest_url)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so readers never see a partial file
+        tmp_path = cache_path.with_suffix('.tmp')
+        tmp_path.write_bytes(raw)
+        tmp_path.replace(cache_path)
+    except OSError:
+        pass
+
+
 def extract_manifest_metadata(manifest_url, site_language='en'):
     """
     Extract all metadata fields from IIIF manifest.
@@ -335,12 +424,19 @@ def extract_manifest_metadata(manifest_url, site_language='en'):
               Returns empty dict on error
     """
     try:
-        # Fetch manifest
-        response = urllib.request.urlopen(manifest_url, timeout=10)
-        manifest = json.loads(response.read())
+        # Fetch manifest (or reuse a fresh cached copy)
+        raw = read_cached_manifest(manifest_url)
+        if raw is None:
+            with urllib.request.urlopen(manifest_url, timeout=10) as response:
+                raw = response.read()
+            manifest = parse_json(raw)
+            cache_manifest(manifest_url, raw)
+        else:
+            manifest = parse_json(raw)
 
         version = detect_iiif_version(manifest)
         metadata_array = manifest.get('metadata', [])
+        label_index = build_label_index(metadata_array, version, site_language)
 
         extracted = {}
 
@@ -374,7 +470,8 @@ def extract_manifest_metadata(manifest_url, site_language='en'):
             metadata_array,
             ['Creator', 'Artist', 'Author', 'Maker', 'Cartographer', 'Contributor', 'Painter', 'Sculptor'],
             version,
-            site_language
+            site_language,
+            label_index
         )
 
         # Period
@@ -382,7 +479,8 @@ def extract_manifest_metadata(manifest_url, site_language='en'):
             metadata_array,
             ['Date', 'Period', 'Creation Date', 'Created', 'Date Created', 'Date Note', 'Temporal'],
             version,
-            site_language
+            site_language,
+            label_index
         )
 
         # Location (Repository/Institution name, not geographic location)
@@ -390,7 +488,8 @@ def extract_manifest_metadata(manifest_url, site_language='en'):
             metadata_array,
             ['Repository', 'Holding Institution', 'Institution', 'Current Location'],
             version,
-            site_language
+            site_language,
+            label_index
         )
 
         # If location not found in metadata, try provider (v3.0)
@@ -406,7 +505,7 @@ def extract_manifest_metadata(manifest_url, site_language='en'):
                         extracted['location'] = str(label).strip()
 
         # Credit
-        extracted['credit'] = extract_credit(manifest, version, site_language)
+        extracted['credit'] = extract_credit(manifest, version, site_language, label_index)
 
         return extracted
 
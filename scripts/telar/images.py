@@ -26,24 +26,58 @@ Linux (case-sensitive). `resolve_path_case_insensitive()` tries three
 fallbacks: the exact path, then lowercase filename only, then the entire
 path lowercased. `validate_image_path()` adds a further legacy fallback
 that tries swapping the file extension case (e.g., `.jpg` to `.JPG`).
-External URLs (http/https) bypass validation entirely.
+External URLs (http/https) bypass validation entirely. Resolved paths are
+memoised for the life of the process (per working directory), since the
+same texts and images are referenced from many stories and the files do
+not change during a build; image validation first checks a single listing
+of `assets/images/` taken with `os.walk`.
 
 `get_image_dimensions()` reads image width and height, used by the
 carousel widget to calculate aspect ratios and choose an appropriate
 size class. It supports both local files (via Pillow) and remote URLs
-(fetched with urllib). Failures are silent — dimension detection is
+(fetched with urllib; only the first 64 KB is requested, which holds the
+header for practically all images). Failures are silent — dimension detection is
 a nice-to-have, not a build blocker.
 
 Version: v0.7.0-beta
 """
 
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
 import urllib.request
 import markdown
 from PIL import Image as PILImage
 from io import BytesIO
 
+# Image line with optional size, e.g. ![alt](path){md}
+_IMAGE_LINE_RE = re.compile(
+    r'^!\[([^\]]*)\]\(([^)]+)\)(?:\{(sm|small|md|medium|lg|large|full)\})?$',
+    re.IGNORECASE
+)
+
+# Image size modifier -> CSS size class suffix
+_SIZE_CLASSES = {
+    'small': 'sm', 'medium': 'md', 'large': 'lg', 'full': 'full',
+    'sm': 'sm', 'md': 'md', 'lg': 'lg'
+}
+
+# Single wrapping paragraph around rendered caption markdown
+_CAPTION_PARAGRAPH_RE = re.compile(r'^<p>(.*)</p>$')
+
+
+# One converter reused for every caption instead of markdown.markdown(),
+# which builds a new Markdown instance per call
+_CAPTION_MARKDOWN = markdown.Markdown()
+
+
+@lru_cache(maxsize=1024)
+def _caption_html(caption):
+    # Convert caption markdown to HTML (strip wrapping <p> tags)
+    caption_html = _CAPTION_MARKDOWN.reset().convert(caption)
+    return _CAPTION_PARAGRAPH_RE.sub(r'\1', caption_html.strip())
+
 
 def process_images(text):
     """
@@ -67,21 +101,19 @@ def process_images(text):
           <figcaption class="telar-image-caption">Francisco Maldonado...</figcaption>
         </figure>
     """
-    size_map = {
-        'small': 'sm', 'medium': 'md', 'large': 'lg', 'full': 'full',
-        'sm': 'sm', 'md': 'md', 'lg': 'lg'
-    }
+    # Most layers have no images at all; the text then passes through as is
+    if '![' not in text:
+        return text
 
+    # Output is written back into `lines` (lines[:out]); a caption line is
+    # consumed with its image, so out never overtakes the read position i
     lines = text.split('\n')
-    result = []
+    out = 0
     i = 0
 
-    # Pattern for image with optional size
-    img_pattern = r'^!\[([^\]]*)\]\(([^)]+)\)(?:\{(sm|small|md|medium|lg|large|full)\})?$'
-
     while i < len(lines):
         line = lines[i]
-        match = re.match(img_pattern, line.strip(), re.IGNORECASE)
+        match = _IMAGE_LINE_RE.match(line.strip()) if '![' in line else None
 
         if match:
             alt = match.group(1)
@@ -90,7 +122,7 @@ def process_images(text):
 
             # Determine size class
             if size_input:
-                size_class = size_map.get(size_input.lower(), 'md')
+                size_class = _SIZE_CLASSES.get(size_input.lower(), 'md')
                 class_attr = f' class="img-{size_class}"'
             else:
                 class_attr = ''
@@ -114,20 +146,20 @@ def process_images(text):
             # Build HTML
             img_tag = f'<img src="{src}" alt="{alt}"{class_attr}>'
             if caption:
-                # Convert caption markdown to HTML (strip wrapping <p> tags)
-                caption_html = markdown.markdown(caption)
-                caption_html = re.sub(r'^<p>(.*)</p>$', r'\1', caption_html.strip())
+                caption_html = _caption_html(caption)
                 html = f'<figure class="telar-image-figure">{img_tag}<figcaption class="telar-image-caption">{caption_html}</figcaption></figure>'
             else:
                 html = f'<figure class="telar-image-figure">{img_tag}</figure>'
 
-            result.append(html)
+            lines[out] = html
         else:
-            result.append(line)
+            lines[out] = line
 
+        out += 1
         i += 1
 
-    return '\n'.join(result)
+    del lines[out:]
+    return '\n'.join(lines)
 
 
 def resolve_path_case_insensitive(base_dir, relative_path):
@@ -148,6 +180,12 @@ def resolve_path_case_insensitive(base_dir, relative_path):
     Returns:
         Path object if found, None otherwise
     """
+    # Keyed by working directory too, as base_dir is usually relative
+    return _resolve_path_cached(os.getcwd(), base_dir, relative_path)
+
+
+@lru_cache(maxsize=4096)
+def _resolve_path_cached(cwd, base_dir, relative_path):
     full_path = Path(base_dir) / relative_path
 
     # 1. Try exact path
@@ -167,6 +205,24 @@ def resolve_path_case_insensitive(base_dir, relative_path):
     return None
 
 
+@lru_cache(maxsize=None)
+def _image_index(images_dir):
+    """
+    List every file under an images directory once per process.
+
+    Args:
+        images_dir: Absolute path of the images directory
+
+    Returns:
+        frozenset of absolute file paths (empty if the directory is missing)
+    """
+    return frozenset(
+        os.path.join(root, name)
+        for root, _dirs, files in os.walk(images_dir)
+        for name in files
+    )
+
+
 def validate_image_path(image_path, file_context):
     """
     Validate that an image exists at the expected path with case-insensitive fallback.
@@ -186,6 +242,26 @@ def validate_image_path(image_path, file_context):
     if image_path.startswith('http://') or image_path.startswith('https://'):
         return (True, image_path)
 
+    # Look up the same candidates as the fallbacks below (exact, lowercase
+    # filename, lowercase path, extension case) in a one-off listing of
+    # assets/images, so images that exist cost no stat() calls
+    full_path = Path('assets/images') / image_path
+    candidates = [
+        full_path,
+        full_path.parent / full_path.name.lower(),
+        Path('assets/images') / image_path.lower()
+    ]
+    if full_path.suffix:
+        candidates.append(full_path.with_suffix(full_path.suffix.upper()))
+        candidates.append(full_path.with_suffix(full_path.suffix.lower()))
+
+    image_index = _image_index(os.path.abspath('assets/images'))
+    for candidate in candidates:
+        if os.path.abspath(candidate) in image_index:
+            return (True, str(candidate))
+
+    # Not in the listing (e.g. case-insensitive filesystem or symlinked
+    # directory): check the filesystem directly
     # Use centralized case-insensitive path resolution
     resolved = resolve_path_case_insensitive('assets/images', image_path)
     if resolved:
@@ -193,7 +269,6 @@ def validate_image_path(image_path, file_context):
 
     # Legacy fallback: case-insensitive extension match only
     # e.g., if looking for image.jpg, also try image.JPG
-    full_path = Path('assets/images') / image_path
     if full_path.suffix:
         # Try with uppercase extension
         path_with_upper = full_path.with_suffix(full_path.suffix.upper())
@@ -208,6 +283,10 @@ def validate_image_path(image_path, file_context):
     return (False, str(full_path))
 
 
+# Bytes requested from remote images to read their dimensions
+_IMAGE_HEADER_BYTES = 64 * 1024
+
+
 def get_image_dimensions(image_path):
     """
     Get dimensions of an image (local or remote).
@@ -220,15 +299,34 @@ def get_image_dimensions(image_path):
     """
     try:
         if image_path.startswith('http://') or image_path.startswith('https://'):
-            # Fetch remote image
+            # Fetch only the start of the remote image; the header that
+            # holds the dimensions is almost always in the first few KB
             request = urllib.request.Request(
                 image_path,
-                headers={'User-Agent': 'Telar/1.0'}
+                headers={'User-Agent': 'Telar/1.0', 'Range': f'bytes=0-{_IMAGE_HEADER_BYTES - 1}'}
             )
             with urllib.request.urlopen(request, timeout=10) as response:
-                image_data = response.read()
-                img = PILImage.open(BytesIO(image_data))
-                return img.size  # Returns (width, height)
+                image_data = response.read(_IMAGE_HEADER_BYTES)
+                try:
+                    return PILImage.open(BytesIO(image_data)).size  # Returns (width, height)
+                except Exception:
+                    if response.status == 200:
+                        # Server ignored the Range header: read the rest of the image
+                        image_data += response.read()
+                    else:
+                        image_data = None
+
+            if image_data is None:
+                # Header lies beyond the requested range: fetch the whole image
+                request = urllib.request.Request(
+                    image_path,
+                    headers={'User-Agent': 'Telar/1.0'}
+                )
+                with urllib.request.urlopen(request, timeout=10) as response:
+                    image_data = response.read()
+
+            img = PILImage.open(BytesIO(image_data))
+            return img.size  # Returns (width, height)
         else:
             # Load local image
             full_path = Path('assets/images') / image_path
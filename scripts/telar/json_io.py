@@ -0,0 +1,69 @@
+"""
+JSON File Reading and Writing
+
+This module deals with reading and writing the JSON files under `_data/`
+that the build pipeline produces and then revisits: story files that get
+encrypted, `project.json` and `objects.json` that demo content is merged
+into, and the demo glossary.
+
+`read_json()` and `write_json()` use orjson when it is installed, which
+parses and serialises several times faster than the standard library and
+works on bytes directly. orjson is optional; without it both functions
+fall back to the `json` module. Either way the output is indented by two
+spaces and keeps non-ASCII characters as UTF-8, matching what the build
+has always written. `parse_json()` is the in-memory counterpart of
+`read_json()` for text the build already holds, such as fetched IIIF
+manifests.
+
+Version: v0.8.0-beta
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def parse_json(raw):
+    """
+    Parse JSON text or bytes, using orjson when it is installed.
+
+    Args:
+        raw: JSON document as str or bytes
+
+    Returns:
+        Parsed JSON data
+    """
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def read_json(path):
+    """
+    Read a JSON file, using orjson when it is installed.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed JSON data
+    """
+    with open(path, 'rb') as f:
+        return parse_json(f.read())
+
+
+def write_json(path, data):
+    """
+    Write data as indented UTF-8 JSON, using orjson when it is installed.
+
+    Args:
+        path: Path to the output JSON file
+        data: JSON-serialisable data
+    """
+    if orjson is not None:
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        encoded = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(encoded)
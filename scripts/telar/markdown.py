@@ -32,6 +32,14 @@ import markdown
 from telar.images import process_images, resolve_path_case_insensitive
 from telar.widgets import process_widgets
 
+# YAML frontmatter block followed by the body, and its title field
+_FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n(.*)$', re.DOTALL)
+_TITLE_RE = re.compile(r'title:\s*["\']?(.*?)["\']?\s*$', re.MULTILINE)
+
+# One converter per process, reset between documents, instead of building a
+# new Markdown instance (and re-registering extensions) for every call
+_MARKDOWN = markdown.Markdown(extensions=['extra', 'nl2br'])
+
 
 def read_markdown_file(file_path, widget_warnings=None):
     """
@@ -59,15 +67,14 @@ def read_markdown_file(file_path, widget_warnings=None):
             content = f.read()
 
         # Parse frontmatter
-        frontmatter_pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)$'
-        match = re.match(frontmatter_pattern, content, re.DOTALL)
+        match = _FRONTMATTER_RE.match(content)
 
         if match:
             frontmatter_text = match.group(1)
             body = match.group(2).strip()
 
             # Extract title from frontmatter
-            title_match = re.search(r'title:\s*["\']?(.*?)["\']?\s*$', frontmatter_text, re.MULTILINE)
+            title_match = _TITLE_RE.search(frontmatter_text)
             title = title_match.group(1) if title_match else ''
 
             # Process widgets BEFORE markdown conversion
@@ -77,7 +84,7 @@ def read_markdown_file(file_path, widget_warnings=None):
             body = process_images(body)
 
             # Convert markdown to HTML
-            html_content = markdown.markdown(body, extensions=['extra', 'nl2br'])
+            html_content = _MARKDOWN.reset().convert(body)
 
             return {
                 'title': title,
@@ -94,7 +101,7 @@ def read_markdown_file(file_path, widget_warnings=None):
             content_body = process_images(content_body)
 
             # Convert markdown to HTML
-            html_content = markdown.markdown(content_body, extensions=['extra', 'nl2br'])
+            html_content = _MARKDOWN.reset().convert(content_body)
             return {
                 'title': '',
                 'content': html_content
@@ -133,12 +140,11 @@ def process_inline_content(text, widget_warnings=None):
     # Check for YAML frontmatter (same pattern as read_markdown_file)
     # Only treat as frontmatter if it contains a title: key to avoid
     # false matches with horizontal rules or other --- usage
-    frontmatter_pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)$'
-    match = re.match(frontmatter_pattern, content, re.DOTALL)
+    match = _FRONTMATTER_RE.match(content)
 
     if match:
         frontmatter_text = match.group(1)
-        title_match = re.search(r'title:\s*["\']?(.*?)["\']?\s*$', frontmatter_text, re.MULTILINE)
+        title_match = _TITLE_RE.search(frontmatter_text)
         if title_match:
             title = title_match.group(1)
             content = match.group(2).strip()
@@ -151,7 +157,7 @@ def process_inline_content(text, widget_warnings=None):
     content = process_images(content)
 
     # Convert markdown to HTML (nl2br handles single line breaks)
-    html_content = markdown.markdown(content, extensions=['extra', 'nl2br'])
+    html_content = _MARKDOWN.reset().convert(content)
 
     return {
         'title': title,
@@ -22,11 +22,13 @@ steps before returning the cleaned DataFrame for JSON serialisation:
    duplicate slashes, and verifies the file exists on disk.
 
 4. **IIIF manifest validation** — for each object with a `source_url`,
-   fetches the manifest over HTTP, checks that it returns valid JSON with
-   IIIF structure (`@context`, `type`), and handles HTTP error codes
-   (404, 429, 500, etc.) with localised warning messages. A previous-build
+   fetches the manifest over HTTP (all manifests concurrently, before the
+   per-row checks), checks that it returns valid JSON with IIIF structure
+   (`@context`, `type`), and handles HTTP error codes (404, 429, 500,
+   etc.) with localised warning messages. A previous-build
    cache (`_data/objects.json`) lets the validator skip 429 rate-limiting
-   errors for manifests that haven't changed.
+   errors for manifests that haven't changed, and manifests that validated
+   are reused from `.telar_cache/iiif/` for a day instead of refetched.
 
 5. **IIIF metadata extraction** — when a manifest validates successfully,
    extracts title, description, creator, period, location, and credit
@@ -53,21 +55,65 @@ import ssl
 import random
 import urllib.request
 import urllib.error
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urlparse
 from difflib import SequenceMatcher
 
 import pandas as pd
-import yaml
 
-from telar.config import get_lang_string, load_site_language
+from telar.config import get_lang_string, load_site_language, load_yaml_cached
 from telar.csv_utils import get_source_url
+from telar.json_io import parse_json
 from telar.iiif_metadata import (
     detect_iiif_version, extract_language_map_value, strip_html_tags,
-    clean_metadata_value, find_metadata_field, extract_credit,
-    apply_metadata_fallback
+    clean_metadata_value, build_label_index, find_metadata_field, extract_credit,
+    apply_metadata_fallback, read_cached_manifest, cache_manifest
 )
 
+# Concurrent manifest requests; kept modest so a collection hosted on one
+# institutional server does not trip its rate limiting
+_MANIFEST_FETCH_WORKERS = 8
+
+
+def _load_manifest(manifest_url):
+    """
+    Get a manifest body for validation, from the cache or over HTTP.
+
+    Runs in a worker thread of process_objects(), so errors are returned
+    rather than raised.
+
+    Args:
+        manifest_url: http(s) URL of the IIIF manifest
+
+    Returns:
+        tuple: (content_type, raw body or None if the response is not JSON,
+            from_cache), or the exception raised by the request
+    """
+    # Reuse a manifest cached by an earlier build, if still fresh
+    raw = read_cached_manifest(manifest_url)
+    if raw is not None:
+        return 'application/json', raw, True
+
+    # Create SSL context that doesn't verify certificates (avoid false positives)
+    ssl_context = ssl.create_default_context()
+    ssl_context.check_hostname = False
+    ssl_context.verify_mode = ssl.CERT_NONE
+
+    try:
+        # Fetch manifest directly with GET (follows redirects automatically)
+        req = urllib.request.Request(manifest_url)
+        req.add_header('User-Agent', 'Telar/0.4.0-beta (IIIF validator)')
+
+        with urllib.request.urlopen(req, timeout=30, context=ssl_context) as response:
+            content_type = response.headers.get('Content-Type', '')
+            if 'json' not in content_type.lower():
+                return content_type, None, False
+            return content_type, response.read(), False
+
+    except Exception as e:
+        return e
+
 
 def _find_similar_image_filenames(object_id, images_dir):
     """
@@ -353,6 +399,19 @@ def process_objects(df, christmas_tree=False):
 
     # Validate source URL field (checks both source_url and iiif_manifest for backward compatibility)
     if 'source_url' in df.columns or 'iiif_manifest' in df.columns:
+        # Fetch every distinct manifest concurrently before validating rows
+        # in order, so slow servers overlap instead of adding up
+        manifest_urls = set()
+        for _, row in df.iterrows():
+            manifest_url = get_source_url(row)
+            if manifest_url and urlparse(manifest_url).scheme in ('http', 'https'):
+                manifest_urls.add(manifest_url)
+
+        manifests = {}
+        if manifest_urls:
+            with ThreadPoolExecutor(max_workers=_MANIFEST_FETCH_WORKERS) as executor:
+                manifests = dict(zip(manifest_urls, executor.map(_load_manifest, manifest_urls)))
+
         for idx, row in df.iterrows():
             manifest_url = get_source_url(row)
             object_id = row.get('object_id', 'unknown')
@@ -375,173 +434,176 @@ def process_objects(df, christmas_tree=False):
                 warnings.append(msg)
                 continue
 
-            # Try to fetch the manifest (with timeout)
-            # Create SSL context that doesn't verify certificates (avoid false positives)
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-
             try:
-                # Fetch manifest directly with GET (follows redirects automatically)
-                req = urllib.request.Request(manifest_url)
-                req.add_header('User-Agent', 'Telar/0.4.0-beta (IIIF validator)')
+                # Fetched up front; re-raise the fetch error so it is
+                # handled below as if the request had been made here
+                result = manifests[manifest_url]
+                if isinstance(result, Exception):
+                    raise result
+                content_type, raw, from_cache = result
+
+                # Check if response is JSON
+                if raw is None:
+                    df.at[idx, 'object_warning'] = get_lang_string('errors.object_warnings.iiif_not_manifest')
+                    msg = f"IIIF manifest for object {object_id} does not return JSON (Content-Type: {content_type})"
+                    print(f"  [WARN] {msg}")
+                    warnings.append(msg)
+                    # Don't clear manifest URL - might still work despite wrong content type
+                    continue
 
-                with urllib.request.urlopen(req, timeout=30, context=ssl_context) as response:
-                    content_type = response.headers.get('Content-Type', '')
+                try:
+                    data = parse_json(raw.decode('utf-8'))
 
-                    # Check if response is JSON
-                    if 'json' not in content_type.lower():
-                        df.at[idx, 'object_warning'] = get_lang_string('errors.object_warnings.iiif_not_manifest')
-                        msg = f"IIIF manifest for object {object_id} does not return JSON (Content-Type: {content_type})"
-                        print(f"  [WARN] {msg}")
-                        warnings.append(msg)
-                        # Don't clear manifest URL - might still work despite wrong content type
-                        continue
-
-                    try:
-                        data = json.loads(response.read().decode('utf-8'))
-
-                        # Check for basic IIIF structure
-                        has_context = '@context' in data
-                        has_type = 'type' in data or '@type' in data
-
-                        if not (has_context or has_type):
-                            df.at[idx, 'object_warning'] = get_lang_string('errors.object_warnings.iiif_malformed')
-                            msg = f"IIIF manifest for object {object_id} missing required fields (@context or type)"
-                            print(f"  [WARN] {msg}")
-                            warnings.append(msg)
-                        else:
-                            print(f"  [INFO] Validated IIIF manifest for object {object_id}")
-
-                            # Extract metadata from validated manifest
-                            try:
-                                site_language = load_site_language()
-                                version = detect_iiif_version(data)
-                                metadata_array = data.get('metadata', [])
-
-                                extracted = {}
-
-                                # Title
-                                if version == '2.0':
-                                    extracted['title'] = clean_metadata_value(data.get('label', ''))
-                                else:  # v3.0
-                                    label = data.get('label', {})
-                                    if isinstance(label, dict):
-                                        extracted['title'] = clean_metadata_value(
-                                            extract_language_map_value(label, site_language)
-                                        )
-                                    else:
-                                        extracted['title'] = clean_metadata_value(label)
-
-                                # Description
-                                if version == '2.0':
-                                    desc = data.get('description', '')
-                                    extracted['description'] = strip_html_tags(desc)
-                                else:  # v3.0
-                                    summary = data.get('summary', {})
-                                    if isinstance(summary, dict):
-                                        extracted['description'] = strip_html_tags(
-                                            extract_language_map_value(summary, site_language)
-                                        )
-                                    else:
-                                        extracted['description'] = strip_html_tags(summary)
-
-                                # Creator
-                                extracted['creator'] = find_metadata_field(
-                                    metadata_array,
-                                    ['Creator', 'Artist', 'Author', 'Maker', 'Cartographer', 'Contributor', 'Painter', 'Sculptor'],
-                                    version,
-                                    site_language
-                                )
-
-                                # Period
-                                extracted['period'] = find_metadata_field(
-                                    metadata_array,
-                                    ['Date', 'Period', 'Creation Date', 'Created', 'Date Created', 'Date Note', 'Temporal'],
-                                    version,
-                                    site_language
-                                )
-
-                                # Source (Repository/Institution name, not geographic location)
-                                # Note: renamed from 'location' to 'source' in v0.8.0
-                                extracted['source'] = find_metadata_field(
-                                    metadata_array,
-                                    ['Repository', 'Holding Institution', 'Institution', 'Source', 'Current Location'],
-                                    version,
-                                    site_language
-                                )
-
-                                # If source not found in metadata, try provider (v3.0)
-                                if not extracted['source'] and version == '3.0':
-                                    providers = data.get('provider', [])
-                                    if providers and isinstance(providers, list) and len(providers) > 0:
-                                        provider = providers[0]
-                                        if isinstance(provider, dict):
-                                            provider_label = provider.get('label', {})
-                                            if isinstance(provider_label, dict):
-                                                extracted['source'] = extract_language_map_value(provider_label, site_language)
-                                            else:
-                                                extracted['source'] = str(provider_label).strip()
-
-                                # Year (structured date for filtering/timeline)
-                                extracted['year'] = find_metadata_field(
-                                    metadata_array,
-                                    ['Date', 'Year', 'Date Created', 'Creation Date'],
-                                    version,
-                                    site_language
-                                )
-
-                                # Object type (classification for filtering)
-                                extracted['object_type'] = find_metadata_field(
-                                    metadata_array,
-                                    ['Type', 'Object Type', 'Resource Type', 'Format'],
-                                    version,
-                                    site_language
-                                )
-
-                                # Subjects (tags for filtering)
-                                extracted['subjects'] = find_metadata_field(
-                                    metadata_array,
-                                    ['Subject', 'Subjects', 'Keywords', 'Tags', 'Topic'],
-                                    version,
-                                    site_language
-                                )
-
-                                # Credit
-                                extracted['credit'] = extract_credit(data, version, site_language)
-
-                                # Apply fallback hierarchy (CSV > IIIF > empty)
-                                row_dict = row.to_dict()
-                                apply_metadata_fallback(row_dict, extracted)
-
-                                # Update dataframe with extracted values
-                                # Core fields that can be auto-populated from IIIF
-                                iiif_fields = ['title', 'description', 'creator', 'period', 'source', 'credit',
-                                               'year', 'object_type', 'subjects']
-                                for field in iiif_fields:
-                                    if field in row_dict:
-                                        df.at[idx, field] = row_dict[field]
-
-                                # Log if any fields were auto-populated
-                                populated_fields = []
-                                for field in iiif_fields:
-                                    csv_val = str(row.get(field, '')).strip()
-                                    final_val = str(row_dict.get(field, '')).strip()
-                                    if not csv_val and final_val:
-                                        populated_fields.append(field)
-
-                                if populated_fields:
-                                    print(f"  [INFO] Auto-populated from IIIF: {', '.join(populated_fields)}")
-
-                            except Exception as e:
-                                # Metadata extraction failed - log but don't block validation
-                                print(f"  [WARN] Could not extract metadata from IIIF manifest for {object_id}: {e}")
-
-                    except json.JSONDecodeError:
-                        df.at[idx, 'object_warning'] = get_lang_string('errors.object_warnings.iiif_not_manifest')
-                        msg = f"IIIF manifest for object {object_id} is not valid JSON"
+                    # Check for basic IIIF structure
+                    has_context = '@context' in data
+                    has_type = 'type' in data or '@type' in data
+
+                    if not (has_context or has_type):
+                        df.at[idx, 'object_warning'] = get_lang_string('errors.object_warnings.iiif_malformed')
+                        msg = f"IIIF manifest for object {object_id} missing required fields (@context or type)"
                         print(f"  [WARN] {msg}")
                         warnings.append(msg)
+                    else:
+                        print(f"  [INFO] Validated IIIF manifest for object {object_id}")
+                        if not from_cache:
+                            cache_manifest(manifest_url, raw)
+
+                        # Extract metadata from validated manifest
+                        try:
+                            site_language = load_site_language()
+                            version = detect_iiif_version(data)
+                            metadata_array = data.get('metadata', [])
+                            label_index = build_label_index(metadata_array, version, site_language)
+
+                            extracted = {}
+
+                            # Title
+                            if version == '2.0':
+                                extracted['title'] = clean_metadata_value(data.get('label', ''))
+                            else:  # v3.0
+                                label = data.get('label', {})
+                                if isinstance(label, dict):
+                                    extracted['title'] = clean_metadata_value(
+                                        extract_language_map_value(label, site_language)
+                                    )
+                                else:
+                                    extracted['title'] = clean_metadata_value(label)
+
+                            # Description
+                            if version == '2.0':
+                                desc = data.get('description', '')
+                                extracted['description'] = strip_html_tags(desc)
+                            else:  # v3.0
+                                summary = data.get('summary', {})
+                                if isinstance(summary, dict):
+                                    extracted['description'] = strip_html_tags(
+                                        extract_language_map_value(summary, site_language)
+                                    )
+                                else:
+                                    extracted['description'] = strip_html_tags(summary)
+
+                            # Creator
+                            extracted['creator'] = find_metadata_field(
+                                metadata_array,
+                                ['Creator', 'Artist', 'Author', 'Maker', 'Cartographer', 'Contributor', 'Painter', 'Sculptor'],
+                                version,
+                                site_language,
+                                label_index
+                            )
+
+                            # Period
+                            extracted['period'] = find_metadata_field(
+                                metadata_array,
+                                ['Date', 'Period', 'Creation Date', 'Created', 'Date Created', 'Date Note', 'Temporal'],
+                                version,
+                                site_language,
+                                label_index
+                            )
+
+                            # Source (Repository/Institution name, not geographic location)
+                            # Note: renamed from 'location' to 'source' in v0.8.0
+                            extracted['source'] = find_metadata_field(
+                                metadata_array,
+                                ['Repository', 'Holding Institution', 'Institution', 'Source', 'Current Location'],
+                                version,
+                                site_language,
+                                label_index
+                            )
+
+                            # If source not found in metadata, try provider (v3.0)
+                            if not extracted['source'] and version == '3.0':
+                                providers = data.get('provider', [])
+                                if providers and isinstance(providers, list) and len(providers) > 0:
+                                    provider = providers[0]
+                                    if isinstance(provider, dict):
+                                        provider_label = provider.get('label', {})
+                                        if isinstance(provider_label, dict):
+                                            extracted['source'] = extract_language_map_value(provider_label, site_language)
+                                        else:
+                                            extracted['source'] = str(provider_label).strip()
+
+                            # Year (structured date for filtering/timeline)
+                            extracted['year'] = find_metadata_field(
+                                metadata_array,
+                                ['Date', 'Year', 'Date Created', 'Creation Date'],
+                                version,
+                                site_language,
+                                label_index
+                            )
+
+                            # Object type (classification for filtering)
+                            extracted['object_type'] = find_metadata_field(
+                                metadata_array,
+                                ['Type', 'Object Type', 'Resource Type', 'Format'],
+                                version,
+                                site_language,
+                                label_index
+                            )
+
+                            # Subjects (tags for filtering)
+                            extracted['subjects'] = find_metadata_field(
+                                metadata_array,
+                                ['Subject', 'Subjects', 'Keywords', 'Tags', 'Topic'],
+                                version,
+                                site_language,
+                                label_index
+                            )
+
+                            # Credit
+                            extracted['credit'] = extract_credit(data, version, site_language, label_index)
+
+                            # Apply fallback hierarchy (CSV > IIIF > empty)
+                            row_dict = row.to_dict()
+                            apply_metadata_fallback(row_dict, extracted)
+
+                            # Update dataframe with extracted values
+                            # Core fields that can be auto-populated from IIIF
+                            iiif_fields = ['title', 'description', 'creator', 'period', 'source', 'credit',
+                                           'year', 'object_type', 'subjects']
+                            for field in iiif_fields:
+                                if field in row_dict:
+                                    df.at[idx, field] = row_dict[field]
+
+                            # Log if any fields were auto-populated
+                            populated_fields = []
+                            for field in iiif_fields:
+                                csv_val = str(row.get(field, '')).strip()
+                                final_val = str(row_dict.get(field, '')).strip()
+                                if not csv_val and final_val:
+                                    populated_fields.append(field)
+
+                            if populated_fields:
+                                print(f"  [INFO] Auto-populated from IIIF: {', '.join(populated_fields)}")
+
+                        except Exception as e:
+                            # Metadata extraction failed - log but don't block validation
+                            print(f"  [WARN] Could not extract metadata from IIIF manifest for {object_id}: {e}")
+
+                except json.JSONDecodeError:
+                    df.at[idx, 'object_warning'] = get_lang_string('errors.object_warnings.iiif_not_manifest')
+                    msg = f"IIIF manifest for object {object_id} is not valid JSON"
+                    print(f"  [WARN] {msg}")
+                    warnings.append(msg)
 
             except urllib.error.HTTPError as e:
                 # Check if we should skip this 429 error (unchanged manifest from previous build)
@@ -680,8 +742,7 @@ def _select_featured_objects(df):
     config_path = Path('_config.yml')
     if config_path.exists():
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f) or {}
+            config = load_yaml_cached(config_path) or {}
         except Exception as e:
             print(f"  [WARN] Could not read _config.yml for featured objects: {e}")
 
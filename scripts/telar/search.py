@@ -34,7 +34,7 @@ Version: v0.8.0-beta
 import json
 from pathlib import Path
 
-import yaml
+from telar.config import load_yaml_cached
 
 
 def load_config():
@@ -43,8 +43,7 @@ def load_config():
     if not config_path.exists():
         return {}
 
-    with open(config_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+    return load_yaml_cached(config_path)
 
 
 def is_browse_and_search_enabled(config):
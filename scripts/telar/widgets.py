@@ -28,7 +28,9 @@ Each widget type has its own parser:
 
 The module-level `_widget_counter` integer generates unique IDs for each
 widget instance within a build, ensuring that multiple widgets on the
-same page don't collide.
+same page don't collide. `reset_widget_counter()` restarts the numbering;
+the build calls it before each story so IDs stay stable when stories are
+converted in parallel worker processes.
 
 `parse_key_value_block()` is a simple helper that extracts `key: value`
 pairs from a text block, used by the carousel parser.
@@ -42,6 +44,7 @@ Version: v0.7.0-beta
 
 import re
 import markdown
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from jinja2 import Environment, FileSystemLoader
 from telar.images import validate_image_path, get_image_dimensions
@@ -58,6 +61,12 @@ def get_widget_id():
     return f"widget-{_widget_counter}"
 
 
+def reset_widget_counter():
+    """Restart widget IDs from widget-1 (IDs only need to be unique per page)"""
+    global _widget_counter
+    _widget_counter = 0
+
+
 def parse_key_value_block(content):
     """
     Parse key: value pairs from a text block.
@@ -144,9 +153,17 @@ def parse_carousel_widget(content, file_path, warnings_list):
         items.append(data)
 
     # Analyze aspect ratios to determine optimal carousel height
+    # (remote images are measured concurrently, as each is a request)
+    images = [item['image'] for item in items]
+    remote_count = sum(1 for image in images if image.startswith(('http://', 'https://')))
+    if remote_count > 1:
+        with ThreadPoolExecutor(max_workers=min(remote_count, 8)) as executor:
+            all_dimensions = list(executor.map(get_image_dimensions, images))
+    else:
+        all_dimensions = [get_image_dimensions(image) for image in images]
+
     aspect_ratios = []
-    for item in items:
-        dimensions = get_image_dimensions(item['image'])
+    for dimensions in all_dimensions:
         if dimensions:
             width, height = dimensions
             if width > 0:  # Avoid division by zero
@@ -29,7 +29,9 @@ Usage:
 """
 
 import os
+import subprocess
 import sys
+from datetime import datetime
 import yaml
 import argparse
 from typing import List, Optional
@@ -37,7 +39,7 @@ from typing import List, Optional
 # Add scripts directory to path for imports
 sys.path.insert(0, os.path.dirname(__file__))
 
-from migrations.base import BaseMigration
+from migrations.base import BaseMigration, FetchCache
 from migrations.v020_to_v030 import Migration020to030
 from migrations.v030_to_v031 import Migration030to031
 from migrations.v031_to_v032 import Migration031to032
@@ -123,9 +125,13 @@ def get_migration_path(from_version: str) -> List[BaseMigration]:
     """
     repo_root = os.getcwd()
     migrations_to_run = []
+    fetch_cache = FetchCache()  # One per run, shared by every migration in it
 
     for MigrationClass in MIGRATIONS:
-        migration = MigrationClass(repo_root)
+        if issubclass(MigrationClass, BaseMigration):
+            migration = MigrationClass(repo_root, fetch_cache)
+        else:
+            migration = MigrationClass(repo_root)
 
         # Check if this migration is in the upgrade path
         if migration.from_version == from_version or migrations_to_run:
@@ -296,8 +302,6 @@ def _regenerate_data_files(repo_root: str) -> bool:
     Returns:
         True if regeneration succeeded, False if scripts not found or failed
     """
-    import subprocess
-
     scripts_dir = os.path.join(repo_root, 'scripts')
     csv_to_json = os.path.join(scripts_dir, 'csv_to_json.py')
     generate_collections = os.path.join(scripts_dir, 'generate_collections.py')
@@ -424,7 +428,6 @@ def _update_config_version(repo_root: str, new_version: str, new_date: str) -> b
 
 def _get_date() -> str:
     """Get current date in YYYY-MM-DD format."""
-    from datetime import datetime
     return datetime.now().strftime('%Y-%m-%d')
 
 
@@ -443,7 +446,6 @@ def main():
 
     # Check for uncommitted changes
     if os.path.exists('.git'):
-        import subprocess
         try:
             result = subprocess.run(['git', 'status', '--porcelain'], capture_output=True, text=True)
             if result.stdout.strip() and not args.dry_run:
@@ -0,0 +1,122 @@
+"""
+Unit Tests for Story Encryption
+
+This module tests that protected stories encrypted at build time can be
+decrypted the way story-unlock.js does it in the browser: base64-decode
+salt, IV and ciphertext, derive an AES-256 key from the story key with
+PBKDF2-SHA256, and open the ciphertext with AES-GCM.
+
+A build derives the key once and shares it across protected stories, so
+every story in a build carries the same salt but its own IV.
+
+Version: v0.8.0-beta
+"""
+
+import sys
+import os
+import base64
+import json
+import pytest
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+# Add scripts directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+
+from telar.core import _encrypt_protected_stories
+from telar.encryption import PBKDF2_ITERATIONS, encrypt_story, new_story_cipher_key
+
+STORY_KEY = 'clave-secreta'
+
+STORIES = {
+    'story-a': [{'step': '1', 'question': 'What is Telar?', 'answer': 'A framework.'}],
+    'story-b': [
+        {'step': '1', 'question': '¿Qué es esta imagen?', 'answer': 'Un grabado de 1761.'},
+        {'step': '2', 'question': 'Observa la cabeza', 'answer': 'España aparece como la cabeza.'},
+    ],
+    'story-c': [{'step': '1', 'question': 'Third', 'answer': 'Story'}],
+}
+
+
+def decrypt_like_browser(story_key, encrypted):
+    """Decrypt an encrypted story following decryptStory() in story-unlock.js."""
+    salt = base64.b64decode(encrypted['salt'])
+    iv = base64.b64decode(encrypted['iv'])
+    ciphertext = base64.b64decode(encrypted['ciphertext'])
+    kdf = PBKDF2HMAC(algorithm=hashes.SHA256(), length=32, salt=salt, iterations=PBKDF2_ITERATIONS)
+    key = kdf.derive(story_key.encode('utf-8'))
+    return json.loads(AESGCM(key).decrypt(iv, ciphertext, None).decode('utf-8'))
+
+
+class TestSharedCipherKey:
+    """Tests for encrypting several stories with one derived key."""
+
+    def test_round_trip(self):
+        """Should decrypt every story back to its original steps."""
+        cipher_key = new_story_cipher_key(STORY_KEY)
+        for story_id, story_data in STORIES.items():
+            encrypted = encrypt_story(story_data, STORY_KEY, cipher_key)
+            assert encrypted['encrypted'] is True
+            assert decrypt_like_browser(STORY_KEY, encrypted) == story_data, story_id
+
+    def test_same_salt_distinct_ivs(self):
+        """Should share the build's salt but never reuse an IV."""
+        cipher_key = new_story_cipher_key(STORY_KEY)
+        encrypted = [encrypt_story(data, STORY_KEY, cipher_key) for data in STORIES.values()]
+
+        assert len({item['salt'] for item in encrypted}) == 1
+        assert base64.b64decode(encrypted[0]['salt']) == cipher_key[0]
+        assert len({item['iv'] for item in encrypted}) == len(encrypted)
+        assert all(len(base64.b64decode(item['iv'])) == 12 for item in encrypted)
+
+    def test_wrong_key_fails(self):
+        """Should not decrypt with a different story key."""
+        encrypted = encrypt_story(STORIES['story-a'], STORY_KEY, new_story_cipher_key(STORY_KEY))
+        with pytest.raises(InvalidTag):
+            decrypt_like_browser('otra-clave', encrypted)
+
+
+class TestEncryptProtectedStories:
+    """Tests for _encrypt_protected_stories across a build's stories."""
+
+    @pytest.fixture
+    def site(self, tmp_path, monkeypatch):
+        """A site with two protected stories and one public story."""
+        (tmp_path / '_config.yml').write_text(f'story_key: {STORY_KEY}\n')
+        data_dir = tmp_path / '_data'
+        data_dir.mkdir()
+        project = [{'stories': [
+            {'number': '1', 'story_id': 'story-a', 'protected': True},
+            {'number': '2', 'story_id': 'story-b', 'protected': True},
+            {'number': '3', 'story_id': 'story-c'},
+        ]}]
+        (data_dir / 'project.json').write_text(json.dumps(project))
+        for story_id, story_data in STORIES.items():
+            (data_dir / f'{story_id}.json').write_text(json.dumps(story_data, ensure_ascii=False))
+        monkeypatch.chdir(tmp_path)
+        return data_dir
+
+    def test_protected_stories_round_trip(self, site):
+        """Should encrypt each protected story so the browser can decrypt it."""
+        _encrypt_protected_stories(site)
+
+        encrypted = {story_id: json.loads((site / f'{story_id}.json').read_text())
+                     for story_id in ('story-a', 'story-b')}
+        for story_id, item in encrypted.items():
+            assert set(item) == {'encrypted', 'salt', 'iv', 'ciphertext'}
+            assert decrypt_like_browser(STORY_KEY, item) == STORIES[story_id]
+        assert encrypted['story-a']['salt'] == encrypted['story-b']['salt']
+        assert encrypted['story-a']['iv'] != encrypted['story-b']['iv']
+
+        # Public stories are left as written
+        assert json.loads((site / 'story-c.json').read_text()) == STORIES['story-c']
+
+    def test_uses_converted_text(self, site):
+        """Should encrypt this build's converted JSON instead of the file on disk."""
+        converted = {'story-a': json.dumps(STORIES['story-c'])}
+        _encrypt_protected_stories(site, converted)
+
+        item = json.loads((site / 'story-a.json').read_text())
+        assert decrypt_like_browser(STORY_KEY, item) == STORIES['story-c']
@@ -23,6 +23,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'
 from csv_to_json import (
     detect_iiif_version,
     extract_language_map_value,
+    build_label_index,
     find_metadata_field,
     is_legal_boilerplate,
 )
@@ -179,6 +180,18 @@ class TestFindMetadataField:
         ]
         assert find_metadata_field(metadata, ['creator'], '2.0') == 'Valid Artist'
 
+    def test_uses_prebuilt_label_index(self):
+        """Should give the same results from a shared label index."""
+        metadata = [
+            'not a dict',
+            {'label': {'en': ['Date Created']}, 'value': {'en': ['1850']}},
+            {'label': {'en': ['Artist']}, 'value': {'en': ['Painter Name']}},
+        ]
+        label_index = build_label_index(metadata, '3.0', 'en')
+        assert [label for label, _ in label_index] == ['date created', 'artist']
+        assert find_metadata_field(metadata, ['creator', 'artist'], '3.0', 'en', label_index) == 'Painter Name'
+        assert find_metadata_field(metadata, ['date'], '3.0', 'en', label_index) == '1850'
+
 
 class TestIsLegalBoilerplate:
     """Tests for is_legal_boilerplate function."""
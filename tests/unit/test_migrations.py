@@ -0,0 +1,422 @@
+"""
+Unit Tests for Migration Helpers
+
+This module tests the BaseMigration helpers that migrations use to edit a
+site in place, and the _config.yml update of the v0.6.1 → v0.6.2 migration
+built on them. Each test runs against a throwaway site directory.
+
+Key behavior:
+- _mutate_config reads and writes _config.yml at most once, and leaves it
+  untouched when the transform returns None
+- _fetch_bytes keeps fetched files on disk with their ETag and serves
+  them from there when GitHub answers 304 Not Modified; within a run,
+  migrations sharing a FetchCache request each file once
+- _ensure_dirs calls makedirs once per missing branch of the tree, and
+  later writes into those directories or their ancestors call it no more
+- _batch_gitignore_updates adds only missing entries, writes .gitignore
+  at most once, and never creates it
+- _update_config renames testing-features, adds missing flags, bumps the
+  version, and changes nothing more when run a second time
+- _cleanup_deprecated_glossary removes unmodified sample glossary files,
+  including CRLF checkouts, and keeps edited ones
+- The v0.8.0 _update_configuration adds collection_interface and
+  show_on_homepage in the right sections and renames the hide_* flags
+
+Version: v0.8.0-beta
+"""
+
+import sys
+import os
+import io
+import urllib.error
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+
+import migrations.base
+from migrations.base import FetchCache
+from migrations.v061_to_v062 import Migration061to062
+from migrations.v070_to_v080 import Migration070to080
+
+CONFIG_WITH_SECTION = """title: My Site
+
+telar:
+  version: "0.6.1-beta"
+  release_date: "2025-11-01"
+
+testing-features:
+  christmas_tree_mode: false
+
+theme: paisajes
+"""
+
+COLLECTION_BLOCK = """
+# Collection Interface Settings
+collection_interface:
+  browse_and_search: true # Set to false to disable filtering sidebar and search on objects page
+  show_link_on_homepage: true # Set to false to hide "View the objects" link from homepage
+  show_sample_on_homepage: false # Set to true to show a sample of objects on homepage
+  featured_count: 4 # Number of objects to show on homepage (default 4)
+
+"""
+
+SHOW_ON_HOMEPAGE = '  show_on_homepage: true # Set to false to hide stories section from homepage\n'
+
+CONFIG_WITHOUT_SECTION = """title: My Site
+
+telar:
+  version: "0.6.1-beta"
+  release_date: "2025-11-01"
+
+theme: paisajes
+"""
+
+
+@pytest.fixture
+def migration(tmp_path):
+    """A v0.6.1 → v0.6.2 migration for an empty site directory."""
+    return Migration061to062(str(tmp_path))
+
+
+def write_config(migration, content):
+    with open(os.path.join(migration.repo_root, '_config.yml'), 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def read_config(migration):
+    with open(os.path.join(migration.repo_root, '_config.yml'), encoding='utf-8') as f:
+        return f.read()
+
+
+class TestMutateConfig:
+    """Tests for BaseMigration._mutate_config."""
+
+    def test_writes_transformed_content(self, migration):
+        """Should write the transform's result and report it."""
+        write_config(migration, 'title: Old\n')
+        assert migration._mutate_config(lambda content: content.replace('Old', 'New')) is True
+        assert read_config(migration) == 'title: New\n'
+
+    def test_transform_returning_none_leaves_file(self, migration):
+        """Should not write when the transform returns None."""
+        write_config(migration, 'title: Old\n')
+        mtime = os.path.getmtime(os.path.join(migration.repo_root, '_config.yml'))
+        assert migration._mutate_config(lambda content: None) is False
+        assert read_config(migration) == 'title: Old\n'
+        assert os.path.getmtime(os.path.join(migration.repo_root, '_config.yml')) == mtime
+
+    def test_missing_config(self, migration):
+        """Should return False without calling the transform or creating the file."""
+        calls = []
+        assert migration._mutate_config(lambda content: calls.append(content)) is False
+        assert calls == []
+        assert not os.path.exists(os.path.join(migration.repo_root, '_config.yml'))
+
+
+class FakeResponse(io.BytesIO):
+    """Minimal urlopen response: a readable body with headers."""
+
+    def __init__(self, body, headers):
+        super().__init__(body)
+        self.headers = headers
+
+
+class TestFetchBytes:
+    """Tests for BaseMigration._fetch_bytes and its ETag cache."""
+
+    @pytest.fixture
+    def requests(self, tmp_path, monkeypatch):
+        """Record urlopen requests; answer 200 with an ETag, or 304 if it matches."""
+        monkeypatch.setattr(migrations.base, 'FETCH_CACHE_DIR', str(tmp_path / 'cache'))
+        seen = []
+
+        def urlopen(request, timeout=None):
+            seen.append(request)
+            if request.get_header('If-none-match') == '"v1"':
+                raise urllib.error.HTTPError(request.full_url, 304, 'Not Modified', {}, io.BytesIO())
+            return FakeResponse(b'<html>story</html>', {'ETag': '"v1"'})
+
+        monkeypatch.setattr(migrations.base.urllib.request, 'urlopen', urlopen)
+        return seen
+
+    def test_revalidates_cached_file(self, tmp_path, requests):
+        """Should send the stored ETag and reuse the cached body on a 304."""
+        path = '_layouts/etag-test.html'
+        first = Migration061to062(str(tmp_path))._fetch_bytes(path, branch='etag-test')
+        second = Migration061to062(str(tmp_path))._fetch_bytes(path, branch='etag-test')
+
+        assert first == second == b'<html>story</html>'
+        assert requests[0].full_url == (
+            'https://raw.githubusercontent.com/UCSB-AMPLab/telar/etag-test/_layouts/etag-test.html'
+        )
+        assert requests[0].get_header('If-none-match') is None
+        assert requests[1].get_header('If-none-match') == '"v1"'
+
+
+    def test_shared_fetch_cache(self, tmp_path, requests):
+        """Should request a file once across migrations sharing a FetchCache."""
+        fetch_cache = FetchCache()
+        for _ in range(2):
+            data = Migration061to062(str(tmp_path), fetch_cache)._fetch_bytes('README.md')
+            assert data == b'<html>story</html>'
+
+        assert len(requests) == 1
+        assert fetch_cache.files == {('main', 'README.md'): b'<html>story</html>'}
+
+
+class TestEnsureDirs:
+    """Tests for BaseMigration._ensure_dirs."""
+
+    def test_each_directory_once(self, migration, monkeypatch):
+        """Should skip makedirs for ancestors and for directories already made."""
+        calls = []
+        depth = [0]
+        makedirs = os.makedirs
+
+        def spy(path, exist_ok=False):
+            # os.makedirs recurses through the patched name for missing
+            # parents; count only the outermost calls
+            if not depth[0]:
+                calls.append(path)
+            depth[0] += 1
+            try:
+                makedirs(path, exist_ok=exist_ok)
+            finally:
+                depth[0] -= 1
+
+        monkeypatch.setattr(migrations.base.os, 'makedirs', spy)
+
+        migration._ensure_dirs(['assets/js/telar-story', 'assets/js', 'assets', '', '_sass'])
+        migration._write_file('assets/js/main.js', '// js\n')
+        migration._write_file('assets/style.css', '/* css */\n')
+
+        root = migration.repo_root
+        assert sorted(calls) == [os.path.join(root, '_sass'), os.path.join(root, 'assets/js/telar-story')]
+        assert os.path.isdir(os.path.join(root, 'assets', 'js', 'telar-story'))
+
+
+class TestBatchGitignoreUpdates:
+    """Tests for BaseMigration._batch_gitignore_updates."""
+
+    def gitignore_path(self, migration):
+        return os.path.join(migration.repo_root, '.gitignore')
+
+    def test_existing_entry(self, migration):
+        """Should not add or rewrite anything for entries already present."""
+        with open(self.gitignore_path(migration), 'w', encoding='utf-8') as f:
+            f.write('_site/\n\n# Generated data\n_data/search.json\n')
+        mtime = os.path.getmtime(self.gitignore_path(migration))
+
+        added = migration._batch_gitignore_updates([
+            ('# Generated data', ['_data/search.json']),
+            (None, ['_site/']),
+        ])
+
+        assert added == [False, False]
+        assert os.path.getmtime(self.gitignore_path(migration)) == mtime
+
+    def test_new_entries(self, migration):
+        """Should add entries under existing or new section comments in one write."""
+        with open(self.gitignore_path(migration), 'w', encoding='utf-8') as f:
+            f.write('_site/\n\n# Python\n__pycache__/\n')
+
+        added = migration._batch_gitignore_updates([
+            ('# Python', ['__pycache__/', '*.pyc']),
+            ('# Generated data', ['_data/search.json']),
+            (None, ['_site/']),
+        ])
+
+        assert added == [True, True, False]
+        with open(self.gitignore_path(migration), encoding='utf-8') as f:
+            assert f.read() == (
+                '_site/\n\n# Python\n*.pyc\n__pycache__/\n\n'
+                '# Generated data\n_data/search.json\n'
+            )
+
+    def test_matches_successive_single_updates(self, migration, tmp_path):
+        """Should produce the same file as one _ensure_gitignore_entries call per section."""
+        sections = [
+            ('# Python', ['*.pyc']),
+            ('# Generated data', ['_data/search.json', '_data/objects.json']),
+        ]
+        single = Migration061to062(str(tmp_path / 'single'))
+        os.makedirs(single.repo_root)
+        for site in (migration, single):
+            with open(self.gitignore_path(site), 'w', encoding='utf-8') as f:
+                f.write('_site/\n')
+
+        migration._batch_gitignore_updates(sections)
+        for section_comment, entries in sections:
+            single._ensure_gitignore_entries(entries, section_comment)
+
+        with open(self.gitignore_path(migration), encoding='utf-8') as batched, \
+                open(self.gitignore_path(single), encoding='utf-8') as successive:
+            assert batched.read() == successive.read()
+
+    def test_missing_gitignore(self, migration):
+        """Should report nothing added and not create .gitignore."""
+        added = migration._batch_gitignore_updates([('# Python', ['*.pyc']), (None, ['_site/'])])
+
+        assert added == [False, False]
+        assert not os.path.exists(self.gitignore_path(migration))
+
+
+class TestUpdateConfig:
+    """Tests for Migration061to062._update_config."""
+
+    def test_section_present(self, migration):
+        """Should rename the section, add the new flags, and bump the version."""
+        write_config(migration, CONFIG_WITH_SECTION)
+        changes = migration._update_config()
+        config = read_config(migration)
+
+        assert 'testing-features:' not in config
+        assert 'development-features:\n' in config
+        assert 'christmas_tree_mode: false' in config
+        assert 'viewer_preloading:' in config
+        assert 'hide_stories: false' in config
+        assert 'hide_collections: false' in config
+        assert 'version: "0.6.2-beta"' in config
+        assert f'release_date: "{migration._today}"' in config
+        # Flags stay inside the section, ahead of the next top-level key
+        assert config.index('hide_collections') < config.index('theme: paisajes')
+        assert "Renamed config section: testing-features → development-features" in changes
+        assert "Added hide_collections flag" in changes
+
+    def test_section_absent(self, migration):
+        """Should only bump the version when there is no feature-flags section."""
+        write_config(migration, CONFIG_WITHOUT_SECTION)
+        changes = migration._update_config()
+
+        expected = CONFIG_WITHOUT_SECTION.replace('0.6.1-beta', '0.6.2-beta')
+        expected = expected.replace('2025-11-01', migration._today)
+        assert read_config(migration) == expected
+        assert changes == [f"Updated _config.yml: version 0.6.2-beta ({migration._today})"]
+
+    def test_already_migrated(self, migration):
+        """Should leave an already migrated config unchanged."""
+        write_config(migration, CONFIG_WITH_SECTION)
+        migration._update_config()
+        migrated = read_config(migration)
+
+        changes = migration._update_config()
+
+        assert read_config(migration) == migrated
+        assert changes == [f"Updated _config.yml: version 0.6.2-beta ({migration._today})"]
+
+
+class TestCleanupDeprecatedGlossary:
+    """Tests for Migration061to062._cleanup_deprecated_glossary."""
+
+    ORIGINAL = '---\nterm_id: reduccion\ntitle: Reducción\n---\n\nA colonial settlement.\n'
+
+    @pytest.fixture
+    def glossary_dir(self, migration, monkeypatch):
+        """Serve the v0.6.1 originals without touching the network."""
+        monkeypatch.setattr(
+            migration, '_fetch_many',
+            lambda paths, branch='main', raw=False: {path: self.ORIGINAL for path in paths}
+        )
+        path = os.path.join(migration.repo_root, 'components', 'texts', 'glossary')
+        os.makedirs(path)
+        return path
+
+    def write(self, glossary_dir, name, content, newline):
+        with open(os.path.join(glossary_dir, name), 'w', encoding='utf-8', newline=newline) as f:
+            f.write(content)
+
+    def test_removes_unmodified_files(self, migration, glossary_dir):
+        """Should remove sample files matching the original, whatever their line endings."""
+        self.write(glossary_dir, 'reduccion.md', self.ORIGINAL, '\n')
+        self.write(glossary_dir, 'resguardo.md', self.ORIGINAL, '\r\n')
+
+        changes = migration._cleanup_deprecated_glossary()
+
+        assert sorted(changes) == [
+            "Removed deprecated: components/texts/glossary/reduccion.md",
+            "Removed deprecated: components/texts/glossary/resguardo.md",
+        ]
+        assert os.listdir(glossary_dir) == []
+
+    def test_keeps_modified_files(self, migration, glossary_dir):
+        """Should keep sample files the user has edited."""
+        self.write(glossary_dir, 'reduccion.md', self.ORIGINAL + 'My notes.\n', '\r\n')
+
+        changes = migration._cleanup_deprecated_glossary()
+
+        assert changes == ["Kept (user modified): components/texts/glossary/reduccion.md"]
+        assert os.listdir(glossary_dir) == ['reduccion.md']
+
+
+class TestUpdateConfiguration080:
+    """Tests for Migration070to080._update_configuration."""
+
+    @pytest.fixture
+    def migration(self, tmp_path):
+        return Migration070to080(str(tmp_path))
+
+    def test_adds_sections_and_renames_flags(self, migration):
+        """Should add both settings under their own sections and rename hide_* flags."""
+        write_config(migration, (
+            'title: x\n'
+            'story_interface:\n'
+            '  include_demo_content: false\n'
+            'development-features:\n'
+            '  hide_stories: true\n'
+            '  hide_collections: false\n'
+        ))
+        changes = migration._update_configuration()
+
+        assert read_config(migration) == (
+            'title: x\n'
+            'story_interface:\n'
+            + SHOW_ON_HOMEPAGE +
+            '  include_demo_content: false\n'
+            + COLLECTION_BLOCK +
+            'development-features:\n'
+            '  skip_stories: true # (Renamed from hide_stories)\n'
+            '  skip_collections: false # (Renamed from hide_collections)\n'
+        )
+        assert changes == [
+            "Added collection_interface section to _config.yml",
+            "Added show_on_homepage to story_interface in _config.yml",
+            "Renamed hide_stories to skip_stories in _config.yml",
+            "Renamed hide_collections to skip_collections in _config.yml",
+        ]
+
+    def test_empty_story_interface(self, migration):
+        """Should keep show_on_homepage under story_interface, ahead of the new section."""
+        # Both inserts land right after the story_interface: header line
+        write_config(migration, (
+            'title: x\n'
+            'story_interface:\n'
+            'foo: 1\n'
+            'development-features:\n'
+            '  hide_stories: true\n'
+        ))
+        migration._update_configuration()
+
+        assert read_config(migration) == (
+            'title: x\n'
+            'story_interface:\n'
+            + SHOW_ON_HOMEPAGE
+            + COLLECTION_BLOCK +
+            'foo: 1\n'
+            'development-features:\n'
+            '  skip_stories: true # (Renamed from hide_stories)\n'
+        )
+
+    def test_already_migrated(self, migration):
+        """Should not change a config that already has the v0.8.0 settings."""
+        config = (
+            'story_interface:\n'
+            + SHOW_ON_HOMEPAGE
+            + COLLECTION_BLOCK +
+            'development-features:\n'
+            '  skip_stories: false\n'
+        )
+        write_config(migration, config)
+
+        assert migration._update_configuration() == []
+        assert read_config(migration) == config
@@ -0,0 +1,103 @@
+"""
+Unit Tests for Story Conversion
+
+This module tests _convert_stories, which converts every story CSV in
+components/structures to JSON during a build. Small sites convert their
+stories in turn; sites with at least _PARALLEL_STORIES stories convert
+them in a process pool.
+
+Key behavior:
+- Both paths write byte-identical story JSON
+- Widget IDs restart at widget-1 for each story, whichever worker
+  converts it
+
+Version: v0.8.0-beta
+"""
+
+import sys
+import os
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+
+import telar.core
+from telar.core import _convert_stories
+from telar.processors.stories import process_story
+
+STORY_IDS = ['story-a', 'story-b', 'story-c', 'story-d', 'story-e']
+
+STORY_CSV = """step,object,x,y,zoom,question,answer,layer1_button,layer1_file
+1,obj-1,0.5,0.5,1,First question,First answer,More,{story_id}/layer.md
+2,obj-1,0.3,0.7,2,Second question,Second answer,More,{story_id}/layer.md
+"""
+
+LAYER_MD = """---
+title: {story_id} layer
+---
+
+Intro for {story_id}.
+
+:::tabs
+## One
+First tab
+
+## Two
+Second tab
+:::
+"""
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    """A minimal site with several stories whose layers contain widgets."""
+    (tmp_path / '_includes' / 'widgets').mkdir(parents=True)
+    (tmp_path / '_includes' / 'widgets' / 'tabs.html').write_text(
+        '<div class="tabs" id="{{ widget_id }}">'
+        '{% for tab in tabs %}<h3>{{ tab.title }}</h3>{{ tab.content_html }}{% endfor %}'
+        '</div>'
+    )
+    structures = tmp_path / 'components' / 'structures'
+    structures.mkdir(parents=True)
+    for story_id in STORY_IDS:
+        (structures / f'{story_id}.csv').write_text(STORY_CSV.format(story_id=story_id))
+        texts = tmp_path / 'components' / 'texts' / 'stories' / story_id
+        texts.mkdir(parents=True)
+        (texts / 'layer.md').write_text(LAYER_MD.format(story_id=story_id))
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def convert_all(site, out_name):
+    """Convert every story into site/out_name and return {story_id: JSON text}."""
+    out_dir = site / out_name
+    out_dir.mkdir()
+    jobs = [
+        (f'components/structures/{story_id}.csv', str(out_dir / f'{story_id}.json'), process_story, False)
+        for story_id in STORY_IDS
+    ]
+    texts = _convert_stories(jobs)
+    assert all(text is not None for text in texts)
+    return {story_id: (out_dir / f'{story_id}.json').read_text() for story_id in STORY_IDS}
+
+
+class TestConvertStories:
+    """Tests for the serial and parallel story conversion paths."""
+
+    def test_parallel_matches_serial(self, site, monkeypatch):
+        """Should write identical story JSON whether or not a pool is used."""
+        monkeypatch.setattr(telar.core, '_PARALLEL_STORIES', len(STORY_IDS) + 1)
+        serial = convert_all(site, 'serial')
+        monkeypatch.setattr(telar.core, '_PARALLEL_STORIES', 2)
+        parallel = convert_all(site, 'parallel')
+
+        assert parallel == serial
+
+    def test_widget_ids_restart_per_story(self, site, monkeypatch):
+        """Should number widgets from widget-1 in every story on both paths."""
+        for threshold, out_name in ((len(STORY_IDS) + 1, 'serial'), (2, 'parallel')):
+            monkeypatch.setattr(telar.core, '_PARALLEL_STORIES', threshold)
+            for story_id, text in convert_all(site, out_name).items():
+                assert 'id=\\"widget-1\\"' in text, story_id
+                assert 'id=\\"widget-2\\"' in text, story_id
+                assert 'widget-3' not in text, story_id